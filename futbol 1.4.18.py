@@ -1,8 +1,21 @@
+import argparse
 import pygame
 import pygame.gfxdraw
 import math
 import random
 import os
+import time
+from array import array
+from collections import OrderedDict
+
+import numpy as np
+
+from futbol_teams import TEAM_NAMES, LOGO_FILES, LOGO_FILES_PL, LOGO_FILES_DE, LOGO_FILES_IT, LOGO_FILES_SP
+from futbol_engine import (
+    FPS, FRAMES_PER_SIM_MINUTE, ARENA_RADIUS, BALL_RADIUS, GOAL_WIDTH_RADIANS, POST_RADIUS, SPEED,
+    MATCH_STATES, MatchSimulator, FreeForAllSimulator, RewindBuffer, calculate_goal_posts,
+)
+import futbol_engine
 
 # =====================================================================
 #                        1. LANGUAGE SETTINGS
@@ -30,7 +43,14 @@ LANG = {
         "LBL_COLLISION": "TOP ÇARPMA",
         "LBL_WHISTLE": "DÜDÜK",
         "LBL_MISS": "DİREK / KAÇAN",
-        "LANG_BTN": "TR"
+        "LANG_BTN": "TR",
+        "FFA": "HERKES TEK",
+        "OFF": "KAPALI",
+        "ARENA": "SAHA",
+        "ARENAS": {"circle": "DAİRE", "ellipse": "ELİPS", "stadium": "STADYUM",
+                   "hexagon": "ALTIGEN", "bumpers": "TAMPONLU"},
+        "REPLAY": "TEKRAR",
+        "PENALTIES": "PENALTILAR"
     },
     "ENG": {
         "WINDOW_TITLE": "Football Simulation",
@@ -53,7 +73,14 @@ LANG = {
         "LBL_COLLISION": "COLLISION",
         "LBL_WHISTLE": "WHISTLE",
         "LBL_MISS": "POST / MISS",
-        "LANG_BTN": "ENG"
+        "LANG_BTN": "ENG",
+        "FFA": "FREE-FOR-ALL",
+        "OFF": "OFF",
+        "ARENA": "ARENA",
+        "ARENAS": {"circle": "CIRCLE", "ellipse": "ELLIPSE", "stadium": "STADIUM",
+                   "hexagon": "HEXAGON", "bumpers": "BUMPERS"},
+        "REPLAY": "REPLAY",
+        "PENALTIES": "PENALTIES"
     }
 }
 lang_btn_rect = pygame.Rect(20, 20, 60, 40)
@@ -61,30 +88,12 @@ lang_btn_rect = pygame.Rect(20, 20, 60, 40)
 # =====================================================================
 #                        2. SCREEN & GAME CONFIGURATION
 # =====================================================================
+# Match timing, arena and physics constants live in futbol_engine.py
 WIDTH, HEIGHT = 800, 800
-FPS = 80
-FRAMES_PER_SIM_MINUTE = 26
-
-ARENA_RADIUS = 220
-BALL_RADIUS = 37
-GOAL_WIDTH_RADIANS = 0.42
-POST_RADIUS = 4
 GOAL_DEPTH = 52
 
-SPEED = 5.5
-MIN_SPEED = 4.0
-
 # =====================================================================
-#                        3. PHYSICS CONSTANTS
-# =====================================================================
-GRAVITY = 0.025
-BOUNCE_DAMPING = 0.95
-FRICTION = 0.999
-ELASTICITY = 1.01
-POST_ELASTICITY = 1.04
-
-# =====================================================================
-#                        4. BRAND & GAME COLORS
+#                        3. BRAND & GAME COLORS
 # =====================================================================
 NAVY = (0, 33, 71)          # Main brand Navy (Pitch, backgrounds)
 NAVY_LIGHT = (0, 45, 95)    # Slightly lighter Navy for pitch stripes
@@ -112,7 +121,7 @@ RED_CARD_COLOR = (250, 10, 10)
 SHADOW_COLOR = (0, 0, 0, 80)
 
 # =====================================================================
-#                        5. AUDIO & SOUNDS
+#                        4. AUDIO & SOUNDS
 # =====================================================================
 STADIUM_SOUND = "stadium2.wav"
 COLLISION_FILE = "collision1.wav"
@@ -136,243 +145,12 @@ master_vol = 1.0
 vol_settings = {"stadium": 0.45, "music": 0.5, "collision": 0.02, "whistle": 0.4, "miss": 0.4}
 
 # =====================================================================
-#                        6. TEAM DATABASE & LOGOS
+#                        5. PYGAME SETUP & SOUND INIT
 # =====================================================================
-# Team database is excluded from color overrides to maintain real team colors
-TEAMS = {
-    "GALATASARAY":    {"colors": [(169, 4, 50), (253, 185, 18)], "short": "GS"},
-    "FENERBAHÇE":     {"colors": [(255, 255, 0), (0, 0, 128)],   "short": "FB"},
-    "BEŞİKTAŞ":       {"colors": [(255, 255, 255), (10, 10, 10)],"short": "BJK"},
-    "TRABZONSPOR":    {"colors": [(128, 0, 0), (0, 191, 255)],   "short": "TS"},
-    "BAŞAKŞEHİR":     {"colors": [(255, 102, 0), (0, 0, 102)],   "short": "BFK"},
-    "KASIMPAŞA":      {"colors": [(255, 255, 255), (0, 0, 128)], "short": "KAS"},
-    "SİVASSPOR":      {"colors": [(255, 0, 0), (255, 255, 255)], "short": "SVS"},
-    "ALANYASPOR":     {"colors": [(255, 165, 0), (0, 128, 0)],   "short": "ALN"},
-    "RİZESPOR":       {"colors": [(0, 128, 0), (0, 0, 255)],     "short": "RİZ"},
-    "NOTTM FOREST":   {"colors": [(229, 30, 42), (255, 255, 255)],"short": "NFO"},
-    "ANTALYASPOR":    {"colors": [(255, 0, 0), (255, 255, 255)], "short": "ANT"},
-    "GAZİANTEP FK":   {"colors": [(200, 16, 46), (10, 10, 10)],  "short": "GFK"},
-    "KONYASPOR":      {"colors": [(0, 128, 0), (255, 255, 255)], "short": "KON"},
-    "KAYSERİSPOR":    {"colors": [(255, 204, 0), (255, 0, 0)],   "short": "KAY"},
-    "BODRUM FK":      {"colors": [(0, 128, 0), (255, 255, 255)], "short": "BOD"},
-    "EYÜPSPOR":       {"colors": [(230, 230, 250), (255, 215, 0)],"short": "EYP"},
-    "GÖZTEPE":        {"colors": [(255, 215, 0), (255, 0, 0)],   "short": "GÖZ"},
-    "SAMSUNSPOR":     {"colors": [(255, 0, 0), (255, 255, 255)], "short": "SAM"},
-    "KOCAELİSPOR":    {"colors": [(0, 128, 0), (10, 10, 10)],   "short": "KOC"},
-    "KARAGÜMRÜK":     {"colors": [(255, 0, 0), (10, 10, 10)],    "short": "FKG"},
-    "GENÇLERBİRLİĞİ": {"colors": [(200, 16, 46), (10, 10, 10)],  "short": "GEN"},
-    "HATAYSPOR":      {"colors": [(128, 0, 0), (255, 255, 255)], "short": "HAT"},
-    "ADANA DEMİR":    {"colors": [(0, 0, 255), (173, 216, 230)], "short": "ADS"},
-    "MAN CITY":       {"colors": [(108, 171, 221), (255, 255, 255)],"short": "MC"},
-    "LIVERPOOL":      {"colors": [(200, 16, 46), (255, 255, 255)],  "short": "LIV"},
-    "ARSENAL":        {"colors": [(239, 1, 7), (255, 255, 255)],    "short": "ARS"},
-    "ASTON VILLA":    {"colors": [(103, 14, 54), (149, 191, 229)],  "short": "AVL"},
-    "TOTTENHAM":      {"colors": [(255, 255, 255), (19, 34, 87)],   "short": "TOT"},
-    "MAN UTD":        {"colors": [(218, 41, 28), (255, 255, 255)],  "short": "MUN"},
-    "CHELSEA":        {"colors": [(3, 70, 148), (255, 255, 255)],   "short": "CHE"},
-    "REAL MADRID":    {"colors": [(255, 255, 255), (255, 215, 0)],"short": "RMA"},
-    "BARCELONA":      {"colors": [(0, 77, 152), (165, 0, 68)],    "short": "BAR"},
-    "ATLETICO":       {"colors": [(203, 53, 36), (255, 255, 255)],"short": "ATM"},
-    "GIRONA":         {"colors": [(200, 16, 46), (255, 255, 255)],"short": "GIR"},
-    "B. MUNIH":       {"colors": [(220, 5, 45), (255, 255, 255)], "short": "BAY"},
-    "DORTMUND":       {"colors": [(253, 225, 0), (10, 10, 10)],   "short": "BVB"},
-    "LEVERKUSEN":     {"colors": [(10, 10, 10), (227, 34, 25)],   "short": "B04"},
-    "RB LEIPZIG":     {"colors": [(255, 255, 255), (221, 5, 43)], "short": "RBL"},
-    "CLUB BRUGGE":    {"colors": [(0, 0, 0), (0, 116, 217)],      "short": "CLB"},
-    "NEWCASTLE":      {"colors": [(0, 0, 0), (255, 255, 255)],    "short": "NEW"},
-    "QARABAG":        {"colors": [(0, 0, 128), (227, 141, 26)],   "short": "QFK"},
-    "OLYMPIACOS":     {"colors": [(255, 255, 255), (221, 0, 0)],  "short": "OLY"},
-    "BODO/GLIMT":     {"colors": [(255, 220, 0), (0, 0, 0)],      "short": "BOD"},
-    "INTER":          {"colors": [(0, 102, 187), (10, 10, 10)],   "short": "INT"},
-    "MILAN":          {"colors": [(251, 9, 11), (10, 10, 10)],    "short": "MIL"},
-    "JUVENTUS":       {"colors": [(255, 255, 255), (10, 10, 10)], "short": "JUV"},
-    "ATALANTA":       {"colors": [(30, 113, 184), (10, 10, 10)],  "short": "ATA"},
-    "ROMA":           {"colors": [(134, 38, 51), (240, 188, 66)], "short": "ROM"},
-    "LAZIO":          {"colors": [(135, 206, 235), (255, 255, 255)],"short": "LAZ"},
-    "PSG":            {"colors": [(0, 65, 112), (218, 41, 28)],   "short": "PSG"},
-    "LILLE":          {"colors": [(238, 36, 54), (0, 51, 102)],   "short": "LIL"},
-    "MONACO":         {"colors": [(255, 0, 0), (255, 255, 255)],  "short": "ASM"},
-    "BENFICA":        {"colors": [(232, 48, 48), (255, 255, 255)],"short": "SLB"},
-    "SPORTING":       {"colors": [(0, 128, 0), (255, 255, 255)],  "short": "SCP"},
-    "PORTO":          {"colors": [(0, 0, 255), (255, 255, 255)],  "short": "POR"},
-    "AJAX":           {"colors": [(255, 255, 255), (210, 18, 46)],"short": "AJX"},
-    "PSV":            {"colors": [(255, 0, 0), (255, 255, 255)],  "short": "PSV"},
-    "FEYENOORD":      {"colors": [(255, 255, 255), (255, 0, 0)],  "short": "FEY"},
-    "PANATHINAIKOS":  {"colors": [(0, 123, 58), (255, 255, 255)], "short": "PAO"},
-    "VIKTORIA PLZEN": {"colors": [(237, 27, 36), (0, 77, 152)],   "short": "PLZ"},
-    "DINAMO ZAGREB":  {"colors": [(0, 51, 153), (255, 255, 255)], "short": "DZG"},
-    "GENK":           {"colors": [(0, 71, 156), (255, 255, 255)], "short": "GNK"},
-    "BRANN":          {"colors": [(226, 0, 26), (255, 255, 255)], "short": "BRA"},
-    "BOLOGNA":        {"colors": [(158, 27, 50), (26, 35, 66)],   "short": "BOL"},
-    "PAOK":           {"colors": [(0, 0, 0), (255, 255, 255)],    "short": "PAOK"},
-    "CELTA VIGO":     {"colors": [(138, 195, 238), (255, 255, 255)],"short": "CEL"},
-    "LUDOGORETS":     {"colors": [(13, 104, 56), (255, 255, 255)],"short": "LUD"},
-    "FERENCVAROS":    {"colors": [(28, 127, 55), (255, 255, 255)],"short": "FER"},
-    "CRVENA ZVEZDA":  {"colors": [(208, 16, 35), (255, 255, 255)],"short": "CZV"},
-    "CELTIC":         {"colors": [(0, 128, 0), (255, 255, 255)],  "short": "CLT"},
-    "STUTTGART":      {"colors": [(255, 255, 255), (227, 34, 25)],"short": "VFB"},
-    "AUGSBURG":       {"colors": [(255, 255, 255), (186, 32, 38)], "short": "AUG"},
-    "FRANKFURT":      {"colors": [(0, 0, 0), (227, 34, 25)],       "short": "FRA"},
-    "FREIBURG":       {"colors": [(218, 41, 28), (255, 255, 255)], "short": "FRE"},
-    "HAMBURG":        {"colors": [(0, 85, 164), (255, 255, 255)],  "short": "HSV"},
-    "HEIDENHEIM":     {"colors": [(227, 34, 25), (0, 51, 160)],    "short": "HEI"},
-    "HOFFENHEIM":     {"colors": [(0, 92, 169), (255, 255, 255)],  "short": "HOF"},
-    "KÖLN":           {"colors": [(227, 34, 25), (255, 255, 255)], "short": "KÖL"},
-    "MAINZ 05":       {"colors": [(237, 28, 36), (255, 255, 255)], "short": "MAI"},
-    "M. GLADBACH":    {"colors": [(0, 0, 0), (255, 255, 255)],     "short": "BMG"},
-    "ST. PAULI":      {"colors": [(105, 57, 4), (255, 255, 255)],  "short": "STP"},
-    "UNION BERLIN":   {"colors": [(218, 41, 28), (255, 255, 255)], "short": "UNB"},
-    "WERDER BREMEN":  {"colors": [(29, 162, 83), (255, 255, 255)], "short": "WER"},
-    "WOLFSBURG":      {"colors": [(98, 179, 48), (255, 255, 255)], "short": "WOB"},
-    "BOURNEMOUTH":    {"colors": [(200, 16, 46), (0, 0, 0)],        "short": "BOU"},
-    "BRENTFORD":      {"colors": [(227, 6, 19), (255, 255, 255)],   "short": "BRE"},
-    "BRIGHTON":       {"colors": [(0, 87, 184), (255, 255, 255)],   "short": "BHA"},
-    "BURNLEY":        {"colors": [(108, 29, 69), (153, 214, 234)],  "short": "BUR"},
-    "EVERTON":        {"colors": [(0, 51, 153), (255, 255, 255)],   "short": "EVE"},
-    "FULHAM":         {"colors": [(255, 255, 255), (0, 0, 0)],      "short": "FUL"},
-    "LEEDS UTD":      {"colors": [(255, 255, 255), (29, 66, 138)],  "short": "LEE"},
-    "CRYSTAL PALACE": {"colors": [(27, 69, 143), (196, 18, 46)],    "short": "CRY"},
-    "SUNDERLAND":     {"colors": [(255, 0, 0), (255, 255, 255)],    "short": "SUN"},
-    "WEST HAM":       {"colors": [(122, 38, 58), (27, 177, 231)],   "short": "WHU"},
-    "WOLVES":         {"colors": [(253, 185, 19), (0, 0, 0)],       "short": "WOL"},
-    "CAGLIARI":       {"colors": [(163, 19, 51), (0, 35, 80)],     "short": "CAG"},
-    "COMO":           {"colors": [(0, 71, 169), (255, 255, 255)],  "short": "COM"},
-    "CREMONESE":      {"colors": [(130, 130, 130), (227, 34, 25)], "short": "CRE"},
-    "FIORENTINA":     {"colors": [(72, 46, 146), (255, 255, 255)], "short": "FIO"},
-    "GENOA":          {"colors": [(166, 28, 49), (0, 36, 81)],     "short": "GNO"},
-    "LECCE":          {"colors": [(255, 217, 0), (227, 34, 25)],   "short": "LEC"},
-    "NAPOLI":         {"colors": [(18, 160, 215), (255, 255, 255)],"short": "NAP"},
-    "PARMA":          {"colors": [(255, 204, 0), (0, 51, 153)],    "short": "PAR"},
-    "PISA":           {"colors": [(0, 0, 0), (0, 84, 166)],        "short": "PIS"},
-    "SASSUOLO":       {"colors": [(0, 160, 90), (0, 0, 0)],        "short": "SAS"},
-    "TORINO":         {"colors": [(138, 30, 50), (255, 255, 255)], "short": "TOR"},
-    "UDINESE":        {"colors": [(0, 0, 0), (255, 255, 255)],     "short": "UDI"},
-    "VERONA":         {"colors": [(0, 51, 102), (255, 204, 0)],    "short": "VER"},
-    # --- LA LIGA (NEW) ---
-    "ATHLETIC CLUB":  {"colors": [(237, 28, 36), (255, 255, 255)], "short": "ATH"},
-    "REAL SOCIEDAD":  {"colors": [(0, 103, 177), (255, 255, 255)], "short": "RSO"},
-    "VILLARREAL":     {"colors": [(255, 230, 0), (0, 0, 102)],     "short": "VIL"},
-    "VALENCIA":       {"colors": [(255, 255, 255), (0, 0, 0)],     "short": "VAL"},
-    "SEVILLA":        {"colors": [(255, 255, 255), (218, 41, 28)], "short": "SEV"},
-    "REAL BETIS":     {"colors": [(0, 148, 72), (255, 255, 255)],  "short": "BET"},
-    "OSASUNA":        {"colors": [(193, 29, 39), (0, 27, 73)],     "short": "OSA"},
-    "MALLORCA":       {"colors": [(226, 0, 26), (0, 0, 0)],        "short": "MLL"},
-    "ALAVES":         {"colors": [(0, 68, 148), (255, 255, 255)],  "short": "ALA"},
-    "RAYO VALLECANO": {"colors": [(255, 255, 255), (227, 6, 19)],  "short": "RAY"},
-    "GETAFE":         {"colors": [(0, 75, 151), (255, 255, 255)],  "short": "GET"},
-    "ESPANYOL":       {"colors": [(0, 122, 195), (255, 255, 255)], "short": "ESP"},
-    "ELCHE":          {"colors": [(0, 100, 0), (255, 255, 255)],   "short": "ELC"},
-    "OVIEDO":         {"colors": [(0, 51, 160), (255, 255, 255)],  "short": "OVI"},
-    "LEVANTE":        {"colors": [(0, 51, 102), (153, 0, 51)],     "short": "LEV"},
-
-    # --- LIGUE 1 (NEW) ---
-    "MARSEILLE":      {"colors": [(255, 255, 255), (0, 150, 214)], "short": "OM"},
-    "LYON":           {"colors": [(255, 255, 255), (218, 41, 28)], "short": "OL"},
-    "LENS":           {"colors": [(237, 28, 36), (255, 215, 0)],   "short": "RCL"},
-    "NICE":           {"colors": [(218, 41, 28), (0, 0, 0)],       "short": "NIC"},
-    "RENNES":         {"colors": [(227, 34, 25), (0, 0, 0)],       "short": "REN"},
-    "STRASBOURG":     {"colors": [(0, 82, 159), (255, 255, 255)],  "short": "STR"},
-    "REIMS":          {"colors": [(226, 0, 26), (255, 255, 255)],  "short": "SDR"},
-    "TOULOUSE":       {"colors": [(92, 45, 145), (255, 255, 255)], "short": "TFC"},
-    "NANTES":         {"colors": [(253, 233, 34), (0, 100, 50)],   "short": "FCN"},
-    "MONTPELLIER":    {"colors": [(0, 35, 96), (243, 108, 33)],    "short": "MHS"},
-    "ANGERS":         {"colors": [(0, 0, 0), (255, 255, 255)],     "short": "SCO"},
-    "BREST":          {"colors": [(226, 0, 26), (255, 255, 255)],  "short": "SB2"},
-    "LE HAVRE":       {"colors": [(111, 172, 222), (0, 31, 73)],   "short": "HAC"},
-    "AUXERRE":        {"colors": [(255, 255, 255), (0, 68, 148)],  "short": "AJA"},
-    "SAINT-ETIENNE":  {"colors": [(0, 102, 51), (255, 255, 255)],  "short": "ASE"},
-
-    # --- MLS (NEW) ---
-    "INTER MIAMI":    {"colors": [(244, 181, 205), (0, 0, 0)],     "short": "MIA"},
-    "LAFC":           {"colors": [(0, 0, 0), (195, 158, 109)],     "short": "LAF"},
-    "LA GALAXY":      {"colors": [(0, 36, 93), (255, 210, 0)],     "short": "LAG"},
-    "COLUMBUS CREW":  {"colors": [(255, 223, 0), (0, 0, 0)],       "short": "CCW"},
-    "FC CINCINNATI":  {"colors": [(240, 83, 35), (38, 59, 128)],   "short": "CIN"},
-    "SEATTLE SOUNDERS":{"colors": [(93, 151, 50), (0, 85, 149)],   "short": "SEA"},
-    "NEW YORK CITY FC":{"colors": [(108, 172, 228), (4, 30, 66)],  "short": "NYC"},
-    "NY RED BULLS":   {"colors": [(226, 24, 54), (255, 255, 255)], "short": "NYR"},
-    "ATLANTA UTD":    {"colors": [(128, 0, 0), (0, 0, 0)],         "short": "ATL"},
-    "PORTLAND TIMBERS":{"colors": [(0, 72, 39), (234, 170, 0)],    "short": "PTL"},
-    "ORLANDO CITY":   {"colors": [(99, 52, 146), (255, 255, 255)], "short": "ORL"},
-    "HOUSTON DYNAMO": {"colors": [(255, 107, 0), (0, 0, 0)],       "short": "HOU"},
-    "REAL SALT LAKE": {"colors": [(179, 11, 34), (1, 31, 91)],     "short": "RSL"},
-    "PHILADELPHIA U.":{"colors": [(0, 45, 85), (179, 163, 105)],   "short": "PHI"},
-    "SPORTING KC":    {"colors": [(145, 176, 213), (0, 42, 92)],   "short": "SKC"},
-    "NEW ENGLAND REV":{"colors": [(226, 24, 54), (0, 43, 92)],     "short": "NER"},
-    "NASHVILLE SC":   {"colors": [(236, 232, 58), (31, 22, 70)],   "short": "NSC"},
-    "FC DALLAS":      {"colors": [(226, 24, 54), (0, 62, 126)],    "short": "DAL"},
-    "VANCOUVER WC":   {"colors": [(0, 36, 94), (255, 255, 255)],   "short": "VAN"},
-    "MINNESOTA UTD":  {"colors": [(135, 142, 144), (122, 184, 237)],"short": "MIN"},
-    "COLORADO RAPIDS":{"colors": [(134, 38, 51), (139, 171, 204)], "short": "COL"},
-    "CHARLOTTE FC":   {"colors": [(0, 133, 202), (0, 0, 0)],       "short": "CHR"},
-    "SAN JOSE EQ":    {"colors": [(0, 0, 0), (0, 81, 186)],        "short": "SJE"},
-    "AUSTIN FC":      {"colors": [(0, 180, 81), (0, 0, 0)],        "short": "AUS"},
-    "CHICAGO FIRE":   {"colors": [(255, 0, 0), (0, 42, 92)],       "short": "CHI"},
-    "D.C. UNITED":    {"colors": [(0, 0, 0), (239, 62, 66)],       "short": "DCU"},
-    "CF MONTREAL":    {"colors": [(0, 51, 160), (0, 0, 0)],        "short": "MTL"},
-    "ST. LOUIS CITY": {"colors": [(226, 24, 54), (0, 43, 92)],     "short": "STL"},
-    "TORONTO FC":     {"colors": [(227, 38, 54), (32, 42, 68)],    "short": "TFC"},
-    "SAN DIEGO FC":   {"colors": [(0, 193, 213), (0, 0, 0)],       "short": "SDF"},
-
-    # --- SAUDI PRO LEAGUE (NEW) ---
-    "AL HILAL":       {"colors": [(0, 94, 184), (255, 255, 255)],  "short": "HIL"},
-    "AL NASSR":       {"colors": [(254, 209, 65), (0, 52, 120)],   "short": "NAS"},
-    "AL AHLI":        {"colors": [(0, 166, 81), (255, 255, 255)],  "short": "AHL"},
-    "AL ITTIHAD":     {"colors": [(255, 215, 0), (0, 0, 0)],       "short": "ITT"},
-    "AL SHABAB":      {"colors": [(255, 255, 255), (0, 0, 0)],     "short": "SHA"},
-    "AL TAAWOUN":     {"colors": [(255, 215, 0), (0, 51, 153)],    "short": "TAA"},
-    "AL ETTIFAQ":     {"colors": [(0, 128, 64), (255, 255, 255)],  "short": "ETT"},
-    "DAMAC":          {"colors": [(255, 0, 0), (255, 215, 0)],     "short": "DAM"},
-    "AL FAYHA":       {"colors": [(255, 165, 0), (0, 0, 255)],     "short": "FAY"},
-    "AL FATEH":       {"colors": [(0, 100, 0), (255, 255, 255)],   "short": "FAT"},
-    "AL RIYADH":      {"colors": [(255, 0, 0), (0, 0, 0)],         "short": "RIY"},
-    "AL WEHDA":       {"colors": [(255, 0, 0), (255, 255, 255)],   "short": "WEH"},
-    "AL KHALEEJ":     {"colors": [(255, 255, 0), (0, 128, 0)],     "short": "KHA"},
-    "AL RAED":        {"colors": [(255, 0, 0), (0, 0, 0)],         "short": "RAE"},
-    "AL QADSIAH":     {"colors": [(255, 0, 0), (255, 255, 0)],     "short": "QAD"},
-    "AL OKHDOOD":     {"colors": [(0, 191, 255), (255, 255, 255)], "short": "OKH"},
-    "NEOM SC":        {"colors": [(0, 0, 139), (255, 215, 0)],     "short": "NEO"},
-    "AL KHOLOOD":     {"colors": [(255, 0, 0), (255, 255, 255)],   "short": "KHO"},
-}
-
-TEAM_NAMES = sorted(list(TEAMS.keys()))
-PLAYER_DATABASE = {}
+parser = argparse.ArgumentParser(description="Futbol")
+parser.add_argument("--replay", metavar="FILE", help="play back a replay recorded with futbol_replay.py")
+args = parser.parse_args()
 
-search_text = ""
-search_active = False
-
-def load_player_database():
-    db = {}
-    base_path = os.path.dirname(os.path.abspath(__file__))
-    file_path = os.path.join(base_path, "players.txt")
-
-    if os.path.exists(file_path):
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    if ":" in line:
-                        parts = line.split(":")
-                        t_name = parts[0].strip().upper()
-                        p_names = [p.strip() for p in parts[1].split(",")]
-                        p_names = [p for p in p_names if p]
-                        if p_names:
-                            db[t_name] = p_names
-        except Exception as e:
-            pass
-    return db
-
-PLAYER_DATABASE = load_player_database()
-
-def get_random_player_name(team_key):
-    if team_key in PLAYER_DATABASE:
-        players = PLAYER_DATABASE[team_key]
-        if players:
-            return random.choice(players)
-    return f"{LANG[current_lang]['PLAYER']} {random.randint(1, 3)}"
-
-# =====================================================================
-#                        7. PYGAME SETUP & SOUND INIT
-# =====================================================================
 pygame.init()
 pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=4096)
 pygame.mixer.set_num_channels(8)
@@ -478,7 +256,7 @@ if goal_sounds["GOAL3"]: general_pool.append(goal_sounds["GOAL3"])
 apply_volumes()
 
 # =====================================================================
-#                        8. LOGO LOADING
+#                        6. LOGO LOADING
 # =====================================================================
 TEAM_LOGOS = {}
 logo_size = BALL_RADIUS * 3 * 2
@@ -490,91 +268,6 @@ def get_safe_path(folder, filename):
     if os.path.exists(abs_path): return abs_path
     return rel_path
 
-LOGO_FILES = {
-    "GS": "gs.png", "FB": "fb.png", "BJK": "bjk.png", "TS": "ts.png",
-    "ALN": "alanya.png", "ANT": "antalyaspor.png", "BFK": "basaksehir.png",
-    "EYP": "eyup.png", "GFK": "gaziantep.png", "GEN": "genclerbirligi.png",
-    "GÖZ": "goztepe.png", "FKG": "karagumruk.png", "KAS": "kasımpasa.png",
-    "KAY": "kayseri.png", "KOC": "kocaeli.png", "KON": "konya.png",
-    "RİZ": "rize.png", "SAM": "samsun.png"
-}
-
-LOGO_FILES_PL = {
-    "ARS": "arsenal.png", "AVL": "aston.png", "BOU": "bournemouth.png",
-    "BRE": "brentford.png", "BHA": "brighton.png", "BUR": "burnley.png",
-    "CHE": "chelsea.png", "EVE": "everton.png", "FUL": "fulham.png",
-    "LEE": "leeds.png", "LIV": "liverpool.png", "MC":  "mancity.png",
-    "MUN": "manunited.png", "NEW": "newcastle.png", "NFO": "nottinghamforest.png",
-    "CRY": "palace.png", "SUN": "sunderland.png", "TOT": "tottenham.png",
-    "WHU": "west ham.png", "WOL": "wolves.png"
-}
-
-LOGO_FILES_DE = {
-    "AUG": "augsburg.png",
-    "BAY": "bayern.png",
-    "BVB": "dortmund.png",
-    "FRA": "frankfurt.png",
-    "FRE": "freiburg.png",
-    "HSV": "hamburg.png",
-    "HEI": "heidenheim.png",
-    "HOF": "hoffenheim.png",
-    "KÖL": "koln.png",
-    "RBL": "leipzig.png",
-    "B04": "leverkusen.png",
-    "MAI": "mainz.png",
-    "BMG": "monchengladbach.png",
-    "STP": "stpauli.png",
-    "VFB": "stuttgart.png",
-    "UNB": "unionberlin.png",
-    "WER": "werderbremen.png",
-    "WOB": "wolfsburg.png"
-}
-
-LOGO_FILES_IT = {
-    "ATA": "atalanta.png",
-    "BOL": "bologna.png",
-    "CAG": "cagliari.png",
-    "COM": "como.png",
-    "CRE": "cremonese.png",
-    "FIO": "fiorentina.png",
-    "GNO": "genoa.png",
-    "INT": "inter.png",
-    "JUV": "juventus.png",
-    "LAZ": "lazio.png",
-    "LEC": "lecce.png",
-    "MIL": "milan.png",
-    "NAP": "napoli.png",
-    "PAR": "parma.png",
-    "PIS": "pisa.png",
-    "ROM": "roma.png",
-    "SAS": "sassuolo.png",
-    "TOR": "torino.png",
-    "UDI": "udinese.png",
-    "VER": "verona.png"
-}
-# İSPANYOL TAKIMLARI (imagesSP klasörü)
-LOGO_FILES_SP = {
-    "ALA": "alaves.png",
-    "ATH": "athleticbilbao.png",
-    "ATM": "atleticomadrid.png",
-    "BAR": "barcelona.png",
-    "CEL": "celtavigo.png",
-    "ELC": "elche.png",
-    "ESP": "espanyol.png",
-    "GET": "getafe.png",
-    "GIR": "girona.png",
-    "LEV": "levante.png",
-    "MLL": "mallorca.png",
-    "OSA": "osasuna.png",
-    "RAY": "rayovallecano.png",
-    "BET": "realbetis.png",
-    "RMA": "realmadrid.png",
-    "OVI": "realoviedo.png",
-    "RSO": "realsociedad.png",
-    "SEV": "sevilla.png",
-    "VAL": "valencia.png",
-    "VIL": "villereal.png"
-}
 
 def load_and_format_logo(filepath, target_size, padding_factor=0.75):
     if not os.path.exists(filepath):
@@ -619,7 +312,7 @@ for team_short, filename in LOGO_FILES_SP.items():
     formatted_logo = load_and_format_logo(file_path, logo_size)
     if formatted_logo: TEAM_LOGOS[team_short] = formatted_logo
 # =====================================================================
-#                        9. FONTS & UI HELPERS
+#                        7. FONTS & UI HELPERS
 # =====================================================================
 font_score = pygame.font.SysFont("impact", 54)
 font_timer = pygame.font.SysFont("impact", 26)
@@ -669,7 +362,7 @@ def draw_text_with_outline(surface, text, font, color, x, y, align="center", out
     surface.blit(surf, rect)
 
 # =====================================================================
-#                     10. CORE DRAWING FUNCTIONS (PITCH)
+#                     8. CORE DRAWING FUNCTIONS (PITCH)
 # =====================================================================
 def draw_striped_pitch(surface, cx, cy, radius):
     pygame.draw.circle(surface, GRASS_1, (cx, cy), radius)
@@ -705,24 +398,6 @@ def draw_striped_pitch(surface, cx, cy, radius):
 
     surface.blit(draw_striped_pitch.cached_lines, (cx - radius - pad, cy - radius - pad))
 
-def calculate_goal_posts(cx, cy, radius, angle, width_rad):
-    INWARD_OFFSET = 22
-    gx = cx + math.cos(angle) * (radius - INWARD_OFFSET)
-    gy = cy + math.sin(angle) * (radius - INWARD_OFFSET)
-
-    half_width = (width_rad * radius) / 2
-    dx = math.cos(angle + math.pi/2) * half_width
-    dy = math.sin(angle + math.pi/2) * half_width
-
-    p1x = gx - dx
-    p1y = gy - dy
-    p2x = gx + dx
-    p2y = gy + dy
-
-    start_angle = angle - width_rad / 2
-    end_angle = angle + width_rad / 2
-    return (p1x, p1y), (p2x, p2y), start_angle, end_angle
-
 def draw_real_goal(surface, cx, cy, radius, angle, width_rad):
     (p1x, p1y), (p2x, p2y), start_angle, end_angle = calculate_goal_posts(cx, cy, radius, angle, width_rad)
 
@@ -796,114 +471,376 @@ def draw_real_goal(surface, cx, cy, radius, angle, width_rad):
     pygame.gfxdraw.aacircle(surface, int(p2x), int(p2y), POST_RADIUS, WHITE)
     pygame.gfxdraw.filled_circle(surface, int(p2x), int(p2y), POST_RADIUS, WHITE)
 
-def get_random_spawn(cx, cy, r_limit):
-    while True:
-        rx = random.randint(cx - 150, cx + 150)
-        ry = random.randint(cy - 200, cy + 50)
-        dist = math.hypot(rx - cx, ry - cy)
-        if dist < r_limit - BALL_RADIUS - 10:
-            return rx, ry
+# Daire dışı sahalar: çizgiler motorun sahaya ait kenar tablosundan (rim) gelir
+shaped_pitch_cache = {}
+
+def draw_shaped_pitch(surface, arena):
+    if arena not in shaped_pitch_cache:
+        outline = [arena.rim(2 * math.pi * k / 240)[:2] for k in range(240)]
+        pitch = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        pygame.draw.polygon(pitch, GRASS_1, outline)
+
+        stripe_surf = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        for i in range(0, HEIGHT, 60):
+            pygame.draw.rect(stripe_surf, GRASS_2, (0, arena.cy % 60 + i - 60, WIDTH, 30))
+        mask_surf = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        pygame.draw.polygon(mask_surf, (255, 255, 255, 255), outline)
+        stripe_surf.blit(mask_surf, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
+        pitch.blit(stripe_surf, (0, 0))
+
+        left, right = arena.rim(math.pi), arena.rim(0.0)
+        pygame.draw.line(pitch, WHITE, (left[0] + 20, arena.cy), (right[0] - 20, arena.cy), 4)
+        pygame.draw.circle(pitch, WHITE, (arena.cx, arena.cy), 50, 4)
+        pygame.draw.polygon(pitch, CREAM, outline, 6)
+        pygame.draw.aalines(pitch, CREAM, True, outline)
+
+        for bx, by, r in getattr(arena, "bumpers", []):
+            pygame.gfxdraw.filled_circle(pitch, int(bx), int(by), int(r), NAVY_DARK)
+            pygame.draw.circle(pitch, CREAM, (int(bx), int(by)), int(r), 4)
+            pygame.gfxdraw.aacircle(pitch, int(bx), int(by), int(r), CREAM)
+        shaped_pitch_cache[arena] = pitch
+    surface.blit(shaped_pitch_cache[arena], (0, 0))
+
+# Sabit arka plan (zemin, saha, çizgiler, seyirci) maç başında tek yüzeye çizilir.
+# Takımlar, saha ya da çözünürlük değişmedikçe bir sonraki maçta da kullanılır.
+background_key = None
+background_layer = None
+
+def build_background(arena, palettes, rng):
+    layer = pygame.Surface((WIDTH, HEIGHT))
+    layer.fill(NAVY_DARK)
+    if arena.shape == "circle":
+        draw_striped_pitch(layer, center_x, center_y, ARENA_RADIUS)
+    else:
+        draw_shaped_pitch(layer, arena)
+
+    # Seyirci: sahanın dışına takım renklerinden 300 nokta
+    fans = 0
+    while fans < 300:
+        cx = rng.randint(0, WIDTH)
+        cy = rng.randint(0, HEIGHT)
+        if arena.distance(cx, cy) > 10:
+            if len(palettes) == 2:
+                col = rng.choice(palettes[0]) if rng.random() < 0.5 else rng.choice(palettes[1])
+            else:
+                col = rng.choice(rng.choice(palettes))
+            pygame.draw.circle(layer, col, (cx, cy), 2)
+            fans += 1
+    return layer
 
-# =====================================================================
-#                     11. IN-GAME CLASSES (PARTICLES, BALL, CARDS)
-# =====================================================================
-class Particle:
-    def __init__(self, x, y, color):
-        self.x = x
-        self.y = y
-        self.color = color
-        angle = random.uniform(0, 2 * math.pi)
-        speed = random.uniform(1, 3)
-        self.vx = math.cos(angle) * speed
-        self.vy = math.sin(angle) * speed
-        self.life = FPS * 0.8
-        self.fade_start = FPS * 0.5
-        self.radius = random.randint(1, 3)
+def draw_shaped_goal(surface, arena, angle):
+    (p1x, p1y), (p2x, p2y) = arena.goal_posts(angle)
+    _, _, nx, ny = arena.rim(angle)
 
-    def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.life -= 1
+    b1x, b1y = p1x + nx * GOAL_DEPTH, p1y + ny * GOAL_DEPTH
+    b2x, b2y = p2x + nx * GOAL_DEPTH, p2y + ny * GOAL_DEPTH
 
-    def draw(self, surface):
-        if self.life > 0:
-            alpha = 255
-            if self.life < self.fade_start:
-                alpha = int(255 * (self.life / self.fade_start))
-            s = pygame.Surface((self.radius*2, self.radius*2), pygame.SRCALPHA)
-            pygame.gfxdraw.aacircle(s, self.radius, self.radius, self.radius, (*self.color, alpha))
-            pygame.gfxdraw.filled_circle(s, self.radius, self.radius, self.radius, (*self.color, alpha))
-            surface.blit(s, (int(self.x - self.radius), int(self.y - self.radius)))
-
-particles = []
-
-class Ball:
-    def __init__(self, x, y, color_scheme, text):
-        self.x, self.y = x, y
-        self.vx = random.choice([-SPEED, SPEED])
-        self.vy = random.choice([-SPEED, SPEED])
-        self.radius = BALL_RADIUS
-        self.color = color_scheme
-        self.text = text
-        self.mass = 1.0
-        self.nerf_timer = 0
-        self.yellow_nerf_timer = 0
-        self.speed_multiplier = 1
-        self.shadow_offset = 8
-
-        self.history = []
-        self.max_history = 20  # İzlerin kuyruğunu daha net görebilmek için kapasiteyi 20'ye çıkardık
+    steps_lr = 10
+    steps_fb = 5
 
-        # Hıza oranlanacak iz yüzeylerini (kendi takım renkleriyle) en başta hazırlıyoruz
-        self.trail_surfaces = []
-        for i in range(self.max_history):
-            ratio = i / self.max_history
-            trail_radius = int(self.radius * ratio * 0.85)
-            if trail_radius > 0:
-                surf = pygame.Surface((trail_radius * 2, trail_radius * 2), pygame.SRCALPHA)
-                alpha = int(255 * ratio * 0.6) # Maksimum opaklık %60
-                pygame.gfxdraw.aacircle(surf, trail_radius, trail_radius, trail_radius, (*self.color[0], alpha))
-                pygame.gfxdraw.filled_circle(surf, trail_radius, trail_radius, trail_radius, (*self.color[0], alpha))
-                self.trail_surfaces.append((trail_radius, surf))
-            else:
-                self.trail_surfaces.append((0, None))
+    # Ağın ön kenarı: direkler arasındaki noktalar normal boyunca duvara itilir
+    front = []
+    for i in range(steps_lr + 1):
+        ratio_lr = i / steps_lr
+        qx = p1x + (p2x - p1x) * ratio_lr
+        qy = p1y + (p2y - p1y) * ratio_lr
+        d = arena.distance(qx, qy)
+        front.append((qx - nx * d, qy - ny * d))
 
-    def move(self):
-        self.history.append((self.x, self.y))
-        if len(self.history) > self.max_history:
-            self.history.pop(0)
+    for j in range(1, steps_fb + 1):
+        ratio_fb = j / steps_fb
+        points = []
+        for i in range(steps_lr + 1):
+            ratio_lr = i / steps_lr
+            back_x = b1x + (b2x - b1x) * ratio_lr
+            back_y = b1y + (b2y - b1y) * ratio_lr
+            fx, fy = front[i]
+            points.append((fx + (back_x - fx) * ratio_fb, fy + (back_y - fy) * ratio_fb))
+        pygame.draw.aalines(surface, NET_COLOR, False, points)
 
-        self.vy += GRAVITY
+    for i in range(1, steps_lr):
+        ratio_lr = i / steps_lr
+        back_x = b1x + (b2x - b1x) * ratio_lr
+        back_y = b1y + (b2y - b1y) * ratio_lr
+        pygame.draw.aaline(surface, NET_COLOR, front[i], (back_x, back_y))
 
-        if self.nerf_timer > 0:
-            self.nerf_timer -= 1
-            self.speed_multiplier = 0.8
-        elif self.yellow_nerf_timer > 0:
-            self.yellow_nerf_timer -= 1
-            self.speed_multiplier = 0.8
-        else:
-            self.speed_multiplier = 1.0
+    pygame.draw.lines(surface, WHITE, False, [(p1x, p1y), (b1x, b1y), (b2x, b2y), (p2x, p2y)], 7)
 
-        current_friction = FRICTION
-        self.vx *= current_friction
-        self.vy *= current_friction
-        current_speed = math.hypot(self.vx, self.vy)
+    pygame.gfxdraw.aacircle(surface, int(p1x), int(p1y), POST_RADIUS, WHITE)
+    pygame.gfxdraw.filled_circle(surface, int(p1x), int(p1y), POST_RADIUS, WHITE)
+    pygame.gfxdraw.aacircle(surface, int(p2x), int(p2y), POST_RADIUS, WHITE)
+    pygame.gfxdraw.filled_circle(surface, int(p2x), int(p2y), POST_RADIUS, WHITE)
 
-        target_speed = SPEED * self.speed_multiplier
-        target_min_speed = MIN_SPEED * self.speed_multiplier
+# =====================================================================
+#                     9. IN-GAME CLASSES (PARTICLES, BALL, CARDS)
+# =====================================================================
+# Parçacıklar sabit kapasiteli bir havuzda, her alan ayrı bir NumPy dizisi.
+# Görüntüler (renk, yarıçap, opaklık basamağı) başına bir kez çizilir.
+PARTICLE_CAPACITY = 4096
+PARTICLE_LIFE = FPS * 0.8
+PARTICLE_FADE = FPS * 0.5
+PARTICLE_ALPHA_STEPS = int(PARTICLE_FADE)   # one step per fading frame, same alphas as before
+PARTICLE_MAX_RADIUS = 3
+particle_colors = {}
+particle_palette = []
+particle_sprites = {}
+
+def particle_sprite(code):
+    bucket = code % (PARTICLE_ALPHA_STEPS + 1)
+    rest = code // (PARTICLE_ALPHA_STEPS + 1)
+    color = particle_palette[rest // (PARTICLE_MAX_RADIUS + 1)]
+    radius = rest % (PARTICLE_MAX_RADIUS + 1)
+    alpha = int(255 * bucket / PARTICLE_ALPHA_STEPS)
+    s = pygame.Surface((radius*2, radius*2), pygame.SRCALPHA)
+    pygame.gfxdraw.aacircle(s, radius, radius, radius, (*color, alpha))
+    pygame.gfxdraw.filled_circle(s, radius, radius, radius, (*color, alpha))
+    particle_sprites[code] = s
+    return s
+
+class ParticlePool:
+    def __init__(self, capacity=PARTICLE_CAPACITY):
+        self.capacity = capacity
+        self.n = 0
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.vx = np.zeros(capacity)
+        self.vy = np.zeros(capacity)
+        self.life = np.zeros(capacity)
+        self.color = np.zeros(capacity, dtype=np.int32)
+        self.radius = np.zeros(capacity, dtype=np.int32)
+        self.fields = (self.x, self.y, self.vx, self.vy, self.life, self.color, self.radius)
+
+    def __len__(self):
+        return self.n
+
+    def clear(self):
+        self.n = 0
+
+    def spawn(self, x, y, color, push_x, push_y, rng=random):
+        # fx_rng is drawn from even when the pool is full, so later effects don't shift
+        angle = rng.uniform(0, 2 * math.pi)
+        speed = rng.uniform(1, 3)
+        radius = rng.randint(1, PARTICLE_MAX_RADIUS)
+        if self.n == self.capacity: return
+        if color not in particle_colors:
+            particle_colors[color] = len(particle_palette)
+            particle_palette.append(color)
+        i = self.n
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = math.cos(angle) * speed + push_x
+        self.vy[i] = math.sin(angle) * speed + push_y
+        self.life[i] = PARTICLE_LIFE
+        self.color[i] = particle_colors[color]
+        self.radius[i] = radius
+        self.n += 1
 
-        if current_speed < target_min_speed and current_speed > 0:
-            scale = target_min_speed / current_speed
-            self.vx *= scale
-            self.vy *= scale
-        elif current_speed == 0:
-            self.vx = random.choice([-1, 1]) * target_min_speed
-            self.vy = random.choice([-1, 1]) * target_min_speed
+    def update(self):
+        n = self.n
+        if n == 0: return
+        self.x[:n] += self.vx[:n]
+        self.y[:n] += self.vy[:n]
+        self.life[:n] -= 1
+        alive = self.life[:n] > 0
+        if alive.all(): return
+        # Sıkıştırma: yaşayanlar sıralarını koruyarak başa taşınır
+        keep = np.flatnonzero(alive)
+        for field in self.fields:
+            field[:len(keep)] = field[keep]
+        self.n = len(keep)
+
+    def draw(self, surface):
+        n = self.n
+        if n == 0: return
+        life, radius = self.life[:n], self.radius[:n]
+        bucket = (np.minimum(life, PARTICLE_FADE) * (PARTICLE_ALPHA_STEPS / PARTICLE_FADE)).astype(np.int32)
+        codes = ((self.color[:n] * (PARTICLE_MAX_RADIUS + 1) + radius) * (PARTICLE_ALPHA_STEPS + 1) + bucket).tolist()
+        xs = (self.x[:n] - radius).astype(np.int32).tolist()
+        ys = (self.y[:n] - radius).astype(np.int32).tolist()
+        get = particle_sprites.get
+        surface.blits([(get(c) or particle_sprite(c), (px, py)) for c, px, py in zip(codes, xs, ys)], doreturn=False)
+
+particles = ParticlePool()
+
+# Bitmiş top ve gölge görüntüleri (takım, renkler, yarıçap) başına bir kez çizilir
+ball_sprite_cache = {}
+ball_face_cache = {}
+
+# Dönen top: SPIN_FRAMES açılık atlas, kareler ilk kullanıldıklarında çizilir.
+# Dönüş duvar ve top-top temaslarındaki teğetsel hızdan gelir ve yalnızca
+# çizimde kullanılır; simülasyon onu hiç görmez.
+SPIN_FRAMES = 36
+SPIN_GRIP = 0.5            # share of the gap to rolling spin closed by one hit
+SPIN_DAMPING = 0.99        # per step
+BALL_ATLAS_LIMIT = 48      # team atlases kept, a 20-ball free-for-all uses 20
+ball_atlas_cache = OrderedDict()
+
+def sprite_key(text, colors, radius):
+    return (text, tuple(colors), radius)
+
+def get_ball_face(text, colors, radius):
+    # Stripes and logo at 3x, before the round mask; every sprite is cut from it
+    key = sprite_key(text, colors, radius)
+    if key in ball_face_cache: return ball_face_cache[key]
+
+    # Logolar BALL_RADIUS'a göre yüklenir; küçük toplar için bir kez ölçeklenir
+    logo = TEAM_LOGOS.get(text)
+    if logo and radius != BALL_RADIUS:
+        logo = pygame.transform.smoothscale(logo, (radius * 6, radius * 6))
+
+    sr = radius * 3
+    hr_surf = pygame.Surface((sr * 2, sr * 2), pygame.SRCALPHA)
+    stripe_w = (sr * 2) / 6
+    for i in range(6):
+        c = colors[0] if i % 2 == 0 else colors[1]
+        stripe_rect = pygame.Rect(i * stripe_w, 0, stripe_w + 1.5, sr * 2)
+        pygame.draw.rect(hr_surf, c, stripe_rect)
+    if logo:
+        hr_surf.blit(logo, (0, 0))
+    ball_face_cache[key] = hr_surf
+    return hr_surf
+
+def render_ball_sprite(face, radius, angle=0.0):
+    scale = 3
+    sr = radius * scale
+    if angle:
+        # Only ever called while an atlas frame is being filled in
+        turned = pygame.transform.rotate(face, -math.degrees(angle))
+        hr_surf = pygame.Surface((sr * 2, sr * 2), pygame.SRCALPHA)
+        hr_surf.blit(turned, (sr - turned.get_width() // 2, sr - turned.get_height() // 2))
+    else:
+        hr_surf = face.copy()
+
+    mask_surf = pygame.Surface((sr * 2, sr * 2), pygame.SRCALPHA)
+    pygame.draw.circle(mask_surf, (255, 255, 255), (sr, sr), sr)
+    hr_surf.blit(mask_surf, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
+
+    pygame.draw.circle(hr_surf, WHITE, (sr, sr), sr, 4 * scale)
+    return pygame.transform.smoothscale(hr_surf, (radius * 2, radius * 2))
+
+def get_ball_sprites(text, colors, radius):
+    key = sprite_key(text, colors, radius)
+    if key in ball_sprite_cache: return ball_sprite_cache[key]
+
+    ball_surf = render_ball_sprite(get_ball_face(text, colors, radius), radius)
+    shadow_surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    pygame.draw.circle(shadow_surf, SHADOW_COLOR, (radius, radius), radius - 2)
+
+    ball_sprite_cache[key] = (ball_surf, shadow_surf)
+    return ball_sprite_cache[key]
+
+def get_ball_atlas(text, colors, radius):
+    # Frame k shows the ball turned by k / SPIN_FRAMES of a turn; frame 0 is
+    # the plain sprite, the rest stay None until a ball first needs them
+    key = sprite_key(text, colors, radius)
+    if key in ball_atlas_cache:
+        ball_atlas_cache.move_to_end(key)
+        return ball_atlas_cache[key]
+    atlas = [None] * SPIN_FRAMES
+    atlas[0] = get_ball_sprites(text, colors, radius)[0]
+    ball_atlas_cache[key] = atlas
+    while len(ball_atlas_cache) > BALL_ATLAS_LIMIT:
+        ball_atlas_cache.popitem(last=False)
+    return atlas
+
+# İz: son konumlar sabit boyutlu bir halkada, iz yüzeyleri hız oranına göre
+# TRAIL_ALPHA_STEPS opaklık basamağında önceden hazırlanır
+TRAIL_ALPHA_STEPS = 32
+trail_cache = {}
+
+class Trail:
+    __slots__ = ("xs", "ys", "size", "head", "count")
+
+    def __init__(self, size):
+        self.xs = array("d", bytes(8 * size))
+        self.ys = array("d", bytes(8 * size))
+        self.size = size
+        self.head = 0       # next slot to write
+        self.count = 0
+
+    def add(self, x, y):
+        self.xs[self.head] = x
+        self.ys[self.head] = y
+        self.head = (self.head + 1) % self.size
+        if self.count < self.size: self.count += 1
+
+    def clear(self):
+        self.count = 0
+
+def get_trail_surfaces(color, radius, steps):
+    # Per trail size: (radius, full-opacity surface, alpha variants filled on first use)
+    key = (tuple(color), radius, steps)
+    if key in trail_cache: return trail_cache[key]
+    surfaces = []
+    for i in range(steps):
+        ratio = i / steps
+        trail_radius = int(radius * ratio * 0.85)
+        if trail_radius > 0:
+            surf = pygame.Surface((trail_radius * 2, trail_radius * 2), pygame.SRCALPHA)
+            alpha = int(255 * ratio * 0.6) # Maksimum opaklık %60
+            pygame.gfxdraw.aacircle(surf, trail_radius, trail_radius, trail_radius, (*color, alpha))
+            pygame.gfxdraw.filled_circle(surf, trail_radius, trail_radius, trail_radius, (*color, alpha))
+            surfaces.append((trail_radius, surf, [None] * (TRAIL_ALPHA_STEPS + 1)))
+        else:
+            surfaces.append((0, None, None))
+    trail_cache[key] = surfaces
+    return surfaces
+
+class Ball(futbol_engine.Ball):
+    def __init__(self, x, y, color_scheme, text, rng=random, radius=BALL_RADIUS):
+        super().__init__(x, y, color_scheme, text, rng, radius)
+        self.shadow_offset = 8 * radius // BALL_RADIUS
+        self.shadow = get_ball_sprites(text, color_scheme, radius)[1]
+        self.atlas = get_ball_atlas(text, color_scheme, radius)
+        self.spin = 0.0             # radians per step
+        self.spin_angle = 0.0
+        self.prev_x, self.prev_y = x, y
 
-        self.x += self.vx
-        self.y += self.vy
+        self.max_history = 20  # İzlerin kuyruğunu daha net görebilmek için kapasiteyi 20'ye çıkardık
+        self.trail = Trail(self.max_history)
+
+        # Hıza oranlanacak iz yüzeyleri (kendi takım renkleriyle) takım başına bir kez hazırlanır
+        self.trail_surfaces = get_trail_surfaces(self.color[0], self.radius, self.max_history)
+
+    def accelerate(self):
+        self.add_trail_point()
+        self.spin_angle = (self.spin_angle + self.spin) % (2 * math.pi)
+        self.spin *= SPIN_DAMPING
+        super().accelerate()
+
+    def add_spin(self, cx, cy, vx, vy):
+        # (cx, cy): unit vector to the contact point, (vx, vy): velocity
+        # against what was hit. Rolling without slipping would need
+        # (vx * cy - vy * cx) / radius; each hit closes part of the gap.
+        rolling = (vx * cy - vy * cx) / self.radius
+        self.spin += SPIN_GRIP * (rolling - self.spin)
+
+    def spin_sprite(self):
+        k = int(self.spin_angle * SPIN_FRAMES / (2 * math.pi)) % SPIN_FRAMES
+        sprite = self.atlas[k]
+        if sprite is None:
+            face = get_ball_face(self.text, self.color, self.radius)
+            sprite = self.atlas[k] = render_ball_sprite(face, self.radius, k * 2 * math.pi / SPIN_FRAMES)
+        return sprite
+
+    def place(self, x, y, vx, vy):
+        # Tekrar izlemede fizik yok; iz burada biriktirilir
+        self.add_trail_point()
+        super().place(x, y, vx, vy)
+
+    def add_trail_point(self):
+        self.trail.add(self.x, self.y)
+
+    def render_pos(self):
+        # Between the previous and the current step; jumps (goal, kick-off
+        # respawn) are drawn where the ball landed
+        if abs(self.x - self.prev_x) + abs(self.y - self.prev_y) > self.radius:
+            return int(self.x), int(self.y)
+        return (int(self.prev_x + (self.x - self.prev_x) * render_alpha),
+                int(self.prev_y + (self.y - self.prev_y) * render_alpha))
 
     def draw(self, surface):
+        rx, ry = self.render_pos()
         # --- 1. HIZA ORANTILI DİNAMİK İZ (Kuyruk) ÇİZİMİ ---
         current_speed = math.hypot(self.vx, self.vy)
 
@@ -912,301 +849,233 @@ class Ball:
         speed_ratio = max(0.0, min(1.0, current_speed / (SPEED * 1.1)))
 
         # Hıza göre kuyruğun ne kadar uzun olacağını belirliyoruz
-        visible_points = int(len(self.history) * speed_ratio)
-
-        if visible_points > 0 and len(self.history) > 0:
-            start_idx = len(self.history) - visible_points
-            for i in range(start_idx, len(self.history)):
-                hx, hy = self.history[i]
-
-                # History indexini, trail_surfaces indexine doğru bir şekilde oranlıyoruz
+        trail = self.trail
+        visible_points = int(trail.count * speed_ratio)
+
+        if visible_points > 0:
+            # Topun hızına göre kuyruğun opaklığı: hazır opaklık basamaklarından biri seçilir
+            step = int(speed_ratio * TRAIL_ALPHA_STEPS + 0.5)
+            xs, ys, size = trail.xs, trail.ys, trail.size
+            first = trail.head - visible_points
+            for j in range(visible_points):
+                # Halka indexini, trail_surfaces indexine doğru bir şekilde oranlıyoruz
                 if visible_points > 1:
-                    surf_idx = int(((i - start_idx) / (visible_points - 1)) * (self.max_history - 1))
+                    surf_idx = int((j / (visible_points - 1)) * (self.max_history - 1))
                 else:
                     surf_idx = self.max_history - 1
 
-                tr, surf = self.trail_surfaces[surf_idx]
+                tr, surf, variants = self.trail_surfaces[surf_idx]
 
                 if surf:
-                    # Topun hızına göre kuyruğun opaklığını (saydamlığını) dinamik ayarlıyoruz
-                    temp_surf = surf.copy()
-                    # Pygame'de set_alpha ile var olan alpha değerleri hızımız oranında çarpılır (soluklaşır veya netleşir)
-                    temp_surf.set_alpha(int(255 * speed_ratio))
-                    surface.blit(temp_surf, (int(hx) - tr, int(hy) - tr))
+                    faded = variants[step]
+                    if faded is None:
+                        # Pygame'de set_alpha ile var olan alpha değerleri hız oranında çarpılır
+                        faded = variants[step] = surf.copy()
+                        faded.set_alpha(int(255 * step / TRAIL_ALPHA_STEPS))
+                    k = (first + j) % size
+                    surface.blit(faded, (int(xs[k]) - tr, int(ys[k]) - tr))
 
         # --- 2. GÖLGE ÇİZİMİ ---
-        shadow_surf = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
-        pygame.draw.circle(shadow_surf, SHADOW_COLOR, (self.radius, self.radius), self.radius - 2)
-        surface.blit(shadow_surf, (int(self.x) - self.radius + self.shadow_offset, int(self.y) - self.radius + self.shadow_offset))
+        surface.blit(self.shadow, (rx - self.radius + self.shadow_offset, ry - self.radius + self.shadow_offset))
 
         # --- 3. TOPUN KENDİSİ VE DESENİ ---
-        scale = 3
-        sr = self.radius * scale
-        hr_surf = pygame.Surface((sr * 2, sr * 2), pygame.SRCALPHA)
-
-        stripe_w = (sr * 2) / 6
-        for i in range(6):
-            c = self.color[0] if i % 2 == 0 else self.color[1]
-            stripe_rect = pygame.Rect(i * stripe_w, 0, stripe_w + 1.5, sr * 2)
-            pygame.draw.rect(hr_surf, c, stripe_rect)
-
-            if self.text in TEAM_LOGOS:
-                hr_surf.blit(TEAM_LOGOS[self.text], (0, 0))
-
-        mask_surf = pygame.Surface((sr * 2, sr * 2), pygame.SRCALPHA)
-        pygame.draw.circle(mask_surf, (255, 255, 255), (sr, sr), sr)
-        hr_surf.blit(mask_surf, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
-
-        pygame.draw.circle(hr_surf, WHITE, (sr, sr), sr, 4 * scale)
-
-        ball_surf = pygame.transform.smoothscale(hr_surf, (self.radius * 2, self.radius * 2))
-
-        surface.blit(ball_surf, (int(self.x) - self.radius, int(self.y) - self.radius))
+        surface.blit(self.spin_sprite(), (rx - self.radius, ry - self.radius))
 
         if self.nerf_timer > 0:
-            pygame.draw.circle(surface, (255, 0, 0), (int(self.x), int(self.y)), self.radius + 4, 2)
-
-    def collide_wall(self, cx, cy, radius):
-        dx = self.x - cx
-        dy = self.y - cy
-        dist = math.hypot(dx, dy)
-        if dist + self.radius >= radius:
-            nx, ny = dx / dist, dy / dist
-            dot = self.vx * nx + self.vy * ny
-
-            is_crit = random.random() < 0.15
-            current_bounce = 1.05 if is_crit else BOUNCE_DAMPING
-            particle_count = 7 if is_crit else 6
-
-            if dot > 0:
-                self.vx = (self.vx - 2 * dot * nx) * current_bounce
-                self.vy = (self.vy - 2 * dot * ny) * current_bounce
-
-            overlap = (dist + self.radius) - radius
-            self.x -= nx * overlap
-            self.y -= ny * overlap
-
-            hit_x = self.x + nx * self.radius
-            hit_y = self.y + ny * self.radius
-            p_color = random.choice(self.color)
-
-            for _ in range(particle_count):
-                p = Particle(hit_x, hit_y, p_color)
-                p.vx += nx * (4 if is_crit else 2)
-                p.vy += ny * (4 if is_crit else 2)
-                particles.append(p)
-            return True
-        return False
-
-    def collide_post(self, px, py):
-        dx = self.x - px
-        dy = self.y - py
-        dist = math.hypot(dx, dy)
-        if dist < self.radius + POST_RADIUS:
-            nx, ny = dx / dist, dy / dist
-            dot = self.vx * nx + self.vy * ny
-            if dot < 0:
-                self.vx = (self.vx - 2 * dot * nx) * POST_ELASTICITY
-                self.vy = (self.vy - 2 * dot * ny) * POST_ELASTICITY
-                overlap = (self.radius + POST_RADIUS) - dist
-                self.x += nx * overlap
-                self.y += ny * overlap
-                return True
-        return False
-
-def resolve_collisions(b1, b2):
-    dx = b2.x - b1.x
-    dy = b2.y - b1.y
-    dist = math.hypot(dx, dy)
-    if dist < b1.radius + b2.radius:
-        if dist == 0: dist = 0.1
-        nx, ny = dx/dist, dy/dist
-        overlap = (b1.radius + b2.radius) - dist
-        total_mass = b1.mass + b2.mass
-        m1_ratio = b2.mass / total_mass
-        m2_ratio = b1.mass / total_mass
-        b1.x -= nx * overlap * m1_ratio
-        b1.y -= ny * overlap * m1_ratio
-        b2.x += nx * overlap * m2_ratio
-        b2.y += ny * overlap * m2_ratio
-        rx = b2.vx - b1.vx
-        ry = b2.vy - b1.vy
-        vel_along_normal = rx * nx + ry * ny
-        if vel_along_normal > 0: return False
-
-        j = -(1 + ELASTICITY) * vel_along_normal
-        j /= (1 / b1.mass + 1 / b2.mass)
-        impulse_x = j * nx
-        impulse_y = j * ny
-        b1.vx -= impulse_x / b1.mass
-        b1.vy -= impulse_y / b1.mass
-        b2.vx += impulse_x / b2.mass
-        b2.vy += impulse_y / b2.mass
-
-        hit_x = b1.x + nx * b1.radius
-        hit_y = b1.y + ny * b1.radius
-        for _ in range(5):
-            p = Particle(hit_x, hit_y, random.choice(b1.color))
-            p.vx += -nx * 3
-            p.vy += -ny * 3
-            particles.append(p)
-        for _ in range(5):
-            p = Particle(hit_x, hit_y, random.choice(b2.color))
-            p.vx += nx * 3
-            p.vy += ny * 3
-            particles.append(p)
-
-        return True
-    return False
-
-# --- SARI KART DEĞİŞKENLERİ ---
-yellow_card_obj = None
-yellow_cards_1 = 0
-yellow_cards_2 = 0
-yellow_cards_spawned_this_half = 0
-target_yellow_cards = 0
-
-class YellowCard:
-    def __init__(self, cx, cy):
-        angle = random.uniform(0, 2 * math.pi)
-        dist = math.sqrt(random.random()) * (ARENA_RADIUS - 60)
-        self.x = cx + math.cos(angle) * dist
-        self.y = cy + math.sin(angle) * dist
-        self.vx = random.uniform(-0.4, 0.4)
-        self.vy = random.uniform(-0.4, 0.4)
-        self.width = 16
-        self.height = 24
-        self.rect = pygame.Rect(self.x - self.width//2, self.y - self.height//2, self.width, self.height)
-        self.life_timer = 10 * FRAMES_PER_SIM_MINUTE
-        self.blink_start_time = 5 * FRAMES_PER_SIM_MINUTE
-        self.visible = True
-        self.active = True
-
-    def update(self):
-        if not self.active: return
-        self.life_timer -= 1
-        if self.life_timer <= 0:
-            self.active = False
-            return
-        self.x += self.vx
-        self.y += self.vy
-        dist_from_center = math.hypot(self.x - center_x, self.y - center_y)
-        if dist_from_center > ARENA_RADIUS - 50:
-            self.vx *= -1
-            self.vy *= -1
-        self.rect.center = (self.x, self.y)
-        if self.life_timer < (10 * FRAMES_PER_SIM_MINUTE) - self.blink_start_time:
-            self.visible = (self.life_timer // 10) % 2 != 0
-        else:
-            self.visible = True
-
-    def draw(self, surface):
-        if self.active and self.visible:
-            pygame.draw.rect(surface, (255, 220, 0), self.rect)
-            pygame.draw.rect(surface, WHITE, self.rect, 1)
-
-    def check_collision(self, ball):
-        if not self.active: return False
-        closest_x = max(self.rect.left, min(ball.x, self.rect.right))
-        closest_y = max(self.rect.top, min(ball.y, self.rect.bottom))
-        dx = ball.x - closest_x
-        dy = ball.y - closest_y
-        if dx*dx + dy*dy < ball.radius**2:
-            self.active = False
-            return True
-        return False
-
-class RedCard:
-    def __init__(self, cx, cy):
-        angle = random.uniform(0, 2 * math.pi)
-        dist = math.sqrt(random.random()) * (ARENA_RADIUS - 60)
-        self.x = cx + math.cos(angle) * dist
-        self.y = cy + math.sin(angle) * dist
-        self.vx = random.uniform(-0.4, 0.4)
-        self.vy = random.uniform(-0.4, 0.4)
-        self.width = 16
-        self.height = 24
-        self.rect = pygame.Rect(self.x - self.width//2, self.y - self.height//2, self.width, self.height)
-        self.life_timer = 10 * FRAMES_PER_SIM_MINUTE
-        self.blink_start_time = 5 * FRAMES_PER_SIM_MINUTE
-        self.visible = True
+            pygame.draw.circle(surface, (255, 0, 0), (rx, ry), self.radius + 4, 2)
+
+# Gol tekrarı: golden önceki son saniyeler yavaş çekimde yeniden gösterilir
+GOAL_REPLAY_SECONDS = 3
+GOAL_REPLAY_SPEED = 0.4     # replay steps per real step
+GOAL_REPLAY_SPAWNS = 8      # particle spawns kept per step
+WALL_SPAWN, BALLS_SPAWN = 0, 1
+
+class GoalReplay:
+    # Ring buffer of the last steps in arrays allocated once per match: ball
+    # x, y, vx, vy, the goal angle and the wall / ball-ball particle spawns.
+    # Recording writes into the arrays in place; playback draws from them,
+    # interpolating between stored steps, while the match is held.
+    def __init__(self, balls, seconds=GOAL_REPLAY_SECONDS):
+        self.balls = balls
+        self.index = {b: i for i, b in enumerate(balls)}
+        self.size = int(seconds * FPS)
+        self.kin = array("d", bytes(8 * 4 * len(balls) * self.size))
+        self.angle = array("d", bytes(8 * self.size))
+        # kind, ball, other ball, hit x, hit y, nx, ny, crit
+        self.spawns = array("d", bytes(8 * 8 * GOAL_REPLAY_SPAWNS * self.size))
+        self.spawn_count = array("B", bytes(self.size))
+        self.head = 0       # next slot to write
+        self.count = 0
+        self.active = False
+
+    def record(self, match, fx):
+        slot = self.head
+        kin = self.kin
+        k = slot * 4 * len(self.balls)
+        for b in self.balls:
+            kin[k] = b.x
+            kin[k + 1] = b.y
+            kin[k + 2] = b.vx
+            kin[k + 3] = b.vy
+            k += 4
+        self.angle[slot] = match.goal_angle
+
+        spawns = self.spawns
+        n = 0
+        for event in fx:
+            if n == GOAL_REPLAY_SPAWNS: break
+            kind = event[0]
+            s = (slot * GOAL_REPLAY_SPAWNS + n) * 8
+            if kind == "WALL":
+                spawns[s] = WALL_SPAWN
+                spawns[s + 1] = self.index[event[1]]
+                spawns[s + 3], spawns[s + 4] = event[2], event[3]
+                spawns[s + 5], spawns[s + 6] = event[4], event[5]
+                spawns[s + 7] = event[6]
+            elif kind == "BALLS":
+                spawns[s] = BALLS_SPAWN
+                spawns[s + 1] = self.index[event[1]]
+                spawns[s + 2] = self.index[event[2]]
+                spawns[s + 3], spawns[s + 4] = event[3], event[4]
+                spawns[s + 5], spawns[s + 6] = event[5], event[6]
+            else:
+                continue
+            n += 1
+        self.spawn_count[slot] = n
+
+        self.head = (slot + 1) % self.size
+        if self.count < self.size: self.count += 1
+
+    def clear(self):
+        self.count = 0
+        self.active = False
+
+    def start(self):
+        # The newest step is the goal itself, already showing the kick-off,
+        # so the replay ends on the step before it
+        frames = self.count - 2
+        if frames < 1: return False
+        self.first = (self.head - 2 - frames) % self.size
+        self.frames = frames
+        self.pos = 0.0
+        self.shown = -1
+        self.live = [(b.x, b.y, b.vx, b.vy, b.prev_x, b.prev_y, b.trail) for b in self.balls]
+        for b in self.balls:
+            b.trail = Trail(b.max_history)
         self.active = True
+        return True
 
-    def update(self):
-        if not self.active: return
-        self.life_timer -= 1
-        if self.life_timer <= 0:
-            self.active = False
-            return
-        self.x += self.vx
-        self.y += self.vy
-        dist_from_center = math.hypot(self.x - center_x, self.y - center_y)
-        if dist_from_center > ARENA_RADIUS - 50:
-            self.vx *= -1
-            self.vy *= -1
-        self.rect.center = (self.x, self.y)
-        if self.life_timer < (10 * FRAMES_PER_SIM_MINUTE) - self.blink_start_time:
-            if (self.life_timer // 10) % 2 == 0:
-                self.visible = False
+    def stop(self):
+        for b, (x, y, vx, vy, px, py, trail) in zip(self.balls, self.live):
+            b.x, b.y, b.vx, b.vy, b.prev_x, b.prev_y, b.trail = x, y, vx, vy, px, py, trail
+        self.active = False
+
+    def slot(self, k):
+        return (self.first + min(k, self.frames)) % self.size
+
+    def set_balls(self, k):
+        # prev at step k, current at step k + 1; render_alpha goes between them
+        kin = self.kin
+        a = self.slot(k) * 4 * len(self.balls)
+        c = self.slot(k + 1) * 4 * len(self.balls)
+        for b in self.balls:
+            b.prev_x, b.prev_y = kin[a], kin[a + 1]
+            b.x, b.y, b.vx, b.vy = kin[c], kin[c + 1], kin[c + 2], kin[c + 3]
+            a += 4
+            c += 4
+
+    def goal_angle(self, k, alpha):
+        a0, a1 = self.angle[self.slot(k)], self.angle[self.slot(k + 1)]
+        return a0 + ((a1 - a0 + math.pi) % (2 * math.pi) - math.pi) * alpha
+
+    def replay_spawns(self, k, on_wall, on_balls):
+        slot = self.slot(k)
+        spawns, balls = self.spawns, self.balls
+        for n in range(self.spawn_count[slot]):
+            s = (slot * GOAL_REPLAY_SPAWNS + n) * 8
+            if spawns[s] == WALL_SPAWN:
+                on_wall(balls[int(spawns[s + 1])], spawns[s + 3], spawns[s + 4],
+                        spawns[s + 5], spawns[s + 6], bool(spawns[s + 7]))
             else:
-                self.visible = True
-        else:
-            self.visible = True
-
-    def draw(self, surface):
-        if self.active and self.visible:
-            pygame.draw.rect(surface, RED_CARD_COLOR, self.rect)
-            pygame.draw.rect(surface, WHITE, self.rect, 1)
-
-    def check_collision(self, ball):
-        if not self.active: return False
-        closest_x = max(self.rect.left, min(ball.x, self.rect.right))
-        closest_y = max(self.rect.top, min(ball.y, self.rect.bottom))
-        dx = ball.x - closest_x
-        dy = ball.y - closest_y
-        dist_sq = dx*dx + dy*dy
-        if dist_sq < ball.radius**2:
-            self.active = False
-            play_red_card_sound()
-            return True
-        return False
+                on_balls(balls[int(spawns[s + 1])], balls[int(spawns[s + 2])], spawns[s + 3], spawns[s + 4],
+                         spawns[s + 5], spawns[s + 6])
+
+def draw_card(surface, card, color):
+    if card.active and card.visible:
+        rect = pygame.Rect(card.left, card.top, card.width, card.height)
+        pygame.draw.rect(surface, color, rect)
+        pygame.draw.rect(surface, WHITE, rect, 1)
+
+def spawn_wall_particles(ball, hit_x, hit_y, nx, ny, is_crit):
+    particle_count = 7 if is_crit else 6
+    rng = match.fx_rng
+    p_color = rng.choice(ball.color)
+    push = 4 if is_crit else 2
+    for _ in range(particle_count):
+        particles.spawn(hit_x, hit_y, p_color, nx * push, ny * push, rng)
+
+def spawn_collision_particles(b1, b2, hit_x, hit_y, nx, ny):
+    rng = match.fx_rng
+    for _ in range(5):
+        particles.spawn(hit_x, hit_y, rng.choice(b1.color), -nx * 3, -ny * 3, rng)
+    for _ in range(5):
+        particles.spawn(hit_x, hit_y, rng.choice(b2.color), nx * 3, ny * 3, rng)
 
 # =====================================================================
-#                     12. GLOBAL GAME STATE VARIABLES
+#                     10. GLOBAL GAME STATE VARIABLES
 # =====================================================================
 center_x, center_y = WIDTH // 2, HEIGHT // 2 + 40
-score1, score2 = 0, 0
-goal_angle = 1 * math.pi / 2
-goal_rotating = False
-goal_rot_speed = 0.015
-goll_timer = 0
+match = None  # futbol_engine.MatchSimulator; owns balls, cards, score and clock
 goal_text_color = TERRACOTTA
-goal_events_1 = []
-goal_events_2 = []
 state = "MENU"
-frame_counter = 0
 
-intro_timer, home_full_name, away_full_name, screen_shake_timer = 0, "", "", 0
-near_miss_timer = 0
-
-
-added_time_1 = random.randint(0, 1)
-added_time_2 = random.randint(1, 2)
-display_added_time = False
+home_full_name, away_full_name, screen_shake_timer = "", "", 0
 end_match_timer = 0
-halftime_timer = 0
-start_delay_timer = 0
-red_card_obj = None
-cinematic_timer = 0
-red_card_spawned_this_half = False
 paused = False
 
+# Fast-forward: simulation steps per displayed frame (0 = as many as fit in
+# one display frame). Drawing still happens once per frame.
+turbo = 1
+TURBO_KEYS = {pygame.K_1: 1, pygame.K_2: 2, pygame.K_3: 4, pygame.K_4: 16, pygame.K_5: 0}
+TURBO_MAX_BUDGET = 0.8 / FPS
+
+# Fixed timestep: the match always advances in steps of 1/FPS s of real time,
+# however fast the screen is drawn. Real frame time goes into an accumulator
+# that is drained one step at a time; balls are drawn interpolated between
+# the last two steps by render_alpha.
+RENDER_FPS = 144
+STEP_MS = 1000.0 / FPS
+MAX_STEPS_PER_FRAME = 8  # beyond this a slow machine plays slower instead of stalling
+frame_ms = 0
+sim_accumulator = 0.0
+render_alpha = 1.0
+
+# Rewind: the left/right arrows jump 1 s of match time, 10 s with Shift. The
+# match is snapshotted every few steps; a jump restores the nearest snapshot
+# and replays from there.
+rewind = None
+SCRUB_FRAMES = FPS
+# --replay: the match is a futbol_replay.ReplayPlayer, stepped like a live
+# match but read from the file, so nothing is simulated
+replay_file = args.replay
+
+# G tuşu gol tekrarını açıp kapatır, Boşluk oynayan tekrarı geçer
+goal_replays = True
+goal_replay = None
+goal_replay_pending = False
+replay_particles = ParticlePool()
+
 selected_home_idx = 0
 selected_away_idx = 1
-team1_name = ""
-team2_name = ""
-team1_colors = []
-team2_colors = []
+# Herkes tek modu: 0 kapalı, aksi halde sahadaki top sayısı
+FFA_SIZES = [0, 4, 8, 20]
+ffa_size = 0
+ffa_btn_rect = pygame.Rect(590, 610, 160, 40)
+ARENA_NAMES = list(futbol_engine.ARENAS)
+arena_name = "circle"
+arena_btn_rect = pygame.Rect(590, 720, 160, 40)
+search_text = ""
+search_active = False
 menu_scroll_y = 0
 is_dragging_scroll = False
 
@@ -1220,14 +1089,8 @@ slider_rects = {
     "MISS": pygame.Rect(590, 550, 160, 10)
 }
 
-ball1 = None
-ball2 = None
-crowd = []
 goal_sound_channel = None
 
-red_cards_1 = 0
-red_cards_2 = 0
-
 def play_goal_music_for_team(team_short_name):
     global goal_sound_channel
     if goal_sound_channel and goal_sound_channel.get_busy(): goal_sound_channel.stop()
@@ -1238,24 +1101,16 @@ def play_goal_music_for_team(team_short_name):
     elif team_short_name == "BJK": sound_to_play = goal_sounds["BJK"]
     elif team_short_name == "TS": sound_to_play = goal_sounds["TS"]
     else:
-        if len(general_pool) > 0: sound_to_play = random.choice(general_pool)
+        if len(general_pool) > 0: sound_to_play = match.fx_rng.choice(general_pool)
 
     if sound_to_play: goal_sound_channel = sound_to_play.play()
 
 def quit_match():
-    global state, goal_angle, goll_timer, display_added_time, frame_counter, screen_shake_timer, near_miss_timer
+    global state, screen_shake_timer, replay_file
 
     state = "MENU"
-    goal_angle = 1 * math.pi / 2
-
-    # EKSİK OLAN KISIM: Menüye dönüldüğünde maçtaki BÜTÜN hayalet verileri temizle
-    goal_events_1.clear()
-    goal_events_2.clear()
-    goll_timer = 0
-    display_added_time = False
-    frame_counter = 0
+    replay_file = None
     screen_shake_timer = 0
-    near_miss_timer = 0
 
     if stadium_music_loaded:
         try: pygame.mixer.music.stop()
@@ -1263,77 +1118,205 @@ def quit_match():
     if goal_sound_channel: goal_sound_channel.stop()
 
 def start_match():
-    global ball1, ball2, crowd, team1_name, team2_name, team1_colors, team2_colors, state, score1, score2, goal_events_1, goal_events_2, frame_counter, goal_rotating, goal_sound_channel
-    global red_card_obj, red_card_spawned_this_half, halftime_timer, particles, screen_shake_timer
-    global goal_angle, added_time_1, added_time_2, start_delay_timer, cinematic_timer, red_cards_1, red_cards_2
-    global yellow_card_obj, yellow_cards_1, yellow_cards_2, yellow_cards_spawned_this_half, target_yellow_cards
-    global intro_timer, home_full_name, away_full_name
-    global near_miss_timer, goll_timer, display_added_time, end_match_timer
+    global match, state, goal_sound_channel, screen_shake_timer, background_key, background_layer
+    global home_full_name, away_full_name, end_match_timer, sim_accumulator, rewind, goal_replay
 
     # Yeni maça başlarken her şeyi TAMAMEN sıfırla
-    score1, score2, frame_counter, goal_rotating, goal_angle, screen_shake_timer = 0, 0, 0, False, 1 * math.pi / 2, 0
-    particles = []
-    near_miss_timer = 0
-    goll_timer = 0
-    display_added_time = False
+    screen_shake_timer = 0
+    particles.clear()
     end_match_timer = 0
-
-    goal_events_1.clear()
-    goal_events_2.clear()
-
-    added_time_1 = random.randint(2, 4)
-    added_time_2 = random.randint(3, 8)
-
-    red_card_obj = None
-    red_card_spawned_this_half = False
-    halftime_timer = 0
+    sim_accumulator = 0.0
     goal_sound_channel = None
 
-    red_cards_1 = 0
-    red_cards_2 = 0
-
-    yellow_cards_1 = 0
-    yellow_cards_2 = 0
-    yellow_card_obj = None
-    yellow_cards_spawned_this_half = 0
-    target_yellow_cards = random.randint(1, 3)
-
     home_key = TEAM_NAMES[selected_home_idx]
     away_key = TEAM_NAMES[selected_away_idx]
 
+    arena = futbol_engine.make_arena(arena_name, center_x, center_y)
+    if replay_file:
+        from futbol_replay import ReplayPlayer
+        match = ReplayPlayer(replay_file, center_x, center_y, ball_cls=Ball)
+        home_key, away_key = match.home_key, match.away_key
+        arena = match.arena
+    elif ffa_size:
+        # Seçilen iki takım + rastgele diğerleri
+        others = [k for k in TEAM_NAMES if k not in (home_key, away_key)]
+        keys = [home_key, away_key] + random.sample(others, ffa_size - 2)
+        match = FreeForAllSimulator(keys, center_x, center_y, ball_cls=Ball, record_fx=True,
+                                    player_label=LANG[current_lang]["PLAYER"], arena=arena)
+    else:
+        match = MatchSimulator(home_key, away_key, center_x, center_y, ball_cls=Ball, record_fx=True,
+                               player_label=LANG[current_lang]["PLAYER"], arena=arena)
     home_full_name = home_key
     away_full_name = away_key
+    rewind = None if replay_file else RewindBuffer()
+    goal_replay = GoalReplay(match.balls)
 
-    team1_name = TEAMS[home_key]["short"]
-    team2_name = TEAMS[away_key]["short"]
-    team1_colors = TEAMS[home_key]["colors"]
-    team2_colors = TEAMS[away_key]["colors"]
-
-    rx1, ry1 = get_random_spawn(center_x, center_y, ARENA_RADIUS)
-    rx2, ry2 = get_random_spawn(center_x, center_y, ARENA_RADIUS)
-    ball1 = Ball(rx1, ry1, team1_colors, team1_name)
-    ball2 = Ball(rx2, ry2, team2_colors, team2_name)
-
-    crowd = []
-    while len(crowd) < 300:
-        cx = random.randint(0, WIDTH)
-        cy = random.randint(0, HEIGHT)
-        dist = math.hypot(cx - center_x, cy - center_y)
-        if dist > ARENA_RADIUS + 10:
-            col = random.choice(team1_colors) if random.random() < 0.5 else random.choice(team2_colors)
-            crowd.append((cx, cy, col))
+    # Cosmetic draws come from the match's fx stream, never from match.rng
+    teams = tuple(getattr(match, "team_keys", (home_key, away_key)))
+    key = (teams, arena, ARENA_RADIUS, screen.get_size())
+    if key != background_key:
+        background_key = key
+        background_layer = build_background(arena, [b.color for b in match.balls], match.fx_rng)
 
     if stadium_music_loaded:
         try: pygame.mixer.music.play(-1)
         except: pass
 
-    intro_timer = int(1.0 * FPS)
-    start_delay_timer = int(0.5 * FPS)
-    cinematic_timer = 0
-    state = "INTRO"
+    state = match.state
+
+def handle_match_fx(fx):
+    global goal_text_color, screen_shake_timer, goal_replay_pending
+    in_play = match.state != "FULLTIME"
+    # Hızlı sarmada çarpışma sesleri üst üste binmesin diye susturulur
+    hit_sounds = in_play and turbo == 1
+    for event in fx:
+        kind = event[0]
+        if kind == "WALL":
+            b = event[1]
+            b.add_spin(event[4], event[5], b.vx, b.vy)
+            spawn_wall_particles(*event[1:])
+            if hit_sounds: play_collision_sound()
+        elif kind == "BALLS":
+            b1, b2, nx, ny = event[1], event[2], event[5], event[6]
+            rvx, rvy = b1.vx - b2.vx, b1.vy - b2.vy
+            b1.add_spin(nx, ny, rvx, rvy)
+            b2.add_spin(-nx, -ny, -rvx, -rvy)
+            spawn_collision_particles(*event[1:])
+            if hit_sounds: play_collision_sound()
+        elif kind == "POST":
+            # Top direğe değdiği an beklemeden sesi kesip baştan başlatır
+            if hit_sounds: play_miss_sound()
+        elif kind == "GOAL":
+            screen_shake_timer = 45
+            goal_replay_pending = goal_replays and turbo == 1 and in_play
+            scorer = event[1]
+            goal_text_color = scorer.color[0]
+            play_goal_music_for_team(scorer.text)
+        elif kind == "RED_CARD":
+            play_red_card_sound()
+        elif kind == "WHISTLE_START":
+            if start_whistle_sound: start_whistle_sound.play()
+        elif kind == "WHISTLE_HALF":
+            if half_whistle_sound: half_whistle_sound.play()
+        elif kind == "WHISTLE_END":
+            if end_whistle_sound: end_whistle_sound.play()
+
+def sim_step():
+    global screen_shake_timer, end_match_timer
+    for b in match.balls:
+        b.prev_x, b.prev_y = b.x, b.y
+    if rewind: rewind.record(match)
+    fx = match.step()
+    goal_replay.record(match, fx)
+    handle_match_fx(fx)
+
+    # Cosmetic timers tick with the simulation, not with drawn frames
+    if match.state == "FULLTIME":
+        if match.cinematic_timer > 0:
+            if match.cinematic_timer % 4 == 0:
+                particles.update()
+        else:
+            end_match_timer += 1
+    else:
+        particles.update()
+    if screen_shake_timer > 0: screen_shake_timer -= 1
+    if goal_replay_pending: start_goal_replay()
+
+def advance_match():
+    # The simulation only ever moves through match.step(), so events, cards
+    # and scorers are the same at any speed; turbo just drains the
+    # accumulator faster.
+    global sim_accumulator, render_alpha
+    speed = 1 if match.state == "FULLTIME" else turbo
+    if speed == 0:
+        deadline = time.perf_counter() + TURBO_MAX_BUDGET
+        sim_step()
+        while match.state != "FULLTIME" and time.perf_counter() < deadline:
+            sim_step()
+        sim_accumulator, render_alpha = 0.0, 1.0
+        return
+
+    sim_accumulator += frame_ms * speed
+    steps = 0
+    while sim_accumulator >= STEP_MS:
+        sim_step()
+        sim_accumulator -= STEP_MS
+        steps += 1
+        if goal_replay.active:
+            sim_accumulator = 0.0
+            break
+        if steps >= MAX_STEPS_PER_FRAME * speed:
+            sim_accumulator = 0.0
+            break
+    render_alpha = sim_accumulator / STEP_MS
+
+def start_goal_replay():
+    global goal_replay_pending, particles, replay_particles
+    goal_replay_pending = False
+    if not goal_replay.start(): return
+    # Canlı parçacıklar tekrar bitene kadar bekletilir
+    replay_particles, particles = particles, replay_particles
+    particles.clear()
+
+def stop_goal_replay():
+    global particles, replay_particles, render_alpha
+    if not goal_replay.active: return
+    goal_replay.stop()
+    particles, replay_particles = replay_particles, particles
+    render_alpha = 1.0
+
+def advance_goal_replay():
+    global render_alpha
+    gr = goal_replay
+    gr.pos += frame_ms / STEP_MS * GOAL_REPLAY_SPEED
+    if gr.pos >= gr.frames:
+        stop_goal_replay()
+        return
+    k = int(gr.pos)
+    while gr.shown < k:
+        gr.shown += 1
+        gr.set_balls(gr.shown)
+        for b in match.balls: b.add_trail_point()
+        gr.replay_spawns(gr.shown, spawn_wall_particles, spawn_collision_particles)
+        particles.update()
+    gr.set_balls(k)
+    render_alpha = gr.pos - k
+
+def skip_to_full_time():
+    global screen_shake_timer
+    stop_goal_replay()
+    # Rest of the match runs headless; fx is not recorded so nothing is drawn
+    # or played for the skipped part, only the final whistle.
+    match.record_fx = False
+    while match.state != "FULLTIME":
+        match.step()
+    match.record_fx = True
+    match.cinematic_timer = 0
+    particles.clear()
+    screen_shake_timer = 0
+    if goal_sound_channel: goal_sound_channel.stop()
+    if end_whistle_sound: end_whistle_sound.play()
+
+def seek_match(frame):
+    global state, screen_shake_timer, end_match_timer, sim_accumulator, render_alpha
+    stop_goal_replay()
+    if not (match.seek(frame) if replay_file else rewind.seek(match, frame)): return
+    goal_replay.clear()
+    # Nothing cosmetic is kept across a jump: trails, particles and goal music restart
+    for b in match.balls:
+        b.prev_x, b.prev_y = b.x, b.y
+        b.trail.clear()
+    particles.clear()
+    screen_shake_timer = 0
+    end_match_timer = 0
+    sim_accumulator, render_alpha = 0.0, 1.0
+    if goal_sound_channel: goal_sound_channel.stop()
+    state = match.state
+
 # =====================================================================
-#                     13. MAIN GAME LOOP
+#                     11. MAIN GAME LOOP
 # =====================================================================
+if replay_file: start_match()
 running = True
 while running:
     # --- EVENT HANDLING ---
@@ -1344,6 +1327,16 @@ while running:
             if event.key == pygame.K_p: paused = not paused
             if event.key == pygame.K_q: quit_match()
             if event.key == pygame.K_r and state in ["FIRST_HALF", "SECOND_HALF", "HALFTIME", "FULLTIME"]: start_match()
+            if state in MATCH_STATES and not search_active:
+                if event.key in TURBO_KEYS: turbo = TURBO_KEYS[event.key]
+                if event.key == pygame.K_f and state != "FULLTIME":
+                    skip_to_full_time()
+                    state = match.state
+                if event.key == pygame.K_g: goal_replays = not goal_replays
+                if event.key == pygame.K_SPACE: stop_goal_replay()
+                if event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+                    jump = SCRUB_FRAMES * (10 if event.mod & pygame.KMOD_SHIFT else 1)
+                    seek_match(match.total_frames + (jump if event.key == pygame.K_RIGHT else -jump))
 
             if state == "MENU" and search_active:
                 if event.key == pygame.K_RETURN:
@@ -1408,6 +1401,12 @@ while running:
                         rect2 = pygame.Rect(300, item_y, 220, 30)
                         if rect2.collidepoint(mx, my): selected_away_idx = orig_idx
 
+                if arena_btn_rect.collidepoint(mx, my):
+                    arena_name = ARENA_NAMES[(ARENA_NAMES.index(arena_name) + 1) % len(ARENA_NAMES)]
+
+                if ffa_btn_rect.collidepoint(mx, my):
+                    ffa_size = FFA_SIZES[(FFA_SIZES.index(ffa_size) + 1) % len(FFA_SIZES)]
+
                 if start_btn_rect.collidepoint(mx, my): start_match()
 
         elif event.type == pygame.MOUSEBUTTONUP:
@@ -1460,7 +1459,6 @@ while running:
                     mx, my = pygame.mouse.get_pos()
                     if restart_btn_rect.collidepoint(mx, my):
                         state = "MENU"
-                        goal_angle = 1 * math.pi / 2
                         if goal_sound_channel: goal_sound_channel.stop()
                         if stadium_music_loaded: pygame.mixer.music.stop()
 
@@ -1545,6 +1543,13 @@ while running:
                 handle_rect = pygame.Rect(rect.x + rect.width * val - 10, rect.y - 10, 20, 30)
                 pygame.draw.rect(screen, CREAM, handle_rect, border_radius=5)
 
+            ffa_lbl = font_settings.render(LANG[current_lang]["FFA"], True, CREAM)
+            screen.blit(ffa_lbl, (ffa_btn_rect.x, ffa_btn_rect.y - 30))
+            pygame.draw.rect(screen, SELECTED_COLOR if ffa_size else SCROLLBAR_BG, ffa_btn_rect, border_radius=5)
+            pygame.draw.rect(screen, CREAM, ffa_btn_rect, 2, border_radius=5)
+            ffa_txt = font_menu_item.render(str(ffa_size) if ffa_size else LANG[current_lang]["OFF"], True, CREAM)
+            screen.blit(ffa_txt, ffa_txt.get_rect(center=ffa_btn_rect.center))
+
             pygame.draw.rect(screen, MENU_BG, (0, HEIGHT-110, WIDTH, 110))
 
             btn_rect = pygame.Rect(WIDTH//2 - 150, HEIGHT - 100, 300, 60)
@@ -1554,215 +1559,37 @@ while running:
             btn_txt_rect = btn_txt.get_rect(center=btn_rect.center)
             screen.blit(btn_txt, btn_txt_rect)
 
-        elif state in ["INTRO", "FIRST_HALF", "SECOND_HALF", "HALFTIME", "FULLTIME"]:
+            arena_lbl = font_settings.render(LANG[current_lang]["ARENA"], True, CREAM)
+            screen.blit(arena_lbl, (arena_btn_rect.x, arena_btn_rect.y - 26))
+            pygame.draw.rect(screen, SCROLLBAR_BG, arena_btn_rect, border_radius=5)
+            pygame.draw.rect(screen, CREAM, arena_btn_rect, 2, border_radius=5)
+            arena_txt = font_menu_item.render(LANG[current_lang]["ARENAS"][arena_name], True, CREAM)
+            screen.blit(arena_txt, arena_txt.get_rect(center=arena_btn_rect.center))
 
-            run_physics = False
-
-            if state == "INTRO":
-                if intro_timer > 0:
-                    intro_timer -= 1
-                    if intro_timer <= 0:
-                        state = "FIRST_HALF"
-
-            elif state in ["FIRST_HALF", "SECOND_HALF"]:
-                if start_delay_timer > 0:
-                    start_delay_timer -= 1
-                    if start_delay_timer == 0 and state == "FIRST_HALF":
-                        if start_whistle_sound: start_whistle_sound.play()
-                else:
-                    run_physics = True
-                    frame_counter += 1
-                    total_mins_played = frame_counter // FRAMES_PER_SIM_MINUTE
-
-                    if state == "FIRST_HALF":
-                        sim_minute = total_mins_played
-                        if not red_card_spawned_this_half and not red_card_obj:
-                            if random.random() < 0.03 / (45 * 60) * 10:
-                                red_card_obj = RedCard(center_x, center_y)
-                                red_card_spawned_this_half = True
-
-                        if yellow_cards_spawned_this_half < target_yellow_cards and not yellow_card_obj:
-                            if random.random() < 0.15 / (45 * 60) * 10:
-                                yellow_card_obj = YellowCard(center_x, center_y)
-                                yellow_cards_spawned_this_half += 1
-
-                        if sim_minute >= 45:
-                            display_added_time = True
-                            if sim_minute >= 45 + added_time_1:
-                                state = "HALFTIME"
-                                halftime_timer = 0
-                                red_card_obj = None
-                                yellow_card_obj = None
-                                if half_whistle_sound: half_whistle_sound.play()
-                        else:
-                            display_added_time = False
-
-                    elif state == "SECOND_HALF":
-                        sim_minute = 45 + total_mins_played
-                        if not red_card_spawned_this_half and not red_card_obj:
-                            if random.random() < 0.15 / (45 * 60) * 10:
-                                red_card_obj = RedCard(center_x, center_y)
-                                red_card_spawned_this_half = True
-
-                        if yellow_cards_spawned_this_half < target_yellow_cards and not yellow_card_obj:
-                            if random.random() < 0.15 / (45 * 60) * 10:
-                                yellow_card_obj = YellowCard(center_x, center_y)
-                                yellow_cards_spawned_this_half += 1
-
-                        if sim_minute >= 90:
-                            display_added_time = True
-                            if sim_minute >= 90 + added_time_2:
-                                state = "FULLTIME"
-                                cinematic_timer = int(2.5 * FPS)
-                                end_match_timer = 0
-                                if end_whistle_sound: end_whistle_sound.play()
-                        else:
-                            display_added_time = False
-
-            elif state == "FULLTIME":
-                if cinematic_timer > 0:
-                    cinematic_timer -= 1
-                    if cinematic_timer % 3 == 0:
-                        run_physics = True
-
-            if run_physics:
-                if goal_rotating:
-                    goal_angle = (goal_angle + goal_rot_speed) % (2 * math.pi)
-                if goll_timer > 0 and state != "FULLTIME":
-                    goll_timer -= 1
-
-                if red_card_obj and state != "FULLTIME":
-                    red_card_obj.update()
-                    if not red_card_obj.active: red_card_obj = None
-                    else:
-                        for b in [ball1, ball2]:
-                            if red_card_obj.check_collision(b):
-                                b.nerf_timer = 20 * FRAMES_PER_SIM_MINUTE
-                                if b == ball1: red_cards_1 += 1
-                                else: red_cards_2 += 1
-                                red_card_obj = None
-                                break
-
-                if yellow_card_obj and state != "FULLTIME":
-                    yellow_card_obj.update()
-                    if not yellow_card_obj.active: yellow_card_obj = None
-                    else:
-                        for b in [ball1, ball2]:
-                            if yellow_card_obj.check_collision(b):
-                                b.yellow_nerf_timer = 20 * FRAMES_PER_SIM_MINUTE
-                                if b == ball1: yellow_cards_1 += 1
-                                else: yellow_cards_2 += 1
-                                yellow_card_obj = None
-                                break
-
-                (p1, p2, _, _) = calculate_goal_posts(center_x, center_y, ARENA_RADIUS, goal_angle, GOAL_WIDTH_RADIANS)
-                for b in [ball1, ball2]:
-                    b.move()
-
-                    hit_post1 = b.collide_post(p1[0], p1[1])
-                    hit_post2 = b.collide_post(p2[0], p2[1])
-
-                    # Top direğe değdiği an beklemeden sesi kesip baştan başlatır
-                    if (hit_post1 or hit_post2) and state != "FULLTIME":
-                        play_miss_sound()
-
-                for _ in range(8):
-                    # BİRİNCİ TOPUN DUVARA ÇARPMASI
-                    if ball1.collide_wall(center_x, center_y, ARENA_RADIUS) and state != "FULLTIME":
-                        play_collision_sound()
-
-                    # İKİNCİ TOPUN DUVARA ÇARPMASI (BENİM SİLDİĞİM YER BURASIYDI)
-                    if ball2.collide_wall(center_x, center_y, ARENA_RADIUS) and state != "FULLTIME":
-                        play_collision_sound()
-
-                    # İKİ TOPUN BİRBİRİNE ÇARPMASI (BUNU DA SİLMİŞİM)
-                    if resolve_collisions(ball1, ball2) and state != "FULLTIME":
-                        play_collision_sound()
-
-                if state != "FULLTIME":
-                    for b in [ball1, ball2]:
-                        dist = math.hypot(b.x - center_x, b.y - center_y)
-                        if dist > ARENA_RADIUS - b.radius - 5:
-                            ball_ang = math.atan2(b.y - center_y, b.x - center_x)
-                            goal_n = goal_angle % (2*math.pi)
-                            ball_n = ball_ang % (2*math.pi)
-                            diff = abs(ball_n - goal_n)
-                            while diff > math.pi: diff = abs(diff - 2*math.pi)
-                            if diff < GOAL_WIDTH_RADIANS / 2:
-                                goll_timer = 90
-                                screen_shake_timer = 45
-
-                                time_mark = f"{sim_minute}'"
-                                if state == "FIRST_HALF":
-                                    if sim_minute > 45: time_mark = f"45+{sim_minute - 45}'"
-                                elif state == "SECOND_HALF":
-                                    if sim_minute > 90: time_mark = f"90+{sim_minute - 90}'"
-
-                                if b == ball1:
-                                    score1 += 1
-                                    goal_text_color = team1_colors[0]
-                                    scorer_name = get_random_player_name(TEAM_NAMES[selected_home_idx])
-                                    goal_events_1.append((time_mark, "GOAL", scorer_name, frame_counter, state))
-                                    ball1.x, ball1.y = center_x, center_y
-                                    play_goal_music_for_team(team1_name)
-                                else:
-                                    score2 += 1
-                                    goal_text_color = team2_colors[0]
-                                    scorer_name = get_random_player_name(TEAM_NAMES[selected_away_idx])
-                                    goal_events_2.append((time_mark, "GOAL", scorer_name, frame_counter, state))
-                                    ball2.x, ball2.y = center_x, center_y
-                                    play_goal_music_for_team(team2_name)
-
-                                if score1 + score2 >= 1: goal_rotating = True
-                                ball1.vx = random.choice([-SPEED, SPEED]) * random.uniform(0.8, 1.2)
-                                ball1.vy = random.choice([-SPEED, SPEED]) * random.uniform(0.8, 1.2)
-                                ball2.vx = random.choice([-SPEED, SPEED]) * random.uniform(0.8, 1.2)
-                                ball2.vy = random.choice([-SPEED, SPEED]) * random.uniform(0.8, 1.2)
-
-            if state == "HALFTIME":
-                halftime_timer += 1
-                if halftime_timer > 1.5 * FPS:
-                    state = "SECOND_HALF"
-                    frame_counter = 0
-                    red_card_spawned_this_half = False
-                    red_card_obj = None
-
-                    yellow_cards_spawned_this_half = 0
-                    target_yellow_cards = random.randint(1, 3)
-                    yellow_card_obj = None
-
-                    display_added_time = False
-                    rx1, ry1 = get_random_spawn(center_x, center_y, ARENA_RADIUS)
-                    rx2, ry2 = get_random_spawn(center_x, center_y, ARENA_RADIUS)
-                    ball1.x, ball1.y = rx1, ry1
-                    ball2.x, ball2.y = rx2, ry2
-
-            if state == "FULLTIME":
-                if cinematic_timer > 0:
-                    if cinematic_timer % 4 == 0:
-                        for p in particles[:]:
-                            p.update()
-                            if p.life <= 0: particles.remove(p)
-            else:
-                for p in particles[:]:
-                    p.update()
-                    if p.life <= 0: particles.remove(p)
+        elif state in MATCH_STATES:
+            in_replay = goal_replay.active
+            if in_replay: advance_goal_replay()
+            else: advance_match()
+            state = match.state
+            in_replay = goal_replay.active
+            goal_angle = goal_replay.goal_angle(goal_replay.shown, render_alpha) if in_replay else match.goal_angle
 
-            screen.fill(NAVY_DARK)
-            draw_striped_pitch(screen, center_x, center_y, ARENA_RADIUS)
+            ffa_match = len(match.balls) > 2
 
-            for dot in crowd:
-                pygame.draw.circle(screen, dot[2], (dot[0], dot[1]), 2)
+            screen.blit(background_layer, (0, 0))
 
-            draw_real_goal(screen, center_x, center_y, ARENA_RADIUS, goal_angle, GOAL_WIDTH_RADIANS)
+            if match.arena.shape == "circle":
+                draw_real_goal(screen, center_x, center_y, ARENA_RADIUS, goal_angle, GOAL_WIDTH_RADIANS)
+            else:
+                draw_shaped_goal(screen, match.arena, goal_angle)
 
-            if red_card_obj: red_card_obj.draw(screen)
-            if yellow_card_obj: yellow_card_obj.draw(screen)
+            if not in_replay:
+                if match.red_card_obj: draw_card(screen, match.red_card_obj, RED_CARD_COLOR)
+                if match.yellow_card_obj: draw_card(screen, match.yellow_card_obj, (255, 220, 0))
 
-            ball1.draw(screen)
-            ball2.draw(screen)
+            for b in match.balls: b.draw(screen)
 
-            for p in particles: p.draw(screen)
+            particles.draw(screen)
 
             # --- YENİ: İNTRO VEYA UI ÇİZİMİ ---
             if state == "INTRO":
@@ -1770,12 +1597,12 @@ while running:
                 fade_frames = int(0.2 * FPS)
 
                 alpha = 255
-                frames_played = total_frames - intro_timer
+                frames_played = total_frames - match.intro_timer
 
                 if frames_played < fade_frames:
                     alpha = int((frames_played / fade_frames) * 255)
-                elif intro_timer < fade_frames:
-                    alpha = int((intro_timer / fade_frames) * 255)
+                elif match.intro_timer < fade_frames:
+                    alpha = int((match.intro_timer / fade_frames) * 255)
 
                 intro_surf = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
 
@@ -1787,133 +1614,158 @@ while running:
                     s = font.render(text, True, color)
                     surf.blit(s, s.get_rect(center=(x, y)))
 
-                c1 = get_readable_color(team1_colors)
-                c2 = get_readable_color(team2_colors)
+                if ffa_match:
+                    draw_alpha_text(intro_surf, LANG[current_lang]["FFA"], font_team, CREAM, center_x, center_y - 25, NAVY_DARK)
+                    draw_alpha_text(intro_surf, str(len(match.balls)), font_score, WHITE, center_x, center_y + 30, NAVY_DARK)
+                else:
+                    c1 = get_readable_color(match.team1_colors)
+                    c2 = get_readable_color(match.team2_colors)
 
-                draw_alpha_text(intro_surf, home_full_name, font_team, c1, center_x, center_y - 45, WHITE)
-                draw_alpha_text(intro_surf, "VS", font_score, WHITE, center_x, center_y + 5, NAVY_DARK)
-                draw_alpha_text(intro_surf, away_full_name, font_team, c2, center_x, center_y + 55, WHITE)
+                    draw_alpha_text(intro_surf, home_full_name, font_team, c1, center_x, center_y - 45, WHITE)
+                    draw_alpha_text(intro_surf, "VS", font_score, WHITE, center_x, center_y + 5, NAVY_DARK)
+                    draw_alpha_text(intro_surf, away_full_name, font_team, c2, center_x, center_y + 55, WHITE)
 
                 intro_surf.set_alpha(alpha)
                 screen.blit(intro_surf, (0, 0))
 
             else:
-                # --- UI PANEL DRAWING ---
-                panel_w, panel_h = 500, 105
-                panel_x = WIDTH // 2 - panel_w // 2
-                table_surf = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
-                pygame.draw.rect(table_surf, TABLE_BG, (0, 0, panel_w, panel_h), border_radius=15)
-                screen.blit(table_surf, (panel_x, 20))
-                pygame.draw.rect(screen, CREAM, (panel_x, 20, panel_w, panel_h), 2, border_radius=15)
-
-                align_y = 72
-
-                t1_txt_col = get_readable_color(team1_colors)
-                t2_txt_col = get_readable_color(team2_colors)
-
-                t1_short = TEAMS[TEAM_NAMES[selected_home_idx]]["short"]
-                t2_short = TEAMS[TEAM_NAMES[selected_away_idx]]["short"]
-
-                draw_text_with_outline(screen, t1_short, font_team, t1_txt_col, panel_x + 75, align_y - 30, "left", outline_col=WHITE)
-                draw_text_with_outline(screen, t2_short, font_team, t2_txt_col, panel_x + panel_w - 75, align_y - 30, "right", outline_col=WHITE)
-
-                t1_w, t1_h = font_team.size(t1_short)
-                for rc in range(red_cards_1):
-                    rc_x = panel_x + 75 + t1_w + 10 + rc * 15
-                    rc_y = align_y - 30 + t1_h // 2 - 8
-                    pygame.draw.rect(screen, RED_CARD_COLOR, (rc_x, rc_y, 10, 16))
-                    pygame.draw.rect(screen, WHITE, (rc_x, rc_y, 10, 16), 1)
-
-                for yc in range(yellow_cards_1):
-                    yc_x = panel_x + 55 - (yc * 15)
-                    yc_y = align_y - 30 + t1_h // 2 - 8
-                    pygame.draw.rect(screen, (255, 220, 0), (yc_x, yc_y, 10, 16))
-                    pygame.draw.rect(screen, WHITE, (yc_x, yc_y, 10, 16), 1)
-
-                t2_w, t2_h = font_team.size(t2_short)
-                for rc in range(red_cards_2):
-                    rc_x = panel_x + panel_w - 75 - t2_w - 20 - rc * 15
-                    rc_y = align_y - 30 + t2_h // 2 - 8
-                    pygame.draw.rect(screen, RED_CARD_COLOR, (rc_x, rc_y, 10, 16))
-                    pygame.draw.rect(screen, WHITE, (rc_x, rc_y, 10, 16), 1)
-
-                for yc in range(yellow_cards_2):
-                    yc_x = panel_x + panel_w - 65 + (yc * 15)
-                    yc_y = align_y - 30 + t2_h // 2 - 8
-                    pygame.draw.rect(screen, (255, 220, 0), (yc_x, yc_y, 10, 16))
-                    pygame.draw.rect(screen, WHITE, (yc_x, yc_y, 10, 16), 1)
-
-                center_score_x = WIDTH // 2
-                draw_text_with_outline(screen, str(score1), font_score, t1_txt_col, center_score_x - 50, align_y, outline_col=WHITE)
-                draw_text_with_outline(screen, "-", font_score, WHITE, center_score_x, align_y, outline_col=NAVY_DARK)
-                draw_text_with_outline(screen, str(score2), font_score, t2_txt_col, center_score_x + 50, align_y, outline_col=WHITE)
-
-                ui_mins = frame_counter // FRAMES_PER_SIM_MINUTE
+                ui_mins = match.frame_counter // FRAMES_PER_SIM_MINUTE
                 ui_sim_minute = ui_mins if state == "FIRST_HALF" else (45 + ui_mins)
 
                 time_str = ""
                 if state == "FIRST_HALF":
-                    if display_added_time: time_str = f"45+{ui_sim_minute - 45}'"
+                    if match.display_added_time: time_str = f"45+{ui_sim_minute - 45}'"
                     else: time_str = f"{ui_sim_minute}'"
                 elif state == "HALFTIME": time_str = LANG[current_lang]["HT"]
                 elif state == "SECOND_HALF":
-                    if display_added_time: time_str = f"90+{ui_sim_minute - 90}'"
+                    if match.display_added_time: time_str = f"90+{ui_sim_minute - 90}'"
                     else: time_str = f"{ui_sim_minute}'"
                 elif state == "FULLTIME": time_str = LANG[current_lang]["FT"]
 
-                draw_text_with_outline(screen, time_str, font_timer, BLACK, WIDTH//2, 102, outline_col=WHITE)
-
-                notif_duration = 200
-                def draw_event_list(events_list, x_pos, team_color, align_right=False):
-                    y_off = 130
-                    recent_event = None
-
-                    grouped_goals = {}
-                    display_order = []
-
-                    for event_data in events_list:
-                        t_str, e_type, scorer, ev_frame, ev_state = event_data
-                        is_new = (ev_state == state) and (0 <= (frame_counter - ev_frame) < notif_duration)
-
-                        if is_new:
-                            txt = f"{LANG[current_lang]['GOAL_EXCLAMATION']} {scorer} ({t_str})"
-                            recent_event = (txt, team_color)
-
-                        if scorer not in grouped_goals:
-                            grouped_goals[scorer] = [t_str]
-                            display_order.append(scorer)
-                        else:
-                            if t_str not in grouped_goals[scorer]:
-                                grouped_goals[scorer].append(t_str)
-
-                    visible_scorers = display_order[-5:]
-
-                    for scorer in visible_scorers:
-                        times = grouped_goals[scorer]
-                        times_str = ", ".join(times)
-                        display_str = f"{scorer} {times_str}"
-
-                        t_surf = font_goal_list.render(display_str, True, CREAM)
-                        draw_x = x_pos
-                        if align_right: draw_x = x_pos - t_surf.get_width()
-                        screen.blit(t_surf, (draw_x, y_off))
-
-                        y_off += 20
-                    return recent_event
-
-                recent1 = draw_event_list(goal_events_1, panel_x + 20, team1_colors[0], align_right=False)
-                recent2 = draw_event_list(goal_events_2, panel_x + panel_w - 20, team2_colors[0], align_right=True)
-
-                notif_y = 150
-                def draw_big_notif(txt, col, y):
-                    out_color = get_outline_color(col)
-                    draw_text_with_outline(screen, txt, font_notification, col, WIDTH//2, y + 20, outline_col=out_color)
-                    return y + 40
-
-                if recent1: notif_y = draw_big_notif(recent1[0], recent1[1], notif_y)
-                if recent2: notif_y = draw_big_notif(recent2[0], recent2[1], notif_y)
-
-                if goll_timer > 0 and state != "FULLTIME":
+                if ffa_match:
+                    # --- HERKES TEK: PUAN TABLOSU ---
+                    order = match.standings()
+                    rows = min(len(order), 10)
+                    panel_w, panel_h = 210, 40 + rows * 22
+                    table_surf = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
+                    pygame.draw.rect(table_surf, TABLE_BG, (0, 0, panel_w, panel_h), border_radius=15)
+                    screen.blit(table_surf, (WIDTH - panel_w - 15, 15))
+                    pygame.draw.rect(screen, CREAM, (WIDTH - panel_w - 15, 15, panel_w, panel_h), 2, border_radius=15)
+                    draw_text_with_outline(screen, time_str, font_timer, BLACK, WIDTH - 15 - panel_w // 2, 35, outline_col=WHITE)
+                    for row, i in enumerate(order[:rows]):
+                        b = match.balls[i]
+                        y = 55 + row * 22
+                        pygame.draw.circle(screen, b.color[0], (WIDTH - panel_w, y + 8), 7)
+                        pygame.draw.circle(screen, b.color[1], (WIDTH - panel_w, y + 8), 7, 2)
+                        screen.blit(font_goal_list.render(b.text, True, CREAM), (WIDTH - panel_w + 15, y))
+                        score_surf = font_goal_list.render(str(match.scores[i]), True, CREAM)
+                        screen.blit(score_surf, (WIDTH - 30 - score_surf.get_width(), y))
+                else:
+                    # --- UI PANEL DRAWING ---
+                    panel_w, panel_h = 500, 105
+                    panel_x = WIDTH // 2 - panel_w // 2
+                    table_surf = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
+                    pygame.draw.rect(table_surf, TABLE_BG, (0, 0, panel_w, panel_h), border_radius=15)
+                    screen.blit(table_surf, (panel_x, 20))
+                    pygame.draw.rect(screen, CREAM, (panel_x, 20, panel_w, panel_h), 2, border_radius=15)
+
+                    align_y = 72
+
+                    t1_txt_col = get_readable_color(match.team1_colors)
+                    t2_txt_col = get_readable_color(match.team2_colors)
+
+                    t1_short = match.team1_name
+                    t2_short = match.team2_name
+
+                    draw_text_with_outline(screen, t1_short, font_team, t1_txt_col, panel_x + 75, align_y - 30, "left", outline_col=WHITE)
+                    draw_text_with_outline(screen, t2_short, font_team, t2_txt_col, panel_x + panel_w - 75, align_y - 30, "right", outline_col=WHITE)
+
+                    t1_w, t1_h = font_team.size(t1_short)
+                    for rc in range(match.red_cards_1):
+                        rc_x = panel_x + 75 + t1_w + 10 + rc * 15
+                        rc_y = align_y - 30 + t1_h // 2 - 8
+                        pygame.draw.rect(screen, RED_CARD_COLOR, (rc_x, rc_y, 10, 16))
+                        pygame.draw.rect(screen, WHITE, (rc_x, rc_y, 10, 16), 1)
+
+                    for yc in range(match.yellow_cards_1):
+                        yc_x = panel_x + 55 - (yc * 15)
+                        yc_y = align_y - 30 + t1_h // 2 - 8
+                        pygame.draw.rect(screen, (255, 220, 0), (yc_x, yc_y, 10, 16))
+                        pygame.draw.rect(screen, WHITE, (yc_x, yc_y, 10, 16), 1)
+
+                    t2_w, t2_h = font_team.size(t2_short)
+                    for rc in range(match.red_cards_2):
+                        rc_x = panel_x + panel_w - 75 - t2_w - 20 - rc * 15
+                        rc_y = align_y - 30 + t2_h // 2 - 8
+                        pygame.draw.rect(screen, RED_CARD_COLOR, (rc_x, rc_y, 10, 16))
+                        pygame.draw.rect(screen, WHITE, (rc_x, rc_y, 10, 16), 1)
+
+                    for yc in range(match.yellow_cards_2):
+                        yc_x = panel_x + panel_w - 65 + (yc * 15)
+                        yc_y = align_y - 30 + t2_h // 2 - 8
+                        pygame.draw.rect(screen, (255, 220, 0), (yc_x, yc_y, 10, 16))
+                        pygame.draw.rect(screen, WHITE, (yc_x, yc_y, 10, 16), 1)
+
+                    center_score_x = WIDTH // 2
+                    draw_text_with_outline(screen, str(match.score1), font_score, t1_txt_col, center_score_x - 50, align_y, outline_col=WHITE)
+                    draw_text_with_outline(screen, "-", font_score, WHITE, center_score_x, align_y, outline_col=NAVY_DARK)
+                    draw_text_with_outline(screen, str(match.score2), font_score, t2_txt_col, center_score_x + 50, align_y, outline_col=WHITE)
+
+                    draw_text_with_outline(screen, time_str, font_timer, BLACK, WIDTH//2, 102, outline_col=WHITE)
+
+                    notif_duration = 200
+                    def draw_event_list(events_list, x_pos, team_color, align_right=False):
+                        y_off = 130
+                        recent_event = None
+
+                        grouped_goals = {}
+                        display_order = []
+
+                        for event_data in events_list:
+                            t_str, e_type, scorer, ev_frame, ev_state = event_data
+                            is_new = (ev_state == state) and (0 <= (match.frame_counter - ev_frame) < notif_duration)
+
+                            if is_new:
+                                txt = f"{LANG[current_lang]['GOAL_EXCLAMATION']} {scorer} ({t_str})"
+                                recent_event = (txt, team_color)
+
+                            if scorer not in grouped_goals:
+                                grouped_goals[scorer] = [t_str]
+                                display_order.append(scorer)
+                            else:
+                                if t_str not in grouped_goals[scorer]:
+                                    grouped_goals[scorer].append(t_str)
+
+                        visible_scorers = display_order[-5:]
+
+                        for scorer in visible_scorers:
+                            times = grouped_goals[scorer]
+                            times_str = ", ".join(times)
+                            display_str = f"{scorer} {times_str}"
+
+                            t_surf = font_goal_list.render(display_str, True, CREAM)
+                            draw_x = x_pos
+                            if align_right: draw_x = x_pos - t_surf.get_width()
+                            screen.blit(t_surf, (draw_x, y_off))
+
+                            y_off += 20
+                        return recent_event
+
+                    recent1 = draw_event_list(match.goal_events_1, panel_x + 20, match.team1_colors[0], align_right=False)
+                    recent2 = draw_event_list(match.goal_events_2, panel_x + panel_w - 20, match.team2_colors[0], align_right=True)
+
+                    notif_y = 150
+                    def draw_big_notif(txt, col, y):
+                        out_color = get_outline_color(col)
+                        draw_text_with_outline(screen, txt, font_notification, col, WIDTH//2, y + 20, outline_col=out_color)
+                        return y + 40
+
+                    if recent1: notif_y = draw_big_notif(recent1[0], recent1[1], notif_y)
+                    if recent2: notif_y = draw_big_notif(recent2[0], recent2[1], notif_y)
+
+                if in_replay:
+                    draw_text_with_outline(screen, LANG[current_lang]["REPLAY"], font_event, CREAM, center_x, 140, outline_col=NAVY_DARK)
+                elif match.goll_timer > 0 and state != "FULLTIME":
                     goll_surf = font_goll_msg.render(LANG[current_lang]["GOAL_EXCLAMATION"], True, goal_text_color)
                     out_color = get_outline_color(goal_text_color)
                     outline_surf = font_goll_msg.render(LANG[current_lang]["GOAL_EXCLAMATION"], True, out_color)
@@ -1921,13 +1773,19 @@ while running:
                     screen.blit(outline_surf, (gx+4, gy+4))
                     screen.blit(goll_surf, (gx, gy))
 
+                if turbo != 1 and state != "FULLTIME":
+                    turbo_txt = font_settings.render(f"{turbo}x" if turbo else "MAX", True, CREAM)
+                    screen.blit(turbo_txt, (WIDTH - turbo_txt.get_width() - 15, HEIGHT - 30))
+
                 if state == "HALFTIME":
                     draw_text_with_outline(screen, LANG[current_lang]["HALF_TIME"], font_event, CREAM, center_x, center_y, outline_col=NAVY_DARK)
                 elif state == "FULLTIME":
                     draw_text_with_outline(screen, LANG[current_lang]["FULL_TIME"], font_event, CREAM, center_x, center_y, outline_col=NAVY_DARK)
+                    if match.penalties:
+                        pen_str = f"{LANG[current_lang]['PENALTIES']} {match.penalties[0]} - {match.penalties[1]}"
+                        draw_text_with_outline(screen, pen_str, font_menu_title, CREAM, center_x, center_y + 50, outline_col=NAVY_DARK)
 
-                    if cinematic_timer <= 0:
-                        end_match_timer += 1
+                    if match.cinematic_timer <= 0:
                         if end_match_timer > 3 * FPS:
                             restart_btn_rect = pygame.Rect(WIDTH//2 - 150, HEIGHT - 100, 300, 60)
                             pygame.draw.rect(screen, GRASS_1, restart_btn_rect, border_radius=15)
@@ -1937,16 +1795,15 @@ while running:
                             screen.blit(restart_txt, restart_txt_rect)
 
         shake_x, shake_y = 0, 0
-        if screen_shake_timer > 0:
+        if screen_shake_timer > 0 and not (match and goal_replay.active):
             shake_intensity = int((screen_shake_timer / 45) * 25)
-            shake_x = random.randint(-shake_intensity, shake_intensity)
-            shake_y = random.randint(-shake_intensity, shake_intensity)
-            screen_shake_timer -= 1
+            shake_x = match.fx_rng.randint(-shake_intensity, shake_intensity)
+            shake_y = match.fx_rng.randint(-shake_intensity, shake_intensity)
 
         main_screen.fill(NAVY_DARK)
         main_screen.blit(screen, (shake_x, shake_y))
 
     pygame.display.flip()
-    clock.tick(FPS)
+    frame_ms = clock.tick(RENDER_FPS)
 
 pygame.quit()
\ No newline at end of file
@@ -0,0 +1,443 @@
+import math
+import random
+import numpy as np
+
+from futbol_teams import get_random_player_name
+from futbol_engine import (
+    FPS, FRAMES_PER_SIM_MINUTE, ARENA_RADIUS, BALL_RADIUS, GOAL_WIDTH_RADIANS, POST_RADIUS,
+    SPEED, MIN_SPEED, GRAVITY, BOUNCE_DAMPING, FRICTION, ELASTICITY, POST_ELASTICITY,
+    GOAL_ROT_SPEED, CENTER_X, CENTER_Y, PERIODS, PENALTY_CONVERSION, RED_CARD_CHANCE, YELLOW_CARD_CHANCE,
+    MatchResult,
+)
+
+# =====================================================================
+#                        1. BATCH CONFIGURATION
+# =====================================================================
+# Lockstep version of futbol_engine.MatchSimulator: N matches advance one
+# frame at a time, every quantity is an array and every branch of the
+# scalar code becomes a mask. Ball index 0 is the home ball, 1 the away one.
+SUBSTEPS = 8
+INWARD_OFFSET = 22
+CARD_W, CARD_H = 16, 24
+CARD_LIFE = 10 * FRAMES_PER_SIM_MINUTE
+NERF_FRAMES = 20 * FRAMES_PER_SIM_MINUTE
+
+# Card timeline as in MatchSimulator: per-period gaps (geometric, in frames)
+# drawn at kickoff. A gap starts when the pitch is clear of that card (at
+# kickoff, or when the card expires or is picked up) and next_card holds
+# the frame the card is due; NEVER while one is out or none are left.
+MAX_YELLOWS = 3
+NEVER = np.iinfo(np.int32).max
+
+WALL_DIST_SQ = (ARENA_RADIUS - BALL_RADIUS) ** 2
+BALL_DIST_SQ = (2 * BALL_RADIUS) ** 2
+
+PLAYING, DONE = 0, 2
+PERIOD_STATES = list(PERIODS)
+PERIOD_START = np.array([PERIODS[p][0] for p in PERIOD_STATES])
+PERIOD_LENGTH = np.array([PERIODS[p][1] - PERIODS[p][0] for p in PERIOD_STATES])
+# INTRO + kickoff delay + HALFTIME frames the scalar engine steps through
+# without physics; added back so MatchResult.frames means the same thing.
+IDLE_FRAMES = int(1.0 * FPS) + int(0.5 * FPS) + int(1.5 * FPS)
+
+# =====================================================================
+#                        2. BATCH SIMULATOR
+# =====================================================================
+class BatchSimulator:
+    def __init__(self, home_keys, away_keys, seed=None, cx=CENTER_X, cy=CENTER_Y, knockout=False):
+        self.home_keys = list(home_keys)
+        self.knockout = knockout
+        self.away_keys = list(away_keys)
+        n = self.n = len(self.home_keys)
+        self.rng = np.random.default_rng(seed)
+        # Scorer names are drawn per goal in results(); a private stream keeps
+        # them tied to the batch seed instead of the global random module.
+        self.name_rng = random.Random(int(self.rng.integers(2 ** 32)))
+        self.cx, self.cy = cx, cy
+        rng = self.rng
+
+        self.x = np.zeros((n, 2))
+        self.y = np.zeros((n, 2))
+        self.respawn(np.ones(n, dtype=bool))
+        self.vx = rng.choice([-SPEED, SPEED], size=(n, 2))
+        self.vy = rng.choice([-SPEED, SPEED], size=(n, 2))
+        self.nerf_timer = np.zeros((n, 2), dtype=np.int32)
+        self.yellow_nerf_timer = np.zeros((n, 2), dtype=np.int32)
+
+        self.goal_angle = np.full(n, math.pi / 2)
+        self.goal_rotating = np.zeros(n, dtype=bool)
+        self.score = np.zeros((n, 2), dtype=np.int32)
+        self.half = np.zeros(n, dtype=np.int32)       # index into PERIOD_STATES
+        self.status = np.full(n, PLAYING, dtype=np.int32)
+        self.frame_counter = np.zeros(n, dtype=np.int32)
+        self.added_time = np.zeros((n, len(PERIOD_STATES)), dtype=np.int64)
+        self.added_time[:, 0] = rng.integers(2, 5, n)
+        self.added_time[:, 1] = rng.integers(3, 9, n)
+        self.penalties = np.zeros((n, 2), dtype=np.int32)
+        self.shootout = np.zeros(n, dtype=bool)
+
+        self.red_cards = np.zeros((n, 2), dtype=np.int32)
+        self.yellow_cards = np.zeros((n, 2), dtype=np.int32)
+        self.card_gaps = np.zeros((n, 1 + MAX_YELLOWS), dtype=np.int64)
+        self.gaps_left = np.zeros((n, 2), dtype=np.int32)
+        self.gap_index = np.zeros((n, 2), dtype=np.int32)
+        self.next_card = np.full((n, 2), NEVER, dtype=np.int64)
+        self.schedule_cards(np.ones(n, dtype=bool))
+        # card arrays, column 0 = red card, column 1 = yellow card
+        self.card_active = np.zeros((n, 2), dtype=bool)
+        self.card_x = np.zeros((n, 2))
+        self.card_y = np.zeros((n, 2))
+        self.card_vx = np.zeros((n, 2))
+        self.card_vy = np.zeros((n, 2))
+        self.card_life = np.zeros((n, 2), dtype=np.int32)
+
+        self.post_hits = np.zeros(n, dtype=np.int32)
+        self.goal_log = []   # (match, side, half, frame_counter, period ended this frame)
+        self.frames = 0
+        self.end_frame = np.zeros(n, dtype=np.int32)
+
+    # --- spawning -----------------------------------------------------
+    def respawn(self, mask):
+        # get_random_spawn: rejection sampling on the integer grid, per ball
+        for b in range(2):
+            todo = mask.copy()
+            while todo.any():
+                k = int(todo.sum())
+                rx = self.rng.integers(self.cx - 150, self.cx + 151, k)
+                ry = self.rng.integers(self.cy - 200, self.cy + 51, k)
+                ok = np.hypot(rx - self.cx, ry - self.cy) < ARENA_RADIUS - BALL_RADIUS - 10
+                idx = np.flatnonzero(todo)[ok]
+                self.x[idx, b] = rx[ok]
+                self.y[idx, b] = ry[ok]
+                todo[idx] = False
+
+    def spawn_cards(self, col, mask):
+        k = int(mask.sum())
+        if k == 0: return
+        angle = self.rng.uniform(0, 2 * math.pi, k)
+        dist = np.sqrt(self.rng.random(k)) * (ARENA_RADIUS - 60)
+        self.card_x[mask, col] = self.cx + np.cos(angle) * dist
+        self.card_y[mask, col] = self.cy + np.sin(angle) * dist
+        self.card_vx[mask, col] = self.rng.uniform(-0.4, 0.4, k)
+        self.card_vy[mask, col] = self.rng.uniform(-0.4, 0.4, k)
+        self.card_life[mask, col] = CARD_LIFE
+        self.card_active[mask, col] = True
+
+    # --- clock --------------------------------------------------------
+    def schedule_cards(self, mask):
+        # Column 0 of card_gaps is the red card's gap, 1.. the yellows'
+        k = int(mask.sum())
+        red_p = np.where(self.half[mask] == 0, RED_CARD_CHANCE[0], RED_CARD_CHANCE[1])
+        self.card_gaps[mask, 0] = self.rng.geometric(red_p)
+        self.card_gaps[mask, 1:] = self.rng.geometric(YELLOW_CARD_CHANCE, (k, MAX_YELLOWS))
+        self.gaps_left[mask, 0] = 1
+        self.gaps_left[mask, 1] = self.rng.integers(1, MAX_YELLOWS + 1, k)
+        self.gap_index[mask] = 0
+        for col in range(2):
+            self.start_gap(mask, col)
+
+    def start_gap(self, mask, col):
+        # Called once the pitch is clear of card col; the frame counter is
+        # the last frame played, so a gap of 1 drops the card next frame
+        idx = np.flatnonzero(mask)
+        has = self.gaps_left[idx, col] > 0
+        self.next_card[idx[~has], col] = NEVER
+        idx = idx[has]
+        self.next_card[idx, col] = self.frame_counter[idx] + self.card_gaps[idx, col + self.gap_index[idx, col]]
+        self.gap_index[idx, col] += 1
+        self.gaps_left[idx, col] -= 1
+
+    def update_clock(self, live):
+        self.frame_counter[live] += 1
+        mins = self.frame_counter // FRAMES_PER_SIM_MINUTE
+
+        for col in range(2):
+            due = live & (self.frame_counter >= self.next_card[:, col])
+            if due.any():
+                self.spawn_cards(col, due)
+                self.next_card[due, col] = NEVER
+
+        added = self.added_time[np.arange(self.n), self.half]
+        ended = live & (mins >= PERIOD_LENGTH[self.half] + added)
+        level = self.score[:, 0] == self.score[:, 1]
+        extra = self.knockout & level & ((self.half == 1) | (self.half == 2))
+        final = ended & ~(self.half == 0) & ~extra
+        return ended & ~final, final
+
+    def next_period(self, mask):
+        # HALFTIME / extra time: clear cards, reset the clock, draw the card timeline, respawn
+        if not mask.any(): return
+        self.half[mask] += 1
+        self.frame_counter[mask] = 0
+        self.card_active[mask] = False
+        self.schedule_cards(mask)
+        self.respawn(mask)
+
+    def finish(self, final):
+        if not final.any(): return
+        if self.knockout:
+            pens = final & (self.score[:, 0] == self.score[:, 1])
+            if pens.any():
+                self.penalties[pens] = penalty_shootouts(self.rng, int(pens.sum()))
+                self.shootout |= pens
+        self.status[final] = DONE
+        self.end_frame[final] = self.frames
+
+    # --- physics ------------------------------------------------------
+    def update_cards(self, live):
+        act = self.card_active & live[:, None]
+        if not act.any(): return
+        self.card_life[act] -= 1
+        expired = act & (self.card_life <= 0)
+        self.card_active[expired] = False
+        for col in range(2):
+            if expired[:, col].any(): self.start_gap(expired[:, col], col)
+        act &= ~expired
+
+        self.card_x += np.where(act, self.card_vx, 0.0)
+        self.card_y += np.where(act, self.card_vy, 0.0)
+        bounce = act & (np.hypot(self.card_x - self.cx, self.card_y - self.cy) > ARENA_RADIUS - 50)
+        self.card_vx[bounce] *= -1
+        self.card_vy[bounce] *= -1
+
+        left = np.floor(self.card_x) - CARD_W // 2
+        top = np.floor(self.card_y) - CARD_H // 2
+        for b in range(2):
+            bx, by = self.x[:, b:b+1], self.y[:, b:b+1]
+            dx = bx - np.clip(bx, left, left + CARD_W)
+            dy = by - np.clip(by, top, top + CARD_H)
+            hit = act & (dx * dx + dy * dy < BALL_RADIUS ** 2)
+            if not hit.any(): continue
+            act &= ~hit
+            self.card_active[hit] = False
+            for col in range(2):
+                if hit[:, col].any(): self.start_gap(hit[:, col], col)
+            self.red_cards[:, b] += hit[:, 0]
+            self.yellow_cards[:, b] += hit[:, 1]
+            self.nerf_timer[hit[:, 0], b] = NERF_FRAMES
+            self.yellow_nerf_timer[hit[:, 1], b] = NERF_FRAMES
+
+    def move(self, live):
+        lv = live[:, None]
+        self.vy += np.where(lv, GRAVITY, 0.0)
+
+        nerfed = lv & (self.nerf_timer > 0)
+        yellowed = lv & ~nerfed & (self.yellow_nerf_timer > 0)
+        self.nerf_timer -= nerfed
+        self.yellow_nerf_timer -= yellowed
+        mult = np.where(nerfed | yellowed, 0.8, 1.0)
+
+        fr = np.where(lv, FRICTION, 1.0)
+        self.vx *= fr
+        self.vy *= fr
+        speed = np.hypot(self.vx, self.vy)
+        min_speed = MIN_SPEED * mult
+
+        slow = lv & (speed < min_speed) & (speed > 0)
+        scale = np.where(slow, min_speed / np.where(speed > 0, speed, 1.0), 1.0)
+        self.vx *= scale
+        self.vy *= scale
+        still = lv & (speed == 0)
+        if still.any():
+            k = int(still.sum())
+            self.vx[still] = self.rng.choice([-1, 1], k) * min_speed[still]
+            self.vy[still] = self.rng.choice([-1, 1], k) * min_speed[still]
+
+        self.x += np.where(lv, self.vx, 0.0)
+        self.y += np.where(lv, self.vy, 0.0)
+
+    # Contact tests run on every match, the response only on the few that
+    # actually touch (gather -> resolve -> scatter), which keeps the
+    # substep loop cheap when N is large.
+    def collide_post(self, b, px, py, live):
+        dx = self.x[:, b] - px
+        dy = self.y[:, b] - py
+        dist = np.hypot(dx, dy)
+        m = np.flatnonzero(live & (dist < BALL_RADIUS + POST_RADIUS))
+        if m.size == 0: return m
+        nx, ny = dx[m] / dist[m], dy[m] / dist[m]
+        vx, vy = self.vx[m, b], self.vy[m, b]
+        dot = vx * nx + vy * ny
+        hit = dot < 0
+        m, nx, ny, dot = m[hit], nx[hit], ny[hit], dot[hit]
+        self.vx[m, b] = (vx[hit] - 2 * dot * nx) * POST_ELASTICITY
+        self.vy[m, b] = (vy[hit] - 2 * dot * ny) * POST_ELASTICITY
+        overlap = BALL_RADIUS + POST_RADIUS - dist[m]
+        self.x[m, b] += nx * overlap
+        self.y[m, b] += ny * overlap
+        return m
+
+    def collide_wall(self, idx):
+        dx = self.x[idx] - self.cx
+        dy = self.y[idx] - self.cy
+        k, b = np.nonzero(dx * dx + dy * dy >= WALL_DIST_SQ)
+        if k.size == 0: return k
+        m = idx[k]
+        dx, dy = dx[k, b], dy[k, b]
+        d = np.hypot(dx, dy)
+        nx, ny = dx / d, dy / d
+        vx, vy = self.vx[m, b], self.vy[m, b]
+        dot = vx * nx + vy * ny
+        bounce = np.where(self.rng.random(m.size) < 0.15, 1.05, BOUNCE_DAMPING)
+        out = dot > 0
+        self.vx[m, b] = np.where(out, (vx - 2 * dot * nx) * bounce, vx)
+        self.vy[m, b] = np.where(out, (vy - 2 * dot * ny) * bounce, vy)
+        overlap = d + BALL_RADIUS - ARENA_RADIUS
+        self.x[m, b] -= nx * overlap
+        self.y[m, b] -= ny * overlap
+        return m
+
+    def resolve_collisions(self, idx):
+        dx = self.x[idx, 1] - self.x[idx, 0]
+        dy = self.y[idx, 1] - self.y[idx, 0]
+        k = np.flatnonzero(dx * dx + dy * dy < BALL_DIST_SQ)
+        if k.size == 0: return k
+        m = idx[k]
+        dx, dy = dx[k], dy[k]
+        d = np.hypot(dx, dy)
+        d[d == 0] = 0.1
+        nx, ny = dx / d, dy / d
+        half_overlap = (2 * BALL_RADIUS - d) * 0.5
+        self.x[m, 0] -= nx * half_overlap
+        self.y[m, 0] -= ny * half_overlap
+        self.x[m, 1] += nx * half_overlap
+        self.y[m, 1] += ny * half_overlap
+
+        van = (self.vx[m, 1] - self.vx[m, 0]) * nx + (self.vy[m, 1] - self.vy[m, 0]) * ny
+        j = np.where(van <= 0, -(1 + ELASTICITY) * van / 2.0, 0.0)
+        self.vx[m, 0] -= j * nx
+        self.vy[m, 0] -= j * ny
+        self.vx[m, 1] += j * nx
+        self.vy[m, 1] += j * ny
+        return m
+
+    def check_goals(self, live, ended):
+        for b in range(2):
+            dx = self.x[:, b] - self.cx
+            dy = self.y[:, b] - self.cy
+            m = np.flatnonzero(live & (np.hypot(dx, dy) > ARENA_RADIUS - BALL_RADIUS - 5))
+            if m.size == 0: continue
+            diff = np.abs(np.mod(np.arctan2(dy[m], dx[m]), 2 * math.pi) - np.mod(self.goal_angle[m], 2 * math.pi))
+            diff = np.where(diff > math.pi, 2 * math.pi - diff, diff)
+            m = m[diff < GOAL_WIDTH_RADIANS / 2]
+            if m.size == 0: continue
+
+            for g in m:
+                self.goal_log.append((int(g), b, int(self.half[g]), int(self.frame_counter[g]), bool(ended[g])))
+            self.score[m, b] += 1
+            self.x[m, b] = self.cx
+            self.y[m, b] = self.cy
+            self.goal_rotating[m] = True
+            k = (m.size, 2)
+            self.vx[m] = self.rng.choice([-SPEED, SPEED], k) * self.rng.uniform(0.8, 1.2, k)
+            self.vy[m] = self.rng.choice([-SPEED, SPEED], k) * self.rng.uniform(0.8, 1.2, k)
+
+    def step(self):
+        live = self.status == PLAYING
+        self.frames += 1
+        ended, final = self.update_clock(live)
+        in_play = live & ~final
+
+        self.goal_angle = np.where(live & self.goal_rotating,
+                                   np.mod(self.goal_angle + GOAL_ROT_SPEED, 2 * math.pi), self.goal_angle)
+        self.update_cards(live & ~ended & ~final)
+
+        gx = self.cx + np.cos(self.goal_angle) * (ARENA_RADIUS - INWARD_OFFSET)
+        gy = self.cy + np.sin(self.goal_angle) * (ARENA_RADIUS - INWARD_OFFSET)
+        half_width = GOAL_WIDTH_RADIANS * ARENA_RADIUS / 2
+        pdx = np.cos(self.goal_angle + math.pi / 2) * half_width
+        pdy = np.sin(self.goal_angle + math.pi / 2) * half_width
+
+        self.move(live)
+        for b in range(2):
+            hit = np.zeros(self.n, dtype=bool)
+            hit[self.collide_post(b, gx - pdx, gy - pdy, live)] = True
+            hit[self.collide_post(b, gx + pdx, gy + pdy, live)] = True
+            self.post_hits += hit & in_play
+
+        # Positions only change inside the substep loop through contacts, so a
+        # match that touched nothing in one pass cannot touch anything in the
+        # next: later passes only revisit the matches that did.
+        idx = np.flatnonzero(live)
+        for _ in range(SUBSTEPS):
+            if idx.size == 0: break
+            idx = np.union1d(self.collide_wall(idx), self.resolve_collisions(idx))
+
+        self.check_goals(in_play, ended)
+        self.next_period(ended)
+        self.finish(final)
+
+    def run(self):
+        while (self.status != DONE).any():
+            self.step()
+        return self.results()
+
+    # --- results ------------------------------------------------------
+    def results(self):
+        events = [([], []) for _ in range(self.n)]
+        for m, b, half, frame, ended in self.goal_log:
+            state = PERIOD_STATES[half]
+            base = PERIODS[state][1]
+            sim_minute = frame // FRAMES_PER_SIM_MINUTE + PERIODS[state][0]
+            mark = f"{base}+{sim_minute - base}'" if sim_minute > base else f"{sim_minute}'"
+            if ended:
+                # MatchSimulator ends the period in update_clock, before the
+                # physics: the goal belongs to HALFTIME (or the new extra-time
+                # period, clock reset) and gets a plain minute
+                mark = f"{sim_minute}'"
+                if half == 0: state = "HALFTIME"
+                else: state, frame = PERIOD_STATES[half + 1], 0
+            key = self.away_keys[m] if b else self.home_keys[m]
+            events[m][b].append((mark, "GOAL", get_random_player_name(key, rng=self.name_rng), frame, state))
+
+        return [MatchResult(
+            self.home_keys[m], self.away_keys[m], int(self.score[m, 0]), int(self.score[m, 1]),
+            events[m][0], events[m][1],
+            int(self.yellow_cards[m, 0]), int(self.yellow_cards[m, 1]),
+            int(self.red_cards[m, 0]), int(self.red_cards[m, 1]),
+            int(self.end_frame[m]) + IDLE_FRAMES,
+            tuple(int(p) for p in self.penalties[m]) if self.shootout[m] else None,
+        ) for m in range(self.n)]
+
+def penalty_shootouts(rng, n):
+    # Vectorized futbol_engine.penalty_shootout: five kicks each with early
+    # stopping, then sudden-death rounds until every shoot-out is decided.
+    goals = np.zeros((n, 2), dtype=np.int32)
+    open_ = np.ones(n, dtype=bool)
+    for kick in range(10):
+        side = kick % 2
+        goals[:, side] += open_ & (rng.random(n) < PENALTY_CONVERSION)
+        left0 = 5 - (kick + 2) // 2
+        left1 = 5 - (kick + 1) // 2
+        open_ &= ~((goals[:, 0] + left0 < goals[:, 1]) | (goals[:, 1] + left1 < goals[:, 0]))
+    open_ &= goals[:, 0] == goals[:, 1]
+    while open_.any():
+        goals[open_] += rng.random((int(open_.sum()), 2)) < PENALTY_CONVERSION
+        open_ &= goals[:, 0] == goals[:, 1]
+    return goals
+
+def simulate_batch(home_keys, away_keys, seed=None, knockout=False):
+    return BatchSimulator(home_keys, away_keys, seed, knockout=knockout).run()
+
+if __name__ == "__main__":
+    import sys
+    import time
+    from futbol_engine import simulate_match
+    from futbol_teams import TEAM_NAMES
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    home, away = TEAM_NAMES[0], TEAM_NAMES[1]
+
+    t0 = time.perf_counter()
+    results = simulate_batch([home] * n, [away] * n, seed=1)
+    batch_s = time.perf_counter() - t0
+
+    scalar_n = min(n, 50)
+    t0 = time.perf_counter()
+    scalar = [simulate_match(home, away) for _ in range(scalar_n)]
+    scalar_s = time.perf_counter() - t0
+
+    goals = sum(r.score1 + r.score2 for r in results) / n
+    scalar_goals = sum(r.score1 + r.score2 for r in scalar) / scalar_n
+    print(f"batch : {n} matches in {batch_s:.2f}s  ({n / batch_s:,.0f} matches/s, {goals:.2f} goals/match)")
+    print(f"scalar: {scalar_n} matches in {scalar_s:.2f}s  ({scalar_n / scalar_s:,.0f} matches/s, {scalar_goals:.2f} goals/match)")
@@ -0,0 +1,122 @@
+import argparse
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+
+import futbol_engine
+from futbol_engine import ENGINE_VERSION, MatchResult, MatchSimulator
+
+# =====================================================================
+#                        1. CACHE KEYS
+# =====================================================================
+# Every engine global a result depends on. Values are read at call time, so
+# constants patched by futbol_sweep.apply_constants produce different keys.
+CONSTANT_NAMES = [
+    "FPS", "FRAMES_PER_SIM_MINUTE", "ARENA_RADIUS", "BALL_RADIUS", "GOAL_WIDTH_RADIANS",
+    "POST_RADIUS", "SPEED", "MIN_SPEED", "GRAVITY", "BOUNCE_DAMPING", "FRICTION",
+    "ELASTICITY", "POST_ELASTICITY", "GOAL_ROT_SPEED", "PERIODS", "PENALTY_CONVERSION",
+    "RED_CARD_CHANCE", "YELLOW_CARD_CHANCE", "SUBSTEPS", "ADAPTIVE_MIN_SUBSTEPS",
+    "ADAPTIVE_MAX_SUBSTEPS",
+]
+
+def constants_hash():
+    block = {name: getattr(futbol_engine, name) for name in CONSTANT_NAMES}
+    return hashlib.sha256(repr(sorted(block.items())).encode()).hexdigest()[:16]
+
+def result_key(home_key, away_key, seed, knockout=False):
+    raw = json.dumps([home_key, away_key, seed, knockout, constants_hash(), ENGINE_VERSION])
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+# =====================================================================
+#                        2. SERIALISATION
+# =====================================================================
+def encode_result(res):
+    return json.dumps(res._asdict(), ensure_ascii=False)
+
+def decode_result(text):
+    d = json.loads(text)
+    for side in ("goal_events_1", "goal_events_2"):
+        d[side] = [tuple(ev) for ev in d[side]]
+    if d["penalties"] is not None: d["penalties"] = tuple(d["penalties"])
+    return MatchResult(**d)
+
+# =====================================================================
+#                        3. RESULT CACHE
+# =====================================================================
+class ResultCache:
+    # Bounded LRU in memory in front of an optional directory of JSON files
+    # (one per key, sharded by the first two hex digits of the key).
+    def __init__(self, path=None, capacity=4096):
+        self.path = path
+        self.capacity = capacity
+        self.memory = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def file_for(self, key):
+        return os.path.join(self.path, key[:2], key + ".json")
+
+    def get(self, key):
+        if key in self.memory:
+            self.memory.move_to_end(key)
+            self.hits += 1
+            return self.memory[key]
+        if self.path and os.path.exists(self.file_for(key)):
+            with open(self.file_for(key), encoding="utf-8") as f:
+                res = decode_result(f.read())
+            self.remember(key, res)
+            self.disk_hits += 1
+            return res
+        self.misses += 1
+        return None
+
+    def remember(self, key, res):
+        self.memory[key] = res
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.capacity:
+            self.memory.popitem(last=False)
+
+    def put(self, key, res):
+        self.remember(key, res)
+        if not self.path: return
+        target = self.file_for(key)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        # Write to a temp file and rename so readers never see half a result
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(target), suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(encode_result(res))
+        os.replace(tmp, target)
+
+    def match(self, home_key, away_key, seed, knockout=False):
+        key = result_key(home_key, away_key, seed, knockout)
+        res = self.get(key)
+        if res is None:
+            res = MatchSimulator(home_key, away_key, seed=seed, knockout=knockout).run()
+            self.put(key, res)
+        return res
+
+    def stats(self):
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            "hits": self.hits, "disk_hits": self.disk_hits, "misses": self.misses,
+            "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+            "size": len(self.memory),
+        }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cached match results")
+    parser.add_argument("home")
+    parser.add_argument("away")
+    parser.add_argument("seeds", type=int, nargs="+")
+    parser.add_argument("--cache-dir", default=".futbol_cache")
+    parser.add_argument("--knockout", action="store_true")
+    args = parser.parse_args()
+
+    cache = ResultCache(args.cache_dir)
+    for seed in args.seeds:
+        res = cache.match(args.home, args.away, seed, args.knockout)
+        print(f"seed {seed}: {args.home} {res.score1} - {res.score2} {args.away}")
+    print(cache.stats())
@@ -0,0 +1,139 @@
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+import numpy as np
+
+from futbol_teams import TEAM_NAMES
+from futbol_engine import MatchSimulator, match_winner
+
+# =====================================================================
+#                        1. BRACKET
+# =====================================================================
+# Single elimination. Tie (r, i) of round r is played between the winners
+# of ties (r-1, 2i) and (r-1, 2i+1); round 0 pairs draw[2i] with draw[2i+1].
+BRACKET_SIZES = [16, 32, 64]
+
+def draw_bracket(size, seed=0, pool=None):
+    return random.Random(seed).sample(list(pool or TEAM_NAMES), size)
+
+def round_names(size):
+    names = []
+    teams = size
+    while teams >= 1:
+        names.append({8: "QF", 4: "SF", 2: "F", 1: "W"}.get(teams, f"R{teams}"))
+        teams //= 2
+    return names
+
+# =====================================================================
+#                        2. TIE WORKER
+# =====================================================================
+# One task plays the same tie of the bracket for a group of replicas; home
+# and away keys can differ per replica once earlier rounds have been played.
+def play_ties(home_keys, away_keys, seed, engine="batch"):
+    if engine == "batch":
+        from futbol_batch import simulate_batch
+        results = simulate_batch(home_keys, away_keys, seed=seed, knockout=True)
+    else:
+        # seed is the tie_seed of this task; every replica gets its own match seed from it
+        seeds = np.random.SeedSequence(seed).generate_state(len(home_keys)).tolist()
+        results = [MatchSimulator(h, a, knockout=True, seed=s).run() for h, a, s in zip(home_keys, away_keys, seeds)]
+    return [r.away if match_winner(r) else r.home for r in results]
+
+def tie_seed(seed, group, rnd, slot):
+    return int(np.random.SeedSequence([seed, group, rnd, slot]).generate_state(1)[0])
+
+# =====================================================================
+#                        3. DEPENDENCY-DRIVEN SCHEDULER
+# =====================================================================
+class CupStats:
+    def __init__(self, draw):
+        self.draw = draw
+        self.rounds = round_names(len(draw))
+        self.replicas = 0
+        self.ties = 0
+        # reach[team][r]: how often the team got to round r (r=0 is everyone)
+        self.reach = {team: np.zeros(len(self.rounds)) for team in draw}
+        self.pending = {}
+
+    def add(self, group, rnd, winners):
+        # Counts of a group are held back until its final is played, so the
+        # running table only ever covers complete brackets
+        self.ties += len(winners)
+        reach = self.pending.setdefault(group, {})
+        for team in winners:
+            if team not in reach: reach[team] = np.zeros(len(self.rounds))
+            reach[team][rnd + 1] += 1
+
+    def close(self, group, size):
+        self.replicas += size
+        for team, counts in self.pending.pop(group).items():
+            self.reach[team] += counts
+
+    def format(self):
+        n = max(self.replicas, 1)
+        lines = [f"{'TEAM':<18}" + "".join(f"{name:>7}" for name in self.rounds[1:])]
+        rows = sorted(self.draw, key=lambda t: tuple(-self.reach[t][::-1]))
+        for team in rows:
+            lines.append(f"{team:<18}" + "".join(f"{c / n:>7.1%}" for c in self.reach[team][1:]))
+        return "\n".join(lines)
+
+def run_cup(draw, replicas, workers=None, group=500, seed=0, engine="batch", progress=None):
+    workers = workers or os.cpu_count() or 1
+    stats = CupStats(draw)
+    n_rounds = len(stats.rounds) - 1
+    sizes = [min(group, replicas - i) for i in range(0, replicas, group)]
+    winners = {}   # (group, round, slot) -> list of winners, one per replica
+    running = {}
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        def submit(g, rnd, slot, home_keys, away_keys):
+            fut = pool.submit(play_ties, home_keys, away_keys, tie_seed(seed, g, rnd, slot), engine)
+            running[fut] = (g, rnd, slot)
+
+        for g, size in enumerate(sizes):
+            for slot in range(len(draw) // 2):
+                submit(g, 0, slot, [draw[2 * slot]] * size, [draw[2 * slot + 1]] * size)
+
+        # A tie is submitted the moment both of its feeder ties are back, so
+        # later rounds overlap with whatever is still left of earlier ones.
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for fut in done:
+                g, rnd, slot = running.pop(fut)
+                winners[g, rnd, slot] = fut.result()
+                stats.add(g, rnd, winners[g, rnd, slot])
+                if rnd + 1 == n_rounds:
+                    stats.close(g, sizes[g])
+                    if progress: progress(stats)
+                    continue
+                sibling = (g, rnd, slot ^ 1)
+                if sibling in winners:
+                    a, b = sorted([slot, slot ^ 1])
+                    submit(g, rnd + 1, slot // 2, winners.pop((g, rnd, a)), winners.pop((g, rnd, b)))
+    return stats
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Knockout cup simulator")
+    parser.add_argument("--teams", type=int, default=32, choices=BRACKET_SIZES)
+    parser.add_argument("--replicas", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--group", type=int, default=500, help="bracket replicas per task")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--engine", default="batch", choices=["batch", "scalar"])
+    args = parser.parse_args()
+
+    draw = draw_bracket(args.teams, args.seed)
+    t0 = time.perf_counter()
+    last = [0.0]
+
+    def show(stats):
+        now = time.perf_counter()
+        if stats.replicas < args.replicas and now - last[0] < 2.0: return
+        last[0] = now
+        print(f"\n[{stats.replicas}/{args.replicas} brackets, {stats.ties / (now - t0):,.0f} ties/s]")
+        print(stats.format())
+
+    run_cup(draw, args.replicas, args.workers, args.group, args.seed, args.engine, show)
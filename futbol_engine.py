@@ -0,0 +1,1413 @@
+import copy
+import heapq
+import math
+import random
+from collections import deque, namedtuple
+
+import numpy as np
+
+from futbol_teams import TEAMS, get_random_player_name
+
+# =====================================================================
+#                        1. GAME CONFIGURATION
+# =====================================================================
+# Headless match engine for "futbol 1.4.18.py". No pygame import here:
+# the same code drives the interactive game and the batch tools.
+# ENGINE_VERSION is bumped whenever a change alters results for a given seed.
+ENGINE_VERSION = "1.4.18-3"
+FPS = 80
+FRAMES_PER_SIM_MINUTE = 26
+
+ARENA_RADIUS = 220
+BALL_RADIUS = 37
+GOAL_WIDTH_RADIANS = 0.42
+POST_RADIUS = 4
+
+SPEED = 5.5
+MIN_SPEED = 4.0
+
+CENTER_X, CENTER_Y = 400, 440
+
+# =====================================================================
+#                        2. PHYSICS CONSTANTS
+# =====================================================================
+GRAVITY = 0.025
+BOUNCE_DAMPING = 0.95
+FRICTION = 0.999
+ELASTICITY = 1.01
+POST_ELASTICITY = 1.04
+GOAL_ROT_SPEED = 0.015
+# Overlap passes per frame of the "substep" physics mode
+SUBSTEPS = 8
+
+MATCH_STATES = ["INTRO", "FIRST_HALF", "SECOND_HALF", "HALFTIME", "EXTRA_TIME_1", "EXTRA_TIME_2", "FULLTIME"]
+
+# Playing periods: state -> (minute the period starts at, regular length end)
+PERIODS = {
+    "FIRST_HALF": (0, 45),
+    "SECOND_HALF": (45, 90),
+    "EXTRA_TIME_1": (90, 105),
+    "EXTRA_TIME_2": (105, 120),
+}
+PENALTY_CONVERSION = 0.75
+# Chance per played frame that a card drops while one may: red is
+# (first half, later periods), yellow is the same in every period
+RED_CARD_CHANCE = (0.03 / (45 * 60) * 10, 0.15 / (45 * 60) * 10)
+YELLOW_CARD_CHANCE = 0.15 / (45 * 60) * 10
+# Offset between a match seed and the seed of its cosmetic stream
+FX_STREAM = 0x9E3779B9
+
+# =====================================================================
+#                        3. GEOMETRY HELPERS
+# =====================================================================
+def calculate_goal_posts(cx, cy, radius, angle, width_rad):
+    INWARD_OFFSET = 22
+    gx = cx + math.cos(angle) * (radius - INWARD_OFFSET)
+    gy = cy + math.sin(angle) * (radius - INWARD_OFFSET)
+
+    half_width = (width_rad * radius) / 2
+    dx = math.cos(angle + math.pi/2) * half_width
+    dy = math.sin(angle + math.pi/2) * half_width
+
+    p1x = gx - dx
+    p1y = gy - dy
+    p2x = gx + dx
+    p2y = gy + dy
+
+    start_angle = angle - width_rad / 2
+    end_angle = angle + width_rad / 2
+    return (p1x, p1y), (p2x, p2y), start_angle, end_angle
+
+def get_random_spawn(cx, cy, r_limit, rng=random):
+    while True:
+        rx = rng.randint(cx - 150, cx + 150)
+        ry = rng.randint(cy - 200, cy + 50)
+        dist = math.hypot(rx - cx, ry - cy)
+        if dist < r_limit - BALL_RADIUS - 10:
+            return rx, ry
+
+# =====================================================================
+#                        4. BALL & CARDS (PHYSICS ONLY)
+# =====================================================================
+# fx: optional list the physics appends (kind, ...) tuples to, so the game
+# can spawn particles and play sounds without the engine knowing about them.
+# rng: any object with the random module's API; a MatchSimulator passes its
+# own simulation stream so matches never share generator state.
+class Ball:
+    def __init__(self, x, y, color_scheme, text, rng=random, radius=BALL_RADIUS):
+        self.rng = rng
+        self.x, self.y = x, y
+        self.vx = rng.choice([-SPEED, SPEED])
+        self.vy = rng.choice([-SPEED, SPEED])
+        self.radius = radius
+        self.color = color_scheme
+        self.text = text
+        self.mass = 1.0
+        self.nerf_timer = 0
+        self.yellow_nerf_timer = 0
+        self.speed_multiplier = 1
+
+    def place(self, x, y, vx, vy):
+        # Sets the ball from a recording instead of moving it (replays)
+        self.x, self.y, self.vx, self.vy = x, y, vx, vy
+
+    def move(self):
+        self.accelerate()
+        self.x += self.vx
+        self.y += self.vy
+
+    def accelerate(self):
+        # Velocity part of a frame: gravity, nerfs, friction and the speed floor
+        self.vy += GRAVITY
+
+        if self.nerf_timer > 0:
+            self.nerf_timer -= 1
+            self.speed_multiplier = 0.8
+        elif self.yellow_nerf_timer > 0:
+            self.yellow_nerf_timer -= 1
+            self.speed_multiplier = 0.8
+        else:
+            self.speed_multiplier = 1.0
+
+        current_friction = FRICTION
+        self.vx *= current_friction
+        self.vy *= current_friction
+        current_speed = math.hypot(self.vx, self.vy)
+
+        target_min_speed = MIN_SPEED * self.speed_multiplier
+
+        if current_speed < target_min_speed and current_speed > 0:
+            scale = target_min_speed / current_speed
+            self.vx *= scale
+            self.vy *= scale
+        elif current_speed == 0:
+            self.vx = self.rng.choice([-1, 1]) * target_min_speed
+            self.vy = self.rng.choice([-1, 1]) * target_min_speed
+
+    def collide_wall(self, cx, cy, radius, fx=None):
+        dx = self.x - cx
+        dy = self.y - cy
+        dist = math.hypot(dx, dy)
+        if dist + self.radius >= radius:
+            self.bounce_wall(dx / dist, dy / dist, (dist + self.radius) - radius, fx)
+            return True
+        return False
+
+    def bounce_wall(self, nx, ny, overlap, fx=None):
+        dot = self.vx * nx + self.vy * ny
+
+        is_crit = self.rng.random() < 0.15
+        current_bounce = 1.05 if is_crit else BOUNCE_DAMPING
+
+        if dot > 0:
+            self.vx = (self.vx - 2 * dot * nx) * current_bounce
+            self.vy = (self.vy - 2 * dot * ny) * current_bounce
+
+        self.x -= nx * overlap
+        self.y -= ny * overlap
+
+        if fx is not None:
+            fx.append(("WALL", self, self.x + nx * self.radius, self.y + ny * self.radius, nx, ny, is_crit))
+
+    def collide_post(self, px, py):
+        dx = self.x - px
+        dy = self.y - py
+        dist = math.hypot(dx, dy)
+        if dist < self.radius + POST_RADIUS:
+            return self.bounce_post(dx / dist, dy / dist, (self.radius + POST_RADIUS) - dist)
+        return False
+
+    def bounce_post(self, nx, ny, overlap, pvx=0.0, pvy=0.0):
+        # pvx, pvy: velocity of the post (the goal rotates); reflection is
+        # done in the post's frame so a moving post can push the ball
+        rvx, rvy = self.vx - pvx, self.vy - pvy
+        dot = rvx * nx + rvy * ny
+        if dot < 0:
+            self.vx = pvx + (rvx - 2 * dot * nx) * POST_ELASTICITY
+            self.vy = pvy + (rvy - 2 * dot * ny) * POST_ELASTICITY
+            self.x += nx * overlap
+            self.y += ny * overlap
+            return True
+        return False
+
+def resolve_collisions(b1, b2, fx=None):
+    dx = b2.x - b1.x
+    dy = b2.y - b1.y
+    dist = math.hypot(dx, dy)
+    if dist < b1.radius + b2.radius:
+        if dist == 0: dist = 0.1
+        return bounce_balls(b1, b2, dx/dist, dy/dist, (b1.radius + b2.radius) - dist, fx)
+    return False
+
+def bounce_balls(b1, b2, nx, ny, overlap, fx=None):
+    total_mass = b1.mass + b2.mass
+    m1_ratio = b2.mass / total_mass
+    m2_ratio = b1.mass / total_mass
+    b1.x -= nx * overlap * m1_ratio
+    b1.y -= ny * overlap * m1_ratio
+    b2.x += nx * overlap * m2_ratio
+    b2.y += ny * overlap * m2_ratio
+    rx = b2.vx - b1.vx
+    ry = b2.vy - b1.vy
+    vel_along_normal = rx * nx + ry * ny
+    if vel_along_normal > 0: return False
+
+    j = -(1 + ELASTICITY) * vel_along_normal
+    j /= (1 / b1.mass + 1 / b2.mass)
+    impulse_x = j * nx
+    impulse_y = j * ny
+    b1.vx -= impulse_x / b1.mass
+    b1.vy -= impulse_y / b1.mass
+    b2.vx += impulse_x / b2.mass
+    b2.vy += impulse_y / b2.mass
+
+    if fx is not None:
+        fx.append(("BALLS", b1, b2, b1.x + nx * b1.radius, b1.y + ny * b1.radius, nx, ny))
+    return True
+
+class Card:
+    # Integer rect, same truncation as the pygame.Rect the game used to keep.
+    life_frames = 10 * FRAMES_PER_SIM_MINUTE
+
+    def __init__(self, cx, cy, rng=random, arena=None):
+        self.cx, self.cy = cx, cy
+        self.arena = arena or CircleArena(cx, cy)
+        self.x, self.y = self.arena.random_point(rng, 60)
+        self.vx = rng.uniform(-0.4, 0.4)
+        self.vy = rng.uniform(-0.4, 0.4)
+        self.width = 16
+        self.height = 24
+        self.left = int(self.x - self.width//2)
+        self.top = int(self.y - self.height//2)
+        self.life_timer = self.life_frames
+        self.blink_start_time = 5 * FRAMES_PER_SIM_MINUTE
+        self.visible = True
+        self.active = True
+
+    def update(self):
+        if not self.active: return
+        self.life_timer -= 1
+        if self.life_timer <= 0:
+            self.active = False
+            return
+        self.x += self.vx
+        self.y += self.vy
+        if self.arena.outside(self.x, self.y, 50):
+            self.vx *= -1
+            self.vy *= -1
+        self.left = int(self.x) - self.width // 2
+        self.top = int(self.y) - self.height // 2
+        if self.life_timer < self.life_frames - self.blink_start_time:
+            self.visible = (self.life_timer // 10) % 2 != 0
+        else:
+            self.visible = True
+
+    def check_collision(self, ball):
+        if not self.active: return False
+        closest_x = max(self.left, min(ball.x, self.left + self.width))
+        closest_y = max(self.top, min(ball.y, self.top + self.height))
+        dx = ball.x - closest_x
+        dy = ball.y - closest_y
+        if dx*dx + dy*dy < ball.radius**2:
+            self.active = False
+            return True
+        return False
+
+class YellowCard(Card):
+    pass
+
+class RedCard(Card):
+    pass
+
+# =====================================================================
+#                        5. ARENAS
+# =====================================================================
+# An arena answers every "where is the wall" question the match asks: wall
+# contacts, spawns, card bounces, goal posts and the goal mouth. The circle
+# keeps the closed forms the engine always used, so default matches are
+# unchanged. Other shapes are given by an exact signed distance (negative
+# inside) which is sampled once, together with its gradient, on a grid of
+# SDF_CELL px; during play a wall test is one bilinear lookup however many
+# edges or bumpers the shape has. The rim (boundary point and normal at
+# every RIM_SAMPLES-th of a turn, seen from the centre) is tabulated as
+# well, for goal placement and drawing.
+SDF_CELL = 4.0
+SDF_MARGIN = 64
+RIM_SAMPLES = 720
+GOAL_INWARD_OFFSET = 22
+
+class CircleArena:
+    shape = "circle"
+
+    def __init__(self, cx, cy, radius=None):
+        self.cx, self.cy = cx, cy
+        self.radius = ARENA_RADIUS if radius is None else radius
+
+    def distance(self, x, y):
+        return math.hypot(x - self.cx, y - self.cy) - self.radius
+
+    def collide(self, b, fx=None):
+        return b.collide_wall(self.cx, self.cy, self.radius, fx)
+
+    def wall_gap(self, b):
+        return self.radius - b.radius - math.hypot(b.x - self.cx, b.y - self.cy)
+
+    def outside(self, x, y, margin):
+        return math.hypot(x - self.cx, y - self.cy) > self.radius - margin
+
+    def spawn(self, rng):
+        return get_random_spawn(self.cx, self.cy, self.radius, rng)
+
+    def random_point(self, rng, margin):
+        angle = rng.uniform(0, 2 * math.pi)
+        dist = math.sqrt(rng.random()) * (self.radius - margin)
+        return self.cx + math.cos(angle) * dist, self.cy + math.sin(angle) * dist
+
+    def rim(self, angle):
+        nx, ny = math.cos(angle), math.sin(angle)
+        return self.cx + nx * self.radius, self.cy + ny * self.radius, nx, ny
+
+    def goal_posts(self, angle):
+        p1, p2, _, _ = calculate_goal_posts(self.cx, self.cy, self.radius, angle, GOAL_WIDTH_RADIANS)
+        return p1, p2
+
+    def in_goal_mouth(self, b, angle):
+        dist = math.hypot(b.x - self.cx, b.y - self.cy)
+        if dist > self.radius - b.radius - 5:
+            ball_ang = math.atan2(b.y - self.cy, b.x - self.cx)
+            goal_n = angle % (2*math.pi)
+            ball_n = ball_ang % (2*math.pi)
+            diff = abs(ball_n - goal_n)
+            while diff > math.pi: diff = abs(diff - 2*math.pi)
+            return diff < GOAL_WIDTH_RADIANS / 2
+        return False
+
+class ShapeArena:
+    # Subclasses give shape_distance(x, y) relative to the centre and
+    # half_extent (half width, half height of the bounding box). Bumpers are
+    # (dx, dy, r) discs cut out of the pitch; they block balls but the goal
+    # only ever sits on the outer rim.
+    shape = "shape"
+
+    def __init__(self, cx, cy, bumpers=()):
+        self.cx, self.cy = cx, cy
+        self.radius = ARENA_RADIUS     # goal mouth width is measured against it
+        self.bumpers = [(cx + bx, cy + by, r) for bx, by, r in bumpers]
+        hw, hh = self.half_extent
+        self.x0, self.y0 = cx - hw - SDF_MARGIN, cy - hh - SDF_MARGIN
+        self.cols = int(2 * (hw + SDF_MARGIN) / SDF_CELL) + 2
+        self.rows = int(2 * (hh + SDF_MARGIN) / SDF_CELL) + 2
+        self.build()
+
+    def distances(self, x, y):
+        # shape_distance and the bumpers work on floats and NumPy arrays alike
+        d = self.shape_distance(x - self.cx, y - self.cy)
+        for bx, by, r in self.bumpers:
+            d = np.maximum(d, r - np.hypot(x - bx, y - by))
+        return d
+
+    def exact_distance(self, x, y):
+        return float(self.distances(x, y))
+
+    def build(self):
+        # Whole grid in one pass; the gradient is the central difference,
+        # one sided on the border
+        cols, rows, cell = self.cols, self.rows, SDF_CELL
+        j, i = np.mgrid[0:rows, 0:cols]
+        d = self.distances(self.x0 + i * cell, self.y0 + j * cell)
+        gx = d[j, np.minimum(i + 1, cols - 1)] - d[j, np.maximum(i - 1, 0)]
+        gy = d[np.minimum(j + 1, rows - 1), i] - d[np.maximum(j - 1, 0), i]
+        self.d, self.gx, self.gy = d.ravel().tolist(), gx.ravel().tolist(), gy.ravel().tolist()
+
+        # Rim: bisect every sample angle at once between the centre and a
+        # point surely outside
+        a = 2 * np.pi * np.arange(RIM_SAMPLES) / RIM_SAMPLES
+        ca, sa = np.cos(a), np.sin(a)
+        lo = np.zeros(RIM_SAMPLES)
+        hi = np.full(RIM_SAMPLES, math.hypot(*self.half_extent) + SDF_MARGIN)
+        for _ in range(40):
+            mid = (lo + hi) / 2
+            inside = self.shape_distance(ca * mid, sa * mid) < 0
+            lo, hi = np.where(inside, mid, lo), np.where(inside, hi, mid)
+        self.rim_table = [(x, y) + self.normal(x, y)
+                          for x, y in zip((self.cx + ca * lo).tolist(), (self.cy + sa * lo).tolist())]
+
+    def distance(self, x, y):
+        # Bilinear in the grid cell; off the grid (a ball knocked far out)
+        # falls back to the exact distance
+        fx, fy = (x - self.x0) / SDF_CELL, (y - self.y0) / SDF_CELL
+        i, j = int(fx), int(fy)
+        if not (0 <= i < self.cols - 1 and 0 <= j < self.rows - 1):
+            return self.exact_distance(x, y)
+        tx, ty = fx - i, fy - j
+        d, k, c = self.d, j * self.cols + i, self.cols
+        top = d[k] + (d[k + 1] - d[k]) * tx
+        bottom = d[k + c] + (d[k + c + 1] - d[k + c]) * tx
+        return top + (bottom - top) * ty
+
+    def normal(self, x, y):
+        # Outward unit normal: the bilinear gradient, only needed on contact
+        fx, fy = (x - self.x0) / SDF_CELL, (y - self.y0) / SDF_CELL
+        i, j = int(fx), int(fy)
+        if not (0 <= i < self.cols - 1 and 0 <= j < self.rows - 1):
+            nx = self.exact_distance(x + 1, y) - self.exact_distance(x - 1, y)
+            ny = self.exact_distance(x, y + 1) - self.exact_distance(x, y - 1)
+        else:
+            tx, ty = fx - i, fy - j
+            k, c = j * self.cols + i, self.cols
+            w00, w10, w01, w11 = (1 - tx) * (1 - ty), tx * (1 - ty), (1 - tx) * ty, tx * ty
+            nx = w00 * self.gx[k] + w10 * self.gx[k + 1] + w01 * self.gx[k + c] + w11 * self.gx[k + c + 1]
+            ny = w00 * self.gy[k] + w10 * self.gy[k + 1] + w01 * self.gy[k + c] + w11 * self.gy[k + c + 1]
+        norm = math.hypot(nx, ny) or 1.0
+        return nx / norm, ny / norm
+
+    def collide(self, b, fx=None):
+        d = self.distance(b.x, b.y)
+        if d + b.radius >= 0:
+            nx, ny = self.normal(b.x, b.y)
+            b.bounce_wall(nx, ny, d + b.radius, fx)
+            return True
+        return False
+
+    def wall_gap(self, b):
+        return -self.distance(b.x, b.y) - b.radius
+
+    def outside(self, x, y, margin):
+        return self.distance(x, y) > -margin
+
+    def random_point(self, rng, margin):
+        hw, hh = self.half_extent
+        while True:
+            x = rng.uniform(self.cx - hw, self.cx + hw)
+            y = rng.uniform(self.cy - hh, self.cy + hh)
+            if self.distance(x, y) < -margin:
+                return x, y
+
+    def spawn(self, rng):
+        return self.random_point(rng, BALL_RADIUS + 10)
+
+    def rim(self, angle):
+        # Interpolated between the two nearest tabulated rim samples
+        f = (angle % (2 * math.pi)) / (2 * math.pi) * RIM_SAMPLES
+        k = int(f) % RIM_SAMPLES
+        t = f - int(f)
+        ax, ay, anx, any_ = self.rim_table[k]
+        bx, by, bnx, bny = self.rim_table[(k + 1) % RIM_SAMPLES]
+        nx, ny = anx + (bnx - anx) * t, any_ + (bny - any_) * t
+        norm = math.hypot(nx, ny) or 1.0
+        return ax + (bx - ax) * t, ay + (by - ay) * t, nx / norm, ny / norm
+
+    def goal_frame(self, angle):
+        # Goal centre, inward of the rim along the normal, and the goal's
+        # tangent and half width
+        x, y, nx, ny = self.rim(angle)
+        half = GOAL_WIDTH_RADIANS * self.radius / 2
+        return x - nx * GOAL_INWARD_OFFSET, y - ny * GOAL_INWARD_OFFSET, -ny, nx, half
+
+    def goal_posts(self, angle):
+        gx, gy, tx, ty, half = self.goal_frame(angle)
+        return (gx - tx * half, gy - ty * half), (gx + tx * half, gy + ty * half)
+
+    def in_goal_mouth(self, b, angle):
+        # Touching the wall, and inside the strip the goal cuts out of the
+        # rim; the along-normal bound keeps the far side of the pitch out
+        if self.distance(b.x, b.y) > -(b.radius + 5):
+            x, y, nx, ny = self.rim(angle)
+            half = GOAL_WIDTH_RADIANS * self.radius / 2
+            along = (b.x - x) * nx + (b.y - y) * ny
+            across = (b.x - x) * -ny + (b.y - y) * nx
+            return along > -(b.radius + 5 + GOAL_INWARD_OFFSET) and abs(across) < half
+        return False
+
+class PolygonArena(ShapeArena):
+    # points: vertices relative to the centre, in order
+    shape = "polygon"
+
+    def __init__(self, cx, cy, points, bumpers=()):
+        self.points = [tuple(p) for p in points]
+        self.half_extent = (max(abs(x) for x, _ in self.points), max(abs(y) for _, y in self.points))
+        super().__init__(cx, cy, bumpers)
+
+    def shape_distance(self, x, y):
+        best, inside = np.inf, False
+        n = len(self.points)
+        for k in range(n):
+            ax, ay = self.points[k]
+            bx, by = self.points[(k + 1) % n]
+            ex, ey = bx - ax, by - ay
+            t = np.clip(((x - ax) * ex + (y - ay) * ey) / (ex * ex + ey * ey), 0.0, 1.0)
+            best = np.minimum(best, np.hypot(x - ax - ex * t, y - ay - ey * t))
+            if ey:     # a horizontal edge is never crossed
+                inside = inside ^ (((ay > y) != (by > y)) & (x < ax + (y - ay) * ex / ey))
+        return np.where(inside, -best, best)
+
+class EllipseArena(ShapeArena):
+    shape = "ellipse"
+
+    def __init__(self, cx, cy, rx, ry, bumpers=()):
+        self.rx, self.ry = rx, ry
+        self.half_extent = (rx, ry)
+        super().__init__(cx, cy, bumpers)
+
+    def shape_distance(self, x, y):
+        # Distance to the closest point (a cos t, b sin t), by Newton on t
+        # (a point where df vanishes keeps its t)
+        a, b = self.rx, self.ry
+        px, py = np.abs(x), np.abs(y)
+        t = np.arctan2(py * a, px * b)
+        for _ in range(6):
+            c, s = np.cos(t), np.sin(t)
+            ex, ey = a * c - px, b * s - py
+            f = -ex * a * s + ey * b * c
+            df = a * a * s * s + b * b * c * c - ex * a * c - ey * b * s
+            step = np.divide(f, df, out=np.zeros_like(t), where=df != 0)
+            t = np.where(df != 0, np.clip(t - step, 0.0, math.pi / 2), t)
+        dist = np.hypot(a * np.cos(t) - px, b * np.sin(t) - py)
+        return np.where((px / a) ** 2 + (py / b) ** 2 < 1, -dist, dist)
+
+class StadiumArena(ShapeArena):
+    # Two half discs of radius r joined by straights of length 2 * half_length
+    shape = "stadium"
+
+    def __init__(self, cx, cy, half_length, r, bumpers=()):
+        self.half_length, self.r = half_length, r
+        self.half_extent = (half_length + r, r)
+        super().__init__(cx, cy, bumpers)
+
+    def shape_distance(self, x, y):
+        return np.hypot(np.maximum(np.abs(x) - self.half_length, 0.0), y) - self.r
+
+def regular_polygon(sides, r, rotation=0.0):
+    return [(r * math.cos(rotation + 2 * math.pi * k / sides), r * math.sin(rotation + 2 * math.pi * k / sides))
+            for k in range(sides)]
+
+class CircleBumperArena(ShapeArena):
+    shape = "bumpers"
+
+    def __init__(self, cx, cy, r, bumpers):
+        self.r = r
+        self.half_extent = (r, r)
+        super().__init__(cx, cy, bumpers)
+
+    def shape_distance(self, x, y):
+        return np.hypot(x, y) - self.r
+
+# Built-in arenas, all close to the area of the original circle
+ARENAS = {
+    "circle": lambda cx, cy: CircleArena(cx, cy),
+    "ellipse": lambda cx, cy: EllipseArena(cx, cy, 255, 190),
+    "stadium": lambda cx, cy: StadiumArena(cx, cy, 80, 175),
+    "hexagon": lambda cx, cy: PolygonArena(cx, cy, regular_polygon(6, 240)),
+    "bumpers": lambda cx, cy: CircleBumperArena(cx, cy, ARENA_RADIUS + 10,
+                                                [(math.cos(a) * 105, math.sin(a) * 105, 20)
+                                                 for a in (-math.pi / 2, math.pi / 6, 5 * math.pi / 6)]),
+}
+
+ARENA_CACHE = {}
+
+def make_arena(name, cx=CENTER_X, cy=CENTER_Y):
+    # Arenas never change once built, so every match on the same shape and
+    # centre shares one grid
+    if name not in ARENAS:
+        raise ValueError(f"unknown arena {name!r}; choose from {sorted(ARENAS)}")
+    key = (name, cx, cy)
+    if key not in ARENA_CACHE: ARENA_CACHE[key] = ARENAS[name](cx, cy)
+    return ARENA_CACHE[key]
+
+# =====================================================================
+#                        6. EVENT-DRIVEN CONTACTS
+# =====================================================================
+# Alternative to the 8-pass overlap loop: within a frame every ball moves in
+# a straight line, so the next ball-wall, ball-ball and ball-post contact
+# times are roots of quadratics. step_contacts jumps from contact to contact
+# and resolves them in time order; a quiet frame is one straight move.
+# Posts are swept too: each is [x, y, vx, vy], moving in a straight line from
+# where the rotating goal put it last frame to where it is this frame, so a
+# fast ball or a turning goal cannot skip through a 4 px post.
+MAX_CONTACTS_PER_FRAME = 32
+CONTACT_EPS = 1e-9
+
+def time_to_wall(b, cx, cy, limit):
+    # First t >= 0 with |p + v t| = limit while moving outward (circle in circle)
+    px, py = b.x - cx, b.y - cy
+    qa = b.vx * b.vx + b.vy * b.vy
+    qb = px * b.vx + py * b.vy
+    qc = px * px + py * py - limit * limit
+    # Pushed past the wall (e.g. by a ball-ball correction): resolve now
+    if qc > CONTACT_EPS * limit * limit: return 0.0
+    if qc >= 0: return 0.0 if qb > 0 else None
+    if qa == 0: return None
+    return (-qb + math.sqrt(qb * qb - qa * qc)) / qa
+
+def time_to_touch(px, py, vx, vy, reach):
+    # First t >= 0 with |p + v t| = reach while approaching (circle vs circle)
+    qb = px * vx + py * vy
+    if qb >= 0: return None
+    qc = px * px + py * py - reach * reach
+    if qc <= 0: return 0.0
+    qa = vx * vx + vy * vy
+    disc = qb * qb - qa * qc
+    if disc < 0: return None
+    return qc / (-qb + math.sqrt(disc))
+
+def next_contact(balls, posts, cx, cy, radius, horizon):
+    # A pair is only solved when it can touch before horizon: per axis the
+    # gap closes by at most |vx| + |vy| per frame, which skips most of them
+    best, hit = horizon, None
+    for i, b in enumerate(balls):
+        t = time_to_wall(b, cx, cy, radius - b.radius)
+        if t is not None and t < best: best, hit = t, ("WALL", b)
+        for post in posts:
+            px, py, pvx, pvy = post
+            dx, dy, rvx, rvy = b.x - px, b.y - py, b.vx - pvx, b.vy - pvy
+            reach = b.radius + POST_RADIUS + (abs(rvx) + abs(rvy)) * horizon
+            if abs(dx) > reach or abs(dy) > reach: continue
+            t = time_to_touch(dx, dy, rvx, rvy, b.radius + POST_RADIUS)
+            if t is not None and t < best: best, hit = t, ("POST", b, post)
+        for b2 in balls[i + 1:]:
+            dx, dy, rvx, rvy = b2.x - b.x, b2.y - b.y, b2.vx - b.vx, b2.vy - b.vy
+            reach = b.radius + b2.radius + (abs(rvx) + abs(rvy)) * horizon
+            if abs(dx) > reach or abs(dy) > reach: continue
+            t = time_to_touch(dx, dy, rvx, rvy, b.radius + b2.radius)
+            if t is not None and t < best: best, hit = t, ("BALLS", b, b2)
+    return best, hit
+
+def step_contacts(balls, posts, cx, cy, radius, fx=None, posts_hit=None, on_wall=None):
+    # Advances every ball (and post) by one frame of its velocity; ball
+    # velocities must already be accelerated. on_wall(ball) is asked first at
+    # every wall contact and returning True (a goal) skips the bounce.
+    # Returns the number of contacts resolved.
+    remaining = 1.0
+    contacts = 0
+    while remaining > CONTACT_EPS:
+        t, hit = next_contact(balls, posts, cx, cy, radius, remaining)
+        for b in balls:
+            b.x += b.vx * t
+            b.y += b.vy * t
+        for post in posts:
+            post[0] += post[2] * t
+            post[1] += post[3] * t
+        remaining -= t
+        if hit is None: break
+
+        kind, b = hit[0], hit[1]
+        if kind == "WALL":
+            if on_wall is None or not on_wall(b):
+                dx, dy = b.x - cx, b.y - cy
+                dist = math.hypot(dx, dy)
+                b.bounce_wall(dx / dist, dy / dist, max(0.0, dist + b.radius - radius), fx)
+        elif kind == "POST":
+            px, py, pvx, pvy = hit[2]
+            dx, dy = b.x - px, b.y - py
+            dist = math.hypot(dx, dy)
+            if b.bounce_post(dx / dist, dy / dist, max(0.0, b.radius + POST_RADIUS - dist), pvx, pvy):
+                if posts_hit is not None: posts_hit.append(b)
+        else:
+            b2 = hit[2]
+            dx, dy = b2.x - b.x, b2.y - b.y
+            dist = math.hypot(dx, dy) or 0.1
+            bounce_balls(b, b2, dx / dist, dy / dist, max(0.0, b.radius + b2.radius - dist), fx)
+
+        contacts += 1
+        if contacts >= MAX_CONTACTS_PER_FRAME:
+            # Wedged between wall and ball: finish the frame the old way
+            for b in balls:
+                b.x += b.vx * remaining
+                b.y += b.vy * remaining
+            for post in posts:
+                post[0] += post[2] * remaining
+                post[1] += post[3] * remaining
+            for b in balls: b.collide_wall(cx, cy, radius, fx)
+            for i, b in enumerate(balls):
+                for b2 in balls[i + 1:]: resolve_collisions(b, b2, fx)
+            break
+    return contacts
+
+# =====================================================================
+#                        7. ADAPTIVE SUBSTEPS
+# =====================================================================
+# "adaptive" physics splits each frame's motion into k sub-moves, k picked
+# per frame: 1 while nothing can be reached this frame, more when a contact
+# is in range, scaled so one sub-move never travels further than the
+# feature it could miss (a post is only 2 * POST_RADIUS wide).
+ADAPTIVE_MIN_SUBSTEPS = 1
+ADAPTIVE_MAX_SUBSTEPS = 16
+POST_RESOLUTION = POST_RADIUS
+CONTACT_RESOLUTION = BALL_RADIUS / 4
+
+def choose_substeps(balls, posts, arena, low=None, high=None):
+    low = ADAPTIVE_MIN_SUBSTEPS if low is None else low
+    high = ADAPTIVE_MAX_SUBSTEPS if high is None else high
+    speeds = [math.hypot(b.vx, b.vy) for b in balls]
+    wall_gaps = [arena.wall_gap(b) for b in balls]
+    need = low
+    for i, b in enumerate(balls):
+        if wall_gaps[i] <= speeds[i]:
+            need = max(need, math.ceil(speeds[i] / CONTACT_RESOLUTION))
+        for px, py in posts:
+            if math.hypot(b.x - px, b.y - py) - b.radius - POST_RADIUS <= speeds[i]:
+                need = max(need, math.ceil(speeds[i] / POST_RESOLUTION))
+        for j in range(i + 1, len(balls)):
+            b2 = balls[j]
+            closing = math.hypot(b.vx - b2.vx, b.vy - b2.vy)
+            if math.hypot(b.x - b2.x, b.y - b2.y) - b.radius - b2.radius <= closing:
+                need = max(need, math.ceil(closing / CONTACT_RESOLUTION))
+                # Pressed against each other and the wall: a wedge needs the
+                # most relaxation passes
+                if min(wall_gaps[i], wall_gaps[j]) <= 0: need = high
+    return max(low, min(need, high))
+
+# =====================================================================
+#                        8. MATCH SIMULATOR
+# =====================================================================
+# Each period runs off a timeline: a heap of (frame, priority, seq, kind)
+# sampled at kickoff. A per-frame roll with chance p is memoryless, so the
+# wait until it first succeeds is drawn once (geometric) instead of rolling
+# every frame. Card gaps start counting when the pitch is free of that
+# card, so a card's entry goes on the heap only once the previous one is
+# gone. Kinds sharing a frame run in EVENT_PRIORITY order, the order the
+# per-frame checks used to run in.
+EVENT_PRIORITY = {"RED_CARD": 0, "YELLOW_CARD": 1, "ADDED_TIME": 2, "PERIOD_END": 3}
+
+def frames_until(rng, p):
+    # Frames up to and including the first success of a per-frame roll with chance p
+    return int(math.log(1.0 - rng.random()) / math.log(1.0 - p)) + 1
+
+MatchResult = namedtuple("MatchResult", [
+    "home", "away", "score1", "score2",
+    "goal_events_1", "goal_events_2",
+    "yellow_cards_1", "yellow_cards_2", "red_cards_1", "red_cards_2",
+    "frames", "penalties", "seed",
+], defaults=[None, None])
+
+def penalty_shootout(rng=random):
+    # Five kicks each, stop as soon as one side cannot catch up, then sudden death
+    goals = [0, 0]
+    for kick in range(10):
+        side = kick % 2
+        if rng.random() < PENALTY_CONVERSION: goals[side] += 1
+        left = [5 - (kick + 2 - s) // 2 for s in (0, 1)]
+        if goals[0] + left[0] < goals[1] or goals[1] + left[1] < goals[0]:
+            return tuple(goals)
+    while goals[0] == goals[1]:
+        for side in (0, 1):
+            if rng.random() < PENALTY_CONVERSION: goals[side] += 1
+    return tuple(goals)
+
+def match_winner(res):
+    # 0 home, 1 away, None for a draw that was not decided on penalties
+    if res.score1 != res.score2: return 0 if res.score1 > res.score2 else 1
+    if res.penalties: return 0 if res.penalties[0] > res.penalties[1] else 1
+    return None
+
+class MatchSimulator:
+    # Owns one match: balls, cards, goal, clock and the
+    # INTRO -> FIRST_HALF -> HALFTIME -> SECOND_HALF -> FULLTIME state machine.
+    # step() advances exactly one frame of the old main loop; run() steps
+    # until the final whistle with no display, mixer or frame cap.
+    # The match owns two streams derived from seed: rng drives everything
+    # that can change the result, fx_rng is left to the game for particles,
+    # shake and crowd, so drawing more or less never shifts the simulation.
+    # Without a seed one is drawn from the global random module and kept in
+    # the result, so (home, away, seed) always replays the same match.
+    # Plain values step() changes, saved as they are by snapshot()
+    SNAPSHOT_FIELDS = (
+        "state", "total_frames", "frame_counter", "sim_minute", "intro_timer", "start_delay_timer",
+        "halftime_timer", "cinematic_timer", "goll_timer", "goal_angle", "goal_rotating",
+        "display_added_time", "score1", "score2", "yellow_cards_1", "yellow_cards_2",
+        "red_cards_1", "red_cards_2", "penalties", "event_seq", "contacts",
+    )
+
+    def __init__(self, home_key, away_key, cx=CENTER_X, cy=CENTER_Y,
+                 ball_cls=Ball, record_fx=False, player_label="Player", knockout=False, seed=None,
+                 physics="substep", arena=None):
+        self.home_key = home_key
+        self.away_key = away_key
+        self.cx, self.cy = cx, cy
+        self.ball_cls = ball_cls
+        self.record_fx = record_fx
+        self.player_label = player_label
+        self.knockout = knockout
+        self.physics = physics      # "substep" (8 overlap passes), "event" or "adaptive"
+        self.arena = arena or CircleArena(cx, cy)
+        if physics == "event" and self.arena.shape != "circle":
+            raise ValueError("event physics needs a circular arena")
+        self.contacts = 0
+        self.posts_angle, self.posts = None, None
+        self.substep_bounds = (ADAPTIVE_MIN_SUBSTEPS, ADAPTIVE_MAX_SUBSTEPS)
+        self.substep_counts = {}    # adaptive: substeps per frame -> frames
+        self.penalties = None
+        self.fx = []
+        self.seed = random.getrandbits(32) if seed is None else seed
+        self.rng = random.Random(self.seed)
+        self.fx_rng = random.Random(self.seed + FX_STREAM)
+
+        self.team1_name = TEAMS[home_key]["short"]
+        self.team2_name = TEAMS[away_key]["short"]
+        self.team1_colors = TEAMS[home_key]["colors"]
+        self.team2_colors = TEAMS[away_key]["colors"]
+
+        self.score1, self.score2 = 0, 0
+        self.goal_events_1 = []
+        self.goal_events_2 = []
+        self.frame_counter = 0
+        self.total_frames = 0
+        self.goal_angle = 1 * math.pi / 2
+        self.goal_rotating = False
+        self.goll_timer = 0
+        self.display_added_time = False
+        self.sim_minute = 0
+
+        self.added_time_1 = self.rng.randint(2, 4)
+        self.added_time_2 = self.rng.randint(3, 8)
+
+        self.red_card_obj = None
+        self.red_cards_1, self.red_cards_2 = 0, 0
+
+        self.yellow_card_obj = None
+        self.yellow_cards_1, self.yellow_cards_2 = 0, 0
+        self.timeline = []
+        self.event_seq = 0
+        self.schedule_period("FIRST_HALF")
+
+        rx1, ry1 = self.arena.spawn(self.rng)
+        rx2, ry2 = self.arena.spawn(self.rng)
+        self.ball1 = ball_cls(rx1, ry1, self.team1_colors, self.team1_name, self.rng)
+        self.ball2 = ball_cls(rx2, ry2, self.team2_colors, self.team2_name, self.rng)
+
+        self.intro_timer = int(1.0 * FPS)
+        self.start_delay_timer = int(0.5 * FPS)
+        self.halftime_timer = 0
+        self.cinematic_timer = 0
+        self.state = "INTRO"
+
+    @property
+    def balls(self):
+        return [self.ball1, self.ball2]
+
+    def emit(self, *event):
+        if self.record_fx: self.fx.append(event)
+
+    def time_mark(self):
+        time_mark = f"{self.sim_minute}'"
+        if self.state == "FIRST_HALF":
+            if self.sim_minute > 45: time_mark = f"45+{self.sim_minute - 45}'"
+        elif self.state == "SECOND_HALF":
+            if self.sim_minute > 90: time_mark = f"90+{self.sim_minute - 90}'"
+        return time_mark
+
+    def step(self):
+        self.fx.clear()
+        self.total_frames += 1
+        run_physics = False
+
+        if self.state == "INTRO":
+            if self.intro_timer > 0:
+                self.intro_timer -= 1
+                if self.intro_timer <= 0:
+                    self.state = "FIRST_HALF"
+
+        elif self.state in PERIODS:
+            if self.start_delay_timer > 0:
+                self.start_delay_timer -= 1
+                if self.start_delay_timer == 0 and self.state == "FIRST_HALF":
+                    self.emit("WHISTLE_START")
+            else:
+                run_physics = True
+                self.frame_counter += 1
+                self.update_clock()
+
+        elif self.state == "FULLTIME":
+            if self.cinematic_timer > 0:
+                self.cinematic_timer -= 1
+                if self.cinematic_timer % 3 == 0:
+                    run_physics = True
+
+        if run_physics:
+            self.step_physics()
+
+        if self.state == "HALFTIME":
+            self.halftime_timer += 1
+            if self.halftime_timer > 1.5 * FPS:
+                self.start_second_half()
+
+        return self.fx
+
+    def schedule(self, frame, kind):
+        self.event_seq += 1
+        heapq.heappush(self.timeline, (frame, EVENT_PRIORITY[kind], self.event_seq, kind))
+
+    def schedule_period(self, state):
+        # Everything random about the period's clock and cards, drawn at kickoff
+        period_start, half_end = PERIODS[state]
+        added_time = {"FIRST_HALF": self.added_time_1, "SECOND_HALF": self.added_time_2}.get(state, 0)
+        red_chance = RED_CARD_CHANCE[0] if state == "FIRST_HALF" else RED_CARD_CHANCE[1]
+        self.card_gaps = {
+            "RED_CARD": [frames_until(self.rng, red_chance)],
+            "YELLOW_CARD": [frames_until(self.rng, YELLOW_CARD_CHANCE) for _ in range(self.rng.randint(1, 3))],
+        }
+        self.card_pending = set()
+        self.timeline = []
+        self.schedule((half_end - period_start) * FRAMES_PER_SIM_MINUTE, "ADDED_TIME")
+        self.schedule((half_end + added_time - period_start) * FRAMES_PER_SIM_MINUTE, "PERIOD_END")
+
+    def upcoming(self):
+        return [(frame, kind) for frame, _, _, kind in sorted(self.timeline)]
+
+    def update_clock(self):
+        self.sim_minute = PERIODS[self.state][0] + self.frame_counter // FRAMES_PER_SIM_MINUTE
+
+        # A card's next gap starts once the pitch is clear of that card
+        for kind, card in (("RED_CARD", self.red_card_obj), ("YELLOW_CARD", self.yellow_card_obj)):
+            gaps = self.card_gaps[kind]
+            if gaps and card is None and kind not in self.card_pending:
+                self.schedule(self.frame_counter - 1 + gaps.pop(0), kind)
+                self.card_pending.add(kind)
+
+        period = self.state
+        while self.timeline and self.timeline[0][0] <= self.frame_counter and self.state == period:
+            kind = heapq.heappop(self.timeline)[3]
+            self.run_event(kind)
+
+    def run_event(self, kind):
+        if kind == "RED_CARD":
+            self.red_card_obj = RedCard(self.cx, self.cy, self.rng, self.arena)
+            self.card_pending.discard(kind)
+        elif kind == "YELLOW_CARD":
+            self.yellow_card_obj = YellowCard(self.cx, self.cy, self.rng, self.arena)
+            self.card_pending.discard(kind)
+        elif kind == "ADDED_TIME":
+            added_time = {"FIRST_HALF": self.added_time_1, "SECOND_HALF": self.added_time_2}.get(self.state, 0)
+            self.display_added_time = added_time > 0
+        elif kind == "PERIOD_END":
+            self.end_period()
+
+    def end_period(self):
+        level = self.score1 == self.score2
+        if self.state == "FIRST_HALF":
+            self.state = "HALFTIME"
+            self.halftime_timer = 0
+            self.red_card_obj = None
+            self.yellow_card_obj = None
+            self.emit("WHISTLE_HALF")
+        elif self.knockout and level and self.state == "SECOND_HALF":
+            self.start_period("EXTRA_TIME_1")
+        elif self.knockout and level and self.state == "EXTRA_TIME_1":
+            self.start_period("EXTRA_TIME_2")
+        else:
+            if self.knockout and level:
+                self.penalties = penalty_shootout(self.rng)
+            self.state = "FULLTIME"
+            self.cinematic_timer = int(2.5 * FPS)
+            self.emit("WHISTLE_END")
+
+    def goal_posts_at(self, angle):
+        # The last posts asked for are kept: the goal stands still between
+        # goals, and the event solver asks again for last frame's posts
+        if angle != self.posts_angle:
+            self.posts_angle, self.posts = angle, self.arena.goal_posts(angle)
+        return self.posts
+
+    def step_physics(self):
+        fx = self.fx if self.record_fx else None
+        in_play = self.state != "FULLTIME"
+        ball1, ball2 = self.ball1, self.ball2
+
+        prev_angle = self.goal_angle
+        if self.goal_rotating:
+            self.goal_angle = (self.goal_angle + GOAL_ROT_SPEED) % (2 * math.pi)
+        if self.goll_timer > 0 and in_play:
+            self.goll_timer -= 1
+
+        if self.red_card_obj and in_play:
+            self.red_card_obj.update()
+            if not self.red_card_obj.active: self.red_card_obj = None
+            else:
+                for b in [ball1, ball2]:
+                    if self.red_card_obj.check_collision(b):
+                        b.nerf_timer = 20 * FRAMES_PER_SIM_MINUTE
+                        if b == ball1: self.red_cards_1 += 1
+                        else: self.red_cards_2 += 1
+                        self.red_card_obj = None
+                        self.emit("RED_CARD", b)
+                        break
+
+        if self.yellow_card_obj and in_play:
+            self.yellow_card_obj.update()
+            if not self.yellow_card_obj.active: self.yellow_card_obj = None
+            else:
+                for b in [ball1, ball2]:
+                    if self.yellow_card_obj.check_collision(b):
+                        b.yellow_nerf_timer = 20 * FRAMES_PER_SIM_MINUTE
+                        if b == ball1: self.yellow_cards_1 += 1
+                        else: self.yellow_cards_2 += 1
+                        self.yellow_card_obj = None
+                        self.emit("YELLOW_CARD", b)
+                        break
+
+        arena = self.arena
+        if self.physics == "event":
+            q1, q2 = self.goal_posts_at(prev_angle)
+            p1, p2 = self.goal_posts_at(self.goal_angle)
+            posts = [[q[0], q[1], p[0] - q[0], p[1] - q[1]] for q, p in ((q1, p1), (q2, p2))]
+            posts_hit = []
+            for b in [ball1, ball2]:
+                b.accelerate()
+            # Goals are checked at the wall contact itself, not only at the end
+            # of the frame, so a ball that bounces back out of the mouth counts
+            self.contacts += step_contacts([ball1, ball2], posts, self.cx, self.cy, arena.radius, fx, posts_hit,
+                                           self.check_goal if in_play else None)
+            for b in [ball1, ball2]:
+                if b in posts_hit: self.emit("POST", b)
+            if in_play:
+                for b in [ball1, ball2]:
+                    self.check_goal(b)
+            return
+
+        p1, p2 = self.goal_posts_at(self.goal_angle)
+        if self.physics == "adaptive":
+            for b in [ball1, ball2]:
+                b.accelerate()
+            k = choose_substeps([ball1, ball2], [p1, p2], arena, *self.substep_bounds)
+            self.substep_counts[k] = self.substep_counts.get(k, 0) + 1
+            posts_hit = []
+            for _ in range(k):
+                for b in [ball1, ball2]:
+                    b.x += b.vx / k
+                    b.y += b.vy / k
+                    if b.collide_post(p1[0], p1[1]) or b.collide_post(p2[0], p2[1]):
+                        if b not in posts_hit: posts_hit.append(b)
+                arena.collide(ball1, fx)
+                arena.collide(ball2, fx)
+                resolve_collisions(ball1, ball2, fx)
+                # Checked per sub-move: a ball that reached the mouth early in
+                # the frame may be well inside again by the end of it
+                if in_play:
+                    for b in [ball1, ball2]:
+                        self.check_goal(b)
+            for b in [ball1, ball2]:
+                if b in posts_hit: self.emit("POST", b)
+            return
+
+        for b in [ball1, ball2]:
+            b.move()
+
+            hit_post1 = b.collide_post(p1[0], p1[1])
+            hit_post2 = b.collide_post(p2[0], p2[1])
+            if hit_post1 or hit_post2:
+                self.emit("POST", b)
+
+        for _ in range(SUBSTEPS):
+            arena.collide(ball1, fx)
+            arena.collide(ball2, fx)
+            resolve_collisions(ball1, ball2, fx)
+
+        if in_play:
+            for b in [ball1, ball2]:
+                self.check_goal(b)
+
+    def in_goal_mouth(self, b):
+        return self.arena.in_goal_mouth(b, self.goal_angle)
+
+    def check_goal(self, b):
+        if not self.in_goal_mouth(b): return False
+        self.goll_timer = 90
+        time_mark = self.time_mark()
+
+        if b == self.ball1:
+            self.score1 += 1
+            scorer_name = get_random_player_name(self.home_key, self.player_label, self.rng)
+            self.goal_events_1.append((time_mark, "GOAL", scorer_name, self.frame_counter, self.state))
+        else:
+            self.score2 += 1
+            scorer_name = get_random_player_name(self.away_key, self.player_label, self.rng)
+            self.goal_events_2.append((time_mark, "GOAL", scorer_name, self.frame_counter, self.state))
+        b.x, b.y = self.cx, self.cy
+        self.emit("GOAL", b)
+
+        if self.score1 + self.score2 >= 1: self.goal_rotating = True
+        for kick in [self.ball1, self.ball2]:
+            kick.vx = self.rng.choice([-SPEED, SPEED]) * self.rng.uniform(0.8, 1.2)
+            kick.vy = self.rng.choice([-SPEED, SPEED]) * self.rng.uniform(0.8, 1.2)
+        return True
+
+    def start_second_half(self):
+        self.start_period("SECOND_HALF")
+
+    def start_period(self, state):
+        self.state = state
+        self.frame_counter = 0
+        self.red_card_obj = None
+        self.yellow_card_obj = None
+        self.schedule_period(state)
+
+        self.display_added_time = False
+        rx1, ry1 = self.arena.spawn(self.rng)
+        rx2, ry2 = self.arena.spawn(self.rng)
+        self.ball1.x, self.ball1.y = rx1, ry1
+        self.ball2.x, self.ball2.y = rx2, ry2
+
+    def run(self):
+        while self.state != "FULLTIME":
+            self.step()
+        return self.result()
+
+    def save_lists(self):
+        return tuple(self.goal_events_1), tuple(self.goal_events_2)
+
+    def load_lists(self, saved):
+        self.goal_events_1[:], self.goal_events_2[:] = saved
+
+    def snapshot(self):
+        snap = MatchSnapshot()
+        snap.frame = self.total_frames
+        snap.values = tuple([getattr(self, name) for name in self.SNAPSHOT_FIELDS])
+        snap.lists = self.save_lists()
+        snap.balls = tuple([(b.x, b.y, b.vx, b.vy, b.nerf_timer, b.yellow_nerf_timer, b.speed_multiplier)
+                            for b in self.balls])
+        snap.red_card = copy.copy(self.red_card_obj) if self.red_card_obj else None
+        snap.yellow_card = copy.copy(self.yellow_card_obj) if self.yellow_card_obj else None
+        snap.timeline = tuple(self.timeline)
+        snap.card_gaps = {kind: tuple(gaps) for kind, gaps in self.card_gaps.items()}
+        snap.card_pending = frozenset(self.card_pending)
+        snap.rng_state = self.rng.getstate()
+        return snap
+
+    def restore(self, snap):
+        for name, value in zip(self.SNAPSHOT_FIELDS, snap.values):
+            setattr(self, name, value)
+        self.load_lists(snap.lists)
+        for b, kin in zip(self.balls, snap.balls):
+            b.x, b.y, b.vx, b.vy, b.nerf_timer, b.yellow_nerf_timer, b.speed_multiplier = kin
+        # The snapshot keeps its own copies so it can be restored again
+        self.red_card_obj = copy.copy(snap.red_card) if snap.red_card else None
+        self.yellow_card_obj = copy.copy(snap.yellow_card) if snap.yellow_card else None
+        self.timeline = list(snap.timeline)
+        self.card_gaps = {kind: list(gaps) for kind, gaps in snap.card_gaps.items()}
+        self.card_pending = set(snap.card_pending)
+        self.rng.setstate(snap.rng_state)
+        self.fx.clear()
+
+    def result(self):
+        return MatchResult(
+            self.home_key, self.away_key, self.score1, self.score2,
+            list(self.goal_events_1), list(self.goal_events_2),
+            self.yellow_cards_1, self.yellow_cards_2, self.red_cards_1, self.red_cards_2,
+            self.total_frames, self.penalties, self.seed,
+        )
+
+# =====================================================================
+#                        9. FREE-FOR-ALL
+# =====================================================================
+# Any number of team balls share the arena and all score into the one
+# rotating goal. Ball-ball contacts go through a uniform grid: a ball is only
+# tested against balls in its own and neighbouring cells, so a frame costs
+# about O(n) instead of O(n^2) pair tests.
+FreeForAllResult = namedtuple("FreeForAllResult", [
+    "teams", "scores", "goal_events", "yellow_cards", "red_cards", "frames", "seed",
+])
+
+def ffa_ball_radius(n):
+    # Shrink balls past four teams so they keep covering the same area
+    return min(BALL_RADIUS, int(BALL_RADIUS * math.sqrt(4 / n)))
+
+def spawn_positions(n, radius, arena, rng):
+    spots = []
+    for _ in range(n):
+        for _ in range(1000):
+            x, y = arena.random_point(rng, radius + 10)
+            if all(math.hypot(x - sx, y - sy) > 2 * radius + 2 for sx, sy in spots): break
+        spots.append((x, y))
+    return spots
+
+def broad_phase_pairs(balls, cell):
+    # Spatial hash; each cell looks at itself and 4 of its 8 neighbours so a
+    # pair of neighbouring cells is visited once
+    grid = {}
+    for i, b in enumerate(balls):
+        grid.setdefault((int(b.x // cell), int(b.y // cell)), []).append(i)
+    pairs = []
+    for (gx, gy), members in grid.items():
+        for k, i in enumerate(members):
+            for j in members[k + 1:]: pairs.append((i, j))
+        for dx, dy in ((1, 0), (1, 1), (0, 1), (-1, 1)):
+            other = grid.get((gx + dx, gy + dy))
+            if other:
+                for i in members:
+                    for j in other: pairs.append((i, j))
+    return pairs
+
+class FreeForAllSimulator(MatchSimulator):
+    # Same clock, cards and goal as MatchSimulator; ball1/ball2 stay as the
+    # first two team balls so code that only knows two balls keeps working.
+    # Only the "substep" physics mode is implemented here; the event and
+    # adaptive solvers are written for two balls.
+    SNAPSHOT_FIELDS = MatchSimulator.SNAPSHOT_FIELDS + ("pair_tests",)
+    PHYSICS_MODES = ("substep",)
+
+    def __init__(self, team_keys, cx=CENTER_X, cy=CENTER_Y, ball_cls=Ball, record_fx=False,
+                 player_label="Player", seed=None, arena=None, physics="substep"):
+        if physics not in self.PHYSICS_MODES:
+            raise ValueError(f"free-for-all supports only substep physics, got {physics!r}")
+        super().__init__(team_keys[0], team_keys[1], cx, cy, ball_cls, record_fx, player_label, seed=seed,
+                         physics=physics, arena=arena)
+        self.team_keys = list(team_keys)
+        n = len(self.team_keys)
+        self.ball_radius = ffa_ball_radius(n)
+        self.scores = [0] * n
+        self.goal_events = [[] for _ in range(n)]
+        self.yellow_counts = [0] * n
+        self.red_counts = [0] * n
+        self.team_balls = []
+        for key, (x, y) in zip(self.team_keys, spawn_positions(n, self.ball_radius, self.arena, self.rng)):
+            team = TEAMS[key]
+            self.team_balls.append(ball_cls(x, y, team["colors"], team["short"], self.rng, self.ball_radius))
+        self.ball1, self.ball2 = self.team_balls[0], self.team_balls[1]
+        self.cell = 2 * self.ball_radius + 2 * SPEED
+        self.pair_tests = 0
+
+    @property
+    def balls(self):
+        return self.team_balls
+
+    def standings(self):
+        return sorted(range(len(self.team_keys)), key=lambda i: (-self.scores[i], i))
+
+    def card_hit(self, card, counts, nerf_attr):
+        for i, b in enumerate(self.team_balls):
+            if card.check_collision(b):
+                setattr(b, nerf_attr, 20 * FRAMES_PER_SIM_MINUTE)
+                counts[i] += 1
+                return b
+        return None
+
+    def step_physics(self):
+        fx = self.fx if self.record_fx else None
+        in_play = self.state != "FULLTIME"
+        balls = self.team_balls
+
+        if self.goal_rotating:
+            self.goal_angle = (self.goal_angle + GOAL_ROT_SPEED) % (2 * math.pi)
+        if self.goll_timer > 0 and in_play:
+            self.goll_timer -= 1
+
+        if self.red_card_obj and in_play:
+            self.red_card_obj.update()
+            if not self.red_card_obj.active: self.red_card_obj = None
+            else:
+                b = self.card_hit(self.red_card_obj, self.red_counts, "nerf_timer")
+                if b:
+                    self.red_card_obj = None
+                    self.emit("RED_CARD", b)
+
+        if self.yellow_card_obj and in_play:
+            self.yellow_card_obj.update()
+            if not self.yellow_card_obj.active: self.yellow_card_obj = None
+            else:
+                b = self.card_hit(self.yellow_card_obj, self.yellow_counts, "yellow_nerf_timer")
+                if b:
+                    self.yellow_card_obj = None
+                    self.emit("YELLOW_CARD", b)
+
+        arena = self.arena
+        p1, p2 = self.goal_posts_at(self.goal_angle)
+        for b in balls:
+            b.move()
+            hit_post1 = b.collide_post(p1[0], p1[1])
+            hit_post2 = b.collide_post(p2[0], p2[1])
+            if hit_post1 or hit_post2:
+                self.emit("POST", b)
+
+        pairs = broad_phase_pairs(balls, self.cell)
+        self.pair_tests += len(pairs)
+        for _ in range(SUBSTEPS):
+            for b in balls:
+                arena.collide(b, fx)
+            for i, j in pairs:
+                resolve_collisions(balls[i], balls[j], fx)
+
+        if in_play:
+            for b in balls:
+                self.check_goal(b)
+
+    def check_goal(self, b):
+        if not self.in_goal_mouth(b): return False
+        i = self.team_balls.index(b)
+        self.goll_timer = 90
+        self.scores[i] += 1
+        scorer_name = get_random_player_name(self.team_keys[i], self.player_label, self.rng)
+        self.goal_events[i].append((self.time_mark(), "GOAL", scorer_name, self.frame_counter, self.state))
+        b.x, b.y = self.cx, self.cy
+        self.emit("GOAL", b)
+
+        self.goal_rotating = True
+        b.vx = self.rng.choice([-SPEED, SPEED]) * self.rng.uniform(0.8, 1.2)
+        b.vy = self.rng.choice([-SPEED, SPEED]) * self.rng.uniform(0.8, 1.2)
+        return True
+
+    def start_period(self, state):
+        super().start_period(state)
+        spots = spawn_positions(len(self.team_balls), self.ball_radius, self.arena, self.rng)
+        for b, (x, y) in zip(self.team_balls, spots):
+            b.x, b.y = x, y
+
+    def save_lists(self):
+        return (tuple(self.scores), tuple(self.yellow_counts), tuple(self.red_counts),
+                tuple([tuple(log) for log in self.goal_events]))
+
+    def load_lists(self, saved):
+        self.scores[:], self.yellow_counts[:], self.red_counts[:], events = saved
+        for log, saved_log in zip(self.goal_events, events):
+            log[:] = saved_log
+
+    def result(self):
+        return FreeForAllResult(
+            list(self.team_keys), list(self.scores), [list(ev) for ev in self.goal_events],
+            list(self.yellow_counts), list(self.red_counts), self.total_frames, self.seed,
+        )
+
+def simulate_match(home_key, away_key, seed=None, physics="substep", arena="circle"):
+    return MatchSimulator(home_key, away_key, seed=seed, physics=physics, arena=make_arena(arena)).run()
+
+# =====================================================================
+#                        10. SNAPSHOTS & REWIND
+# =====================================================================
+# A snapshot is everything step() reads: the plain fields, score lists,
+# ball kinematics and nerf timers, cards, the timeline and the rng state.
+# Names, colours, the arena and fx_rng never change the result and are
+# left out. Given the same snapshot step() always plays the same frames, so
+# any frame can be rebuilt from the nearest earlier snapshot.
+SNAPSHOT_EVERY = 10        # frames between snapshots
+SNAPSHOT_CAPACITY = 720    # 7200 frames, a whole match with extra time
+
+class MatchSnapshot:
+    __slots__ = ("frame", "values", "lists", "balls", "red_card", "yellow_card",
+                 "timeline", "card_gaps", "card_pending", "rng_state")
+
+class RewindBuffer:
+    # Ring of snapshots taken every `every` frames. record() goes before each
+    # step(); once play goes on from a rewound frame the snapshots past it
+    # are dropped, since they belong to the old future.
+    def __init__(self, every=SNAPSHOT_EVERY, capacity=SNAPSHOT_CAPACITY):
+        self.every = every
+        self.snapshots = deque(maxlen=capacity)
+
+    def record(self, match):
+        frame = match.total_frames
+        while self.snapshots and self.snapshots[-1].frame >= frame:
+            self.snapshots.pop()
+        if frame % self.every == 0:
+            self.snapshots.append(match.snapshot())
+
+    def oldest(self):
+        return self.snapshots[0].frame if self.snapshots else None
+
+    def seek(self, match, frame):
+        # Restore the last snapshot at or before frame and step up to it.
+        # Frames older than the ring go to the oldest one kept.
+        if not self.snapshots: return False
+        frame = max(frame, self.snapshots[0].frame)
+        for snap in reversed(self.snapshots):
+            if snap.frame <= frame: break
+        if snap.frame > match.total_frames or match.total_frames > frame:
+            match.restore(snap)
+        while match.total_frames < frame:
+            self.record(match)
+            match.step()
+        match.fx.clear()
+        return True
+
+if __name__ == "__main__":
+    import sys
+    import time
+    from futbol_teams import TEAM_NAMES
+
+    if len(sys.argv) > 1 and sys.argv[1] == "ffa":
+        # python futbol_engine.py ffa N [seed]
+        n = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+        seed = int(sys.argv[3]) if len(sys.argv) > 3 else None
+        teams = random.Random(seed).sample(TEAM_NAMES, n)
+        t0 = time.perf_counter()
+        sim = FreeForAllSimulator(teams, seed=seed)
+        res = sim.run()
+        ms = (time.perf_counter() - t0) * 1000
+        print(f"free-for-all, {n} teams (seed {res.seed}, {res.frames} frames, {ms:.1f} ms, "
+              f"{sim.pair_tests / res.frames:.1f} pair tests/frame)")
+        for i in sim.standings():
+            print(f"  {res.teams[i]:<20} {res.scores[i]:>3}  yellow {res.yellow_cards[i]}  red {res.red_cards[i]}")
+        sys.exit()
+
+    home = sys.argv[1] if len(sys.argv) > 1 else TEAM_NAMES[0]
+    away = sys.argv[2] if len(sys.argv) > 2 else TEAM_NAMES[1]
+    seed = int(sys.argv[3]) if len(sys.argv) > 3 else None
+    physics = sys.argv[4] if len(sys.argv) > 4 else "substep"
+    arena = sys.argv[5] if len(sys.argv) > 5 else "circle"
+    try: make_arena(arena)     # built (and cached) outside the timing
+    except ValueError as e: sys.exit(str(e))
+    t0 = time.perf_counter()
+    res = simulate_match(home, away, seed, physics, arena)
+    ms = (time.perf_counter() - t0) * 1000
+    print(f"{home} {res.score1} - {res.score2} {away}   (seed {res.seed}, {res.frames} frames, {ms:.1f} ms)")
+    for ev in res.goal_events_1: print(f"  {TEAMS[home]['short']:>4} {ev[0]:>6} {ev[2]}")
+    for ev in res.goal_events_2: print(f"  {TEAMS[away]['short']:>4} {ev[0]:>6} {ev[2]}")
+    print(f"  yellow {res.yellow_cards_1}-{res.yellow_cards_2}  red {res.red_cards_1}-{res.red_cards_2}")
@@ -0,0 +1,184 @@
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from futbol_teams import LEAGUES
+from futbol_engine import MatchResult, MatchSimulator
+
+# =====================================================================
+#                        1. WORK DIRECTORY
+# =====================================================================
+# WORKDIR/job.json         fixtures and settings, written once
+# WORKDIR/chunks/NNNNN.json one file per finished chunk, written atomically
+# A restart with the same work directory only runs chunks with no file yet.
+def write_json(path, data):
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp, path)
+
+def read_json(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+def chunk_path(workdir, index):
+    return os.path.join(workdir, "chunks", f"{index:05d}.json")
+
+def create_job(workdir, fixtures, chunk=200, engine="scalar", knockout=False, seed=0, meta=None):
+    # fixtures: [(home, away, seed)]; the per-match seed is used by the
+    # scalar engine, the batch engine seeds each chunk from (seed, index)
+    os.makedirs(os.path.join(workdir, "chunks"), exist_ok=True)
+    job = {"fixtures": [list(f) for f in fixtures], "chunk": chunk, "engine": engine,
+           "knockout": knockout, "seed": seed, "meta": meta or {}}
+    write_json(os.path.join(workdir, "job.json"), job)
+    return job
+
+def load_job(workdir):
+    path = os.path.join(workdir, "job.json")
+    return read_json(path) if os.path.exists(path) else None
+
+# =====================================================================
+#                        2. CHUNK WORKER
+# =====================================================================
+def run_chunk(workdir, index, fixtures, engine, knockout, seed):
+    t0 = time.perf_counter()
+    if engine == "batch":
+        from futbol_batch import simulate_batch
+        chunk_seed = int(np.random.SeedSequence([seed, index]).generate_state(1)[0])
+        results = simulate_batch([h for h, _, _ in fixtures], [a for _, a, _ in fixtures],
+                                 seed=chunk_seed, knockout=knockout)
+    else:
+        results = [MatchSimulator(h, a, seed=s, knockout=knockout).run() for h, a, s in fixtures]
+    elapsed = time.perf_counter() - t0
+    write_json(chunk_path(workdir, index), {
+        "index": index, "pid": os.getpid(), "seconds": elapsed,
+        "results": [r._asdict() for r in results],
+    })
+    return index, len(results), elapsed, os.getpid()
+
+# =====================================================================
+#                        3. RUNNER
+# =====================================================================
+class Progress:
+    def __init__(self, total, done):
+        self.total = total
+        self.done = done
+        self.start_done = done
+        self.t0 = time.perf_counter()
+        self.busy = {}      # pid -> (matches, seconds)
+
+    def add(self, matches, seconds, pid):
+        self.done += matches
+        m, s = self.busy.get(pid, (0, 0.0))
+        self.busy[pid] = (m + matches, s + seconds)
+
+    def format(self):
+        wall = time.perf_counter() - self.t0
+        rate = (self.done - self.start_done) / wall if wall > 0 else 0.0
+        eta = (self.total - self.done) / rate if rate > 0 else float("inf")
+        per_worker = " ".join(f"{m / s:,.0f}" for m, s in self.busy.values() if s > 0)
+        return (f"{self.done}/{self.total} matches  {rate:,.0f} matches/s  "
+                f"[per worker: {per_worker}]  ETA {eta:,.0f} s")
+
+def run_job(workdir, workers=None, progress=None):
+    job = load_job(workdir)
+    fixtures, size = job["fixtures"], job["chunk"]
+    chunks = [fixtures[i:i + size] for i in range(0, len(fixtures), size)]
+    todo = [i for i in range(len(chunks)) if not os.path.exists(chunk_path(workdir, i))]
+    done = len(fixtures) - sum(len(chunks[i]) for i in todo)
+    stats = Progress(len(fixtures), done)
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_chunk, workdir, i, chunks[i], job["engine"], job["knockout"], job["seed"])
+                   for i in todo]
+        try:
+            for fut in as_completed(futures):
+                _, matches, seconds, pid = fut.result()
+                stats.add(matches, seconds, pid)
+                if progress: progress(stats)
+        except KeyboardInterrupt:
+            # Finished chunks are already on disk; drop the queued ones
+            for fut in futures: fut.cancel()
+            raise
+    return stats
+
+def load_results(workdir):
+    job = load_job(workdir)
+    n_chunks = -(-len(job["fixtures"]) // job["chunk"])
+    results = []
+    for i in range(n_chunks):
+        for d in read_json(chunk_path(workdir, i))["results"]:
+            d["goal_events_1"] = [tuple(ev) for ev in d["goal_events_1"]]
+            d["goal_events_2"] = [tuple(ev) for ev in d["goal_events_2"]]
+            if d["penalties"] is not None: d["penalties"] = tuple(d["penalties"])
+            results.append(MatchResult(**d))
+    return results
+
+# =====================================================================
+#                        4. SEASON JOBS
+# =====================================================================
+def season_fixtures(league, seasons, seed):
+    from futbol_season import double_round_robin
+    pairs = [pair for rnd in double_round_robin(LEAGUES[league]) for pair in rnd]
+    rng = random.Random(seed)
+    return [(h, a, rng.getrandbits(32)) for _ in range(seasons) for h, a in pairs]
+
+def season_report(workdir):
+    from futbol_season import SeasonStats, season_tables
+    job = load_job(workdir)
+    league, seasons = job["meta"]["league"], job["meta"]["seasons"]
+    teams = LEAGUES[league]
+    results = load_results(workdir)
+    fixtures = [(r.home, r.away) for r in results[:len(results) // seasons]]
+    score = np.array([(r.score1, r.score2) for r in results]).reshape(seasons, len(fixtures), 2)
+    points, positions = season_tables(teams, fixtures, score, np.random.default_rng(job["seed"]))
+    stats = SeasonStats(teams)
+    stats.add({
+        "seasons": seasons, "matches": len(results), "points": points.sum(axis=0),
+        "titles": (positions == 0).sum(axis=0), "top4": (positions < 4).sum(axis=0),
+        "relegated": (positions >= len(teams) - 3).sum(axis=0),
+    })
+    return stats.format()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Checkpointed, resumable match jobs")
+    parser.add_argument("workdir")
+    parser.add_argument("--league", choices=sorted(LEAGUES), help="create a season job (ignored when resuming)")
+    parser.add_argument("--seasons", type=int, default=100)
+    parser.add_argument("--chunk", type=int, default=200,
+                        help="matches per chunk: bigger saves per-task overhead, smaller loses less on a crash")
+    parser.add_argument("--engine", default="scalar", choices=["scalar", "batch"])
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    job = load_job(args.workdir)
+    if job is None:
+        if not args.league: parser.error("new work directory needs --league")
+        fixtures = season_fixtures(args.league, args.seasons, args.seed)
+        job = create_job(args.workdir, fixtures, args.chunk, args.engine, seed=args.seed,
+                         meta={"league": args.league, "seasons": args.seasons})
+    else:
+        print(f"resuming {args.workdir}")
+
+    last = [0.0]
+    def show(stats):
+        now = time.perf_counter()
+        if stats.done < stats.total and now - last[0] < 2.0: return
+        last[0] = now
+        print(stats.format())
+
+    try:
+        run_job(args.workdir, args.workers, show)
+    except KeyboardInterrupt:
+        print("\ninterrupted; run the same command again to resume")
+        raise SystemExit(130)
+    if "league" in job["meta"]:
+        print(season_report(args.workdir))
@@ -0,0 +1,121 @@
+import argparse
+import time
+from collections import Counter, namedtuple
+from statistics import NormalDist
+
+import numpy as np
+
+from futbol_teams import TEAM_NAMES
+from futbol_engine import MatchSimulator
+
+# =====================================================================
+#                        1. INTERVALS
+# =====================================================================
+def wilson_interval(hits, n, z):
+    if n == 0: return 0.0, 1.0
+    p = hits / n
+    denom = 1 + z * z / n
+    mid = (p + z * z / (2 * n)) / denom
+    half = z * np.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+    return max(0.0, mid - half), min(1.0, mid + half)
+
+# =====================================================================
+#                        2. SAMPLER
+# =====================================================================
+def sample_scores(home_key, away_key, n, seed, engine="batch", cache=None):
+    if engine == "batch":
+        from futbol_batch import BatchSimulator
+        sim = BatchSimulator([home_key] * n, [away_key] * n, seed=seed)
+        sim.run()
+        return [tuple(s) for s in sim.score.tolist()]
+    # One explicit seed per match, so a ResultCache (keyed on teams and seed) can serve repeats
+    scores = []
+    for match_seed in np.random.SeedSequence(seed).generate_state(n).tolist():
+        if cache is not None:
+            res = cache.match(home_key, away_key, match_seed)
+        else:
+            res = MatchSimulator(home_key, away_key, seed=match_seed).run()
+        scores.append((res.score1, res.score2))
+    return scores
+
+# =====================================================================
+#                        3. SEQUENTIAL ESTIMATOR
+# =====================================================================
+OddsReport = namedtuple("OddsReport", [
+    "home", "away", "samples", "converged", "confidence",
+    "home_win", "draw", "away_win",   # (p, low, high)
+    "scores",                         # [(score, p, low, high)] most likely first
+])
+
+def estimate_odds(home_key, away_key, tolerance=0.04, confidence=0.95,
+                  block=500, max_samples=50000, seed=0, engine="batch", cache=None):
+    # Draws blocks of matches until every W/D/L interval is narrower than
+    # tolerance (full width) or max_samples is reached
+    if block <= 0: raise ValueError(f"block must be positive, got {block}")
+    if max_samples <= 0: raise ValueError(f"max_samples must be positive, got {max_samples}")
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    seeds = np.random.SeedSequence(seed).generate_state(max_samples // block + 1)
+    scores = Counter()
+    wdl = np.zeros(3, dtype=np.int64)
+    n = 0
+    converged = False
+    for block_seed in seeds:
+        size = min(block, max_samples - n)
+        if size <= 0: break
+        for s1, s2 in sample_scores(home_key, away_key, size, int(block_seed), engine, cache):
+            scores[s1, s2] += 1
+            wdl[0 if s1 > s2 else 1 if s1 == s2 else 2] += 1
+        n += size
+        intervals = [wilson_interval(k, n, z) for k in wdl]
+        if max(hi - lo for lo, hi in intervals) < tolerance:
+            converged = True
+            break
+
+    home_win, draw, away_win = [(k / n, lo, hi) for k, (lo, hi) in zip(wdl, intervals)]
+    exact = [(score, k / n) + wilson_interval(k, n, z) for score, k in scores.most_common()]
+    return OddsReport(home_key, away_key, n, converged, confidence, home_win, draw, away_win, exact)
+
+def odds_for_selection(selected_home_idx, selected_away_idx, **kwargs):
+    return estimate_odds(TEAM_NAMES[selected_home_idx], TEAM_NAMES[selected_away_idx], **kwargs)
+
+def format_report(report, top=8):
+    lines = [f"{report.home} vs {report.away}: {report.samples} matches, "
+             f"{report.confidence:.0%} intervals" + ("" if report.converged else " (max samples reached)")]
+    for label, (p, lo, hi) in (("HOME", report.home_win), ("DRAW", report.draw), ("AWAY", report.away_win)):
+        lines.append(f"  {label:<6}{p:>7.1%}  [{lo:.1%} - {hi:.1%}]  odds {1 / p if p else float('inf'):.2f}")
+    lines.append("  EXACT SCORE")
+    for (s1, s2), p, lo, hi in report.scores[:top]:
+        lines.append(f"  {s1}-{s2:<4}{p:>7.1%}  [{lo:.1%} - {hi:.1%}]")
+    return "\n".join(lines)
+
+def positive_int(value):
+    n = int(value)
+    if n <= 0: raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return n
+
+def team_arg(value):
+    # Accepts a TEAMS key or the menu index used by selected_home_idx/selected_away_idx
+    return TEAM_NAMES[int(value)] if value.isdigit() else value
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Head-to-head odds by simulation")
+    parser.add_argument("home", type=team_arg)
+    parser.add_argument("away", type=team_arg)
+    parser.add_argument("--tolerance", type=float, default=0.04, help="target full interval width")
+    parser.add_argument("--confidence", type=float, default=0.95)
+    parser.add_argument("--block", type=positive_int, default=500, help="matches per sampling step")
+    parser.add_argument("--max-samples", type=positive_int, default=50000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--engine", default="batch", choices=["batch", "scalar"])
+    parser.add_argument("--cache-dir", default=None, help="reuse scalar results through a ResultCache")
+    args = parser.parse_args()
+
+    cache = None
+    if args.cache_dir:
+        from futbol_cache import ResultCache
+        cache = ResultCache(args.cache_dir)
+    t0 = time.perf_counter()
+    report = estimate_odds(args.home, args.away, args.tolerance, args.confidence,
+                           args.block, args.max_samples, args.seed, args.engine, cache)
+    print(format_report(report))
+    print(f"  {time.perf_counter() - t0:.1f} s")
@@ -0,0 +1,301 @@
+import argparse
+import json
+import os
+import random
+
+import numpy as np
+
+from futbol_teams import TEAMS
+from futbol_engine import (
+    ARENAS, ENGINE_VERSION, FX_STREAM, MATCH_STATES, Ball, FreeForAllSimulator, MatchSimulator, make_arena,
+)
+
+# =====================================================================
+#                        1. FILE FORMAT
+# =====================================================================
+# MAGIC, then a little-endian uint32 with the length of a JSON header, the
+# header itself, then two fixed-width tables at offsets given in the header:
+#   frames  one record per frame; record i is the match after total_frames == i
+#   events  (frame, kind, ball, goal), sorted by frame
+# Only what is drawn is kept, so playback needs no physics. Record i sits at
+# frame_offset + i * itemsize, and events of a frame are found by binary
+# search on the frame column. Wall and ball-ball sparks are not stored.
+MAGIC = b"FBRP"
+REPLAY_VERSION = 1
+EVENT_KINDS = ["GOAL", "RED_CARD", "YELLOW_CARD", "POST", "WHISTLE_START", "WHISTLE_HALF", "WHISTLE_END"]
+NO_GOAL = 0xFFFF
+
+# flags bits
+ADDED_TIME, RED_VISIBLE, YELLOW_VISIBLE, RED_ON_PITCH, YELLOW_ON_PITCH = 1, 2, 4, 8, 16
+# nerf bits, per ball
+RED_NERF, YELLOW_NERF = 1, 2
+
+EVENT_DTYPE = np.dtype([("frame", "<u4"), ("kind", "u1"), ("ball", "u1"), ("goal", "<u2")])
+
+def frame_dtype(n_balls):
+    return np.dtype([
+        ("state", "u1"), ("flags", "u1"), ("frame_counter", "<u2"),
+        ("intro_timer", "u1"), ("cinematic_timer", "u1"), ("goll_timer", "u1"),
+        ("goal_angle", "<f4"), ("red_card", "<i2", (2,)), ("yellow_card", "<i2", (2,)),
+        ("nerf", "u1", (n_balls,)), ("balls", "<f4", (n_balls, 4)),
+    ])
+
+def write_replay(path, header, frames, events):
+    head = dict(header, version=REPLAY_VERSION, frames=len(frames), events=len(events))
+    # Offsets depend on the header length, so it is sized with placeholders first
+    head["frame_offset"] = head["event_offset"] = 0
+    start = len(MAGIC) + 4 + len(json.dumps(head).encode()) + 32
+    head["frame_offset"] = start
+    head["event_offset"] = start + frames.nbytes
+    raw = json.dumps(head).encode().ljust(start - len(MAGIC) - 4)
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        f.write(np.uint32(len(raw)).tobytes())
+        f.write(raw)
+        f.write(frames.tobytes())
+        f.write(events.tobytes())
+
+def read_replay(path):
+    # Memory-mapped: opening reads the header only, records are paged in on use
+    raw = np.memmap(path, dtype=np.uint8, mode="r")
+    if bytes(raw[:4]) != MAGIC: raise ValueError(f"{path}: not a replay file")
+    size = int(raw[4:8].view("<u4")[0])
+    header = json.loads(bytes(raw[8:8 + size]))
+    if header["version"] != REPLAY_VERSION: raise ValueError(f"{path}: replay version {header['version']}")
+    fd = frame_dtype(len(header["teams"]))
+    f0, e0 = header["frame_offset"], header["event_offset"]
+    frames = raw[f0:f0 + header["frames"] * fd.itemsize].view(fd)
+    events = raw[e0:e0 + header["events"] * EVENT_DTYPE.itemsize].view(EVENT_DTYPE)
+    return header, frames, events
+
+# =====================================================================
+#                        2. RECORDER
+# =====================================================================
+class ReplayRecorder:
+    # capture(fx) after every step(); the match must have record_fx on
+    def __init__(self, match, arena="circle"):
+        self.match = match
+        self.balls = match.balls
+        self.ffa = isinstance(match, FreeForAllSimulator)
+        self.header = {
+            "engine": ENGINE_VERSION, "seed": match.seed, "arena": arena,
+            "teams": match.team_keys if self.ffa else [match.home_key, match.away_key],
+            "ball_radius": self.balls[0].radius, "center": [match.cx, match.cy], "goals": [],
+            "penalties": None,
+        }
+        self.frames = []
+        self.events = []
+        self.capture([])
+
+    def goal_log(self, i):
+        m = self.match
+        if self.ffa: return m.goal_events[i]
+        return m.goal_events_1 if i == 0 else m.goal_events_2
+
+    def capture(self, fx):
+        m = self.match
+        frame = m.total_frames
+        for event in fx:
+            kind = event[0]
+            if kind not in EVENT_KINDS: continue
+            ball = self.balls.index(event[1]) if len(event) > 1 else 0
+            goal = NO_GOAL
+            if kind == "GOAL":
+                time_mark, _, scorer, frame_counter, period = self.goal_log(ball)[-1]
+                goal = len(self.header["goals"])
+                self.header["goals"].append([ball, time_mark, scorer, frame_counter, period])
+            self.events.append((frame, EVENT_KINDS.index(kind), ball, goal))
+
+        red, yellow = m.red_card_obj, m.yellow_card_obj
+        flags = ADDED_TIME if m.display_added_time else 0
+        if red: flags |= RED_ON_PITCH | (RED_VISIBLE if red.active and red.visible else 0)
+        if yellow: flags |= YELLOW_ON_PITCH | (YELLOW_VISIBLE if yellow.active and yellow.visible else 0)
+        self.frames.append((
+            MATCH_STATES.index(m.state), flags, m.frame_counter,
+            m.intro_timer, m.cinematic_timer, m.goll_timer, m.goal_angle,
+            (red.left, red.top) if red else (0, 0), (yellow.left, yellow.top) if yellow else (0, 0),
+            [(RED_NERF if b.nerf_timer > 0 else 0) | (YELLOW_NERF if b.yellow_nerf_timer > 0 else 0)
+             for b in self.balls],
+            [(b.x, b.y, b.vx, b.vy) for b in self.balls],
+        ))
+
+    def save(self, path):
+        # The shootout is drawn at the final whistle, after the last goal
+        self.header["penalties"] = self.match.penalties
+        frames = np.array(self.frames, dtype=frame_dtype(len(self.balls)))
+        events = np.array(self.events, dtype=EVENT_DTYPE)
+        write_replay(path, self.header, frames, events)
+
+def record_match(match, path, arena="circle"):
+    # Runs to the end of the full-time cinematic, the last frame the game animates
+    match.record_fx = True
+    rec = ReplayRecorder(match, arena)
+    while match.state != "FULLTIME" or match.cinematic_timer > 0:
+        rec.capture(match.step())
+    rec.save(path)
+    return match.result()
+
+# =====================================================================
+#                        3. PLAYER
+# =====================================================================
+class ReplayCard:
+    __slots__ = ("left", "top", "width", "height", "active", "visible")
+
+    def __init__(self):
+        self.width, self.height = 16, 24
+        self.left = self.top = 0
+        self.active = self.visible = True
+
+class ReplayPlayer:
+    # Stands in for a MatchSimulator in the game: the same attributes the
+    # renderer reads, and step() returns the recorded fx of the next frame.
+    # Scores, cards and goal lists are rebuilt from the event table.
+    def __init__(self, path, cx=None, cy=None, ball_cls=Ball):
+        self.header, self.frames, self.events = read_replay(path)
+        self.team_keys = list(self.header["teams"])
+        self.ffa = len(self.team_keys) > 2
+        rx, ry = self.header["center"]
+        self.cx = rx if cx is None else cx
+        self.cy = ry if cy is None else cy
+        self.dx, self.dy = self.cx - rx, self.cy - ry
+        self.arena = make_arena(self.header["arena"], self.cx, self.cy)
+        self.seed = self.header["seed"]
+        self.fx_rng = random.Random(self.seed + FX_STREAM)
+        self.record_fx = True
+        self.goals = [tuple(g) for g in self.header["goals"]]
+        shootout = self.header.get("penalties")     # older replays have no entry
+        self.shootout = tuple(shootout) if shootout else None
+        self.event_frames = self.events["frame"]
+
+        home, away = self.team_keys[0], self.team_keys[1]
+        self.home_key, self.away_key = home, away
+        self.team1_name, self.team2_name = TEAMS[home]["short"], TEAMS[away]["short"]
+        self.team1_colors, self.team2_colors = TEAMS[home]["colors"], TEAMS[away]["colors"]
+        radius = self.header["ball_radius"]
+        dummy = random.Random(0)
+        self.balls = [ball_cls(self.cx, self.cy, TEAMS[k]["colors"], TEAMS[k]["short"], dummy, radius)
+                      for k in self.team_keys]
+        self.ball1, self.ball2 = self.balls[0], self.balls[1]
+        self.red_card_obj = None
+        self.yellow_card_obj = None
+        self.red_card, self.yellow_card = ReplayCard(), ReplayCard()
+        self.seek(0)
+
+    @property
+    def last_frame(self):
+        return len(self.frames) - 1
+
+    def reset_counts(self):
+        n = len(self.balls)
+        self.scores, self.yellow_counts, self.red_counts = [0] * n, [0] * n, [0] * n
+        self.goal_logs = [[] for _ in range(n)]
+        self.sync_counts()
+
+    def sync_counts(self):
+        self.score1, self.score2 = self.scores[0], self.scores[1]
+        self.yellow_cards_1, self.yellow_cards_2 = self.yellow_counts[0], self.yellow_counts[1]
+        self.red_cards_1, self.red_cards_2 = self.red_counts[0], self.red_counts[1]
+        self.goal_events_1, self.goal_events_2 = self.goal_logs[0], self.goal_logs[1]
+        self.goal_events = self.goal_logs
+
+    def apply_events(self, lo, hi):
+        fx = []
+        for frame, kind, ball, goal in self.events[lo:hi].tolist():
+            kind = EVENT_KINDS[kind]
+            b = self.balls[ball]
+            if kind == "GOAL":
+                _, time_mark, scorer, frame_counter, period = self.goals[goal]
+                self.scores[ball] += 1
+                self.goal_logs[ball].append((time_mark, "GOAL", scorer, frame_counter, period))
+                fx.append((kind, b))
+            elif kind.startswith("WHISTLE"):
+                fx.append((kind,))
+            else:
+                if kind == "RED_CARD": self.red_counts[ball] += 1
+                elif kind == "YELLOW_CARD": self.yellow_counts[ball] += 1
+                fx.append((kind, b))
+        self.sync_counts()
+        return fx
+
+    def apply_frame(self, i):
+        (state, flags, frame_counter, intro, cinematic, goll, angle,
+         red, yellow, nerf, balls) = self.frames[i].item()
+        red, yellow, nerf, balls = red.tolist(), yellow.tolist(), nerf.tolist(), balls.tolist()
+        self.total_frames = i
+        self.state = MATCH_STATES[state]
+        self.penalties = self.shootout if self.state == "FULLTIME" else None
+        self.frame_counter = frame_counter
+        self.intro_timer, self.cinematic_timer, self.goll_timer = intro, cinematic, goll
+        self.goal_angle = angle
+        self.display_added_time = bool(flags & ADDED_TIME)
+        self.red_card_obj = self.place_card(self.red_card, red, flags & RED_ON_PITCH, flags & RED_VISIBLE)
+        self.yellow_card_obj = self.place_card(self.yellow_card, yellow, flags & YELLOW_ON_PITCH,
+                                               flags & YELLOW_VISIBLE)
+        for b, bits, (x, y, vx, vy) in zip(self.balls, nerf, balls):
+            b.place(x + self.dx, y + self.dy, vx, vy)
+            b.nerf_timer = 1 if bits & RED_NERF else 0
+            b.yellow_nerf_timer = 1 if bits & YELLOW_NERF else 0
+
+    def place_card(self, card, pos, on_pitch, visible):
+        if not on_pitch: return None
+        card.left, card.top = pos[0] + int(self.dx), pos[1] + int(self.dy)
+        card.visible = bool(visible)
+        return card
+
+    def step(self):
+        i = self.total_frames
+        if i >= self.last_frame: return []
+        lo, hi = np.searchsorted(self.event_frames, [i + 1, i + 2])
+        self.apply_frame(i + 1)
+        return self.apply_events(lo, hi)
+
+    def seek(self, frame):
+        frame = min(max(frame, 0), self.last_frame)
+        self.reset_counts()
+        self.apply_events(0, int(np.searchsorted(self.event_frames, frame, side="right")))
+        self.apply_frame(frame)
+        return True
+
+    def standings(self):
+        return sorted(range(len(self.team_keys)), key=lambda i: (-self.scores[i], i))
+
+# =====================================================================
+#                        4. COMMAND LINE
+# =====================================================================
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Record and inspect binary match replays")
+    sub = parser.add_subparsers(dest="command", required=True)
+    rec = sub.add_parser("record", help="simulate a match and save its replay")
+    rec.add_argument("out")
+    rec.add_argument("teams", nargs="+", help="home away, or more teams for a free-for-all")
+    rec.add_argument("--seed", type=int, default=None)
+    rec.add_argument("--physics", default="substep", choices=["substep", "event", "adaptive"])
+    rec.add_argument("--arena", default="circle", choices=sorted(ARENAS))
+    rec.add_argument("--knockout", action="store_true")
+    info = sub.add_parser("info", help="print a replay's header and size")
+    info.add_argument("file")
+    args = parser.parse_args()
+
+    if args.command == "record":
+        if len(args.teams) < 2: parser.error("need at least two teams")
+        arena = make_arena(args.arena)
+        if len(args.teams) > 2:
+            if args.physics not in FreeForAllSimulator.PHYSICS_MODES:
+                parser.error("free-for-all replays support only --physics substep")
+            match = FreeForAllSimulator(args.teams, seed=args.seed, arena=arena, physics=args.physics)
+        else:
+            match = MatchSimulator(args.teams[0], args.teams[1], knockout=args.knockout, seed=args.seed,
+                                   physics=args.physics, arena=arena)
+        res = record_match(match, args.out, args.arena)
+        print(res)
+    else:
+        args.out = args.file
+
+    header, frames, events = read_replay(args.out)
+    size = os.path.getsize(args.out)
+    print(f"{args.out}: {' v '.join(header['teams'])}, seed {header['seed']}, {header['arena']}, "
+          f"engine {header['engine']}")
+    print(f"  {len(frames)} frames x {frames.dtype.itemsize} bytes, {len(events)} events, "
+          f"{len(header['goals'])} goals, {size / 1024:.1f} KiB")
+    if header.get("penalties"):
+        print(f"  penalties {header['penalties'][0]}-{header['penalties'][1]}")
@@ -0,0 +1,177 @@
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from futbol_teams import LEAGUES
+from futbol_engine import MatchSimulator
+
+# =====================================================================
+#                        1. FIXTURES
+# =====================================================================
+def double_round_robin(teams):
+    # Circle method: every team meets every other team once at home and once away
+    teams = list(teams)
+    if len(teams) % 2: teams.append(None)
+    n = len(teams)
+    rounds = []
+    rot = teams[1:]
+    for r in range(n - 1):
+        line = [teams[0]] + rot
+        pairs = []
+        for i in range(n // 2):
+            a, b = line[i], line[n - 1 - i]
+            if a is None or b is None: continue
+            pairs.append((a, b) if r % 2 == 0 else (b, a))
+        rounds.append(pairs)
+        rot = rot[-1:] + rot[:-1]
+    return rounds + [[(b, a) for a, b in pairs] for pairs in rounds]
+
+# =====================================================================
+#                        2. SEASON WORKER
+# =====================================================================
+def season_seeds(seed):
+    # Independent children for the matches and the coin-toss tiebreak, so
+    # tiebreaks never read the bits that drew the matches
+    sim_ss, tie_ss = np.random.SeedSequence(seed).spawn(2)
+    return sim_ss, tie_ss
+
+def play_fixtures(home_keys, away_keys, seed, engine):
+    # seed: int or SeedSequence
+    if engine == "batch":
+        from futbol_batch import BatchSimulator
+        sim = BatchSimulator(home_keys, away_keys, seed=seed)
+        sim.run()
+        return sim.score.copy()
+    if not isinstance(seed, np.random.SeedSequence): seed = np.random.SeedSequence(seed)
+    seeds = seed.generate_state(len(home_keys)).tolist()
+    score = np.zeros((len(home_keys), 2), dtype=np.int32)
+    for m, (home, away, match_seed) in enumerate(zip(home_keys, away_keys, seeds)):
+        res = MatchSimulator(home, away, seed=match_seed).run()
+        score[m] = res.score1, res.score2
+    return score
+
+def season_tables(teams, fixtures, score, rng):
+    # score: (seasons, fixtures, 2) -> points (seasons, teams), positions (seasons, teams)
+    index = {name: i for i, name in enumerate(teams)}
+    home = np.array([index[h] for h, _ in fixtures])
+    away = np.array([index[a] for _, a in fixtures])
+    n_seasons, n_teams = score.shape[0], len(teams)
+
+    hg, ag = score[:, :, 0], score[:, :, 1]
+    home_pts = np.where(hg > ag, 3, np.where(hg == ag, 1, 0))
+    away_pts = np.where(ag > hg, 3, np.where(hg == ag, 1, 0))
+
+    points = np.zeros((n_seasons, n_teams), dtype=np.int32)
+    gd = np.zeros((n_seasons, n_teams), dtype=np.int32)
+    gf = np.zeros((n_seasons, n_teams), dtype=np.int32)
+    for s in range(n_seasons):
+        np.add.at(points[s], home, home_pts[s])
+        np.add.at(points[s], away, away_pts[s])
+        np.add.at(gd[s], home, hg[s] - ag[s])
+        np.add.at(gd[s], away, ag[s] - hg[s])
+        np.add.at(gf[s], home, hg[s])
+        np.add.at(gf[s], away, ag[s])
+
+    # Points, then goal difference, then goals scored, then a coin toss
+    tiebreak = rng.random((n_seasons, n_teams))
+    positions = np.zeros((n_seasons, n_teams), dtype=np.int32)
+    for s in range(n_seasons):
+        order = np.lexsort((tiebreak[s], -gf[s], -gd[s], -points[s]))
+        positions[s, order] = np.arange(n_teams)
+    return points, positions
+
+def simulate_seasons(league, n_seasons, seed, engine="batch"):
+    teams = LEAGUES[league]
+    fixtures = [pair for rnd in double_round_robin(teams) for pair in rnd]
+    home_keys = [h for h, _ in fixtures] * n_seasons
+    away_keys = [a for _, a in fixtures] * n_seasons
+
+    sim_ss, tie_ss = season_seeds(seed)
+    score = play_fixtures(home_keys, away_keys, sim_ss, engine)
+    score = score.reshape(n_seasons, len(fixtures), 2)
+    points, positions = season_tables(teams, fixtures, score, np.random.default_rng(tie_ss))
+
+    n_teams = len(teams)
+    return {
+        "seasons": n_seasons,
+        "matches": n_seasons * len(fixtures),
+        "points": points.sum(axis=0),
+        "titles": (positions == 0).sum(axis=0),
+        "top4": (positions < 4).sum(axis=0),
+        "relegated": (positions >= n_teams - 3).sum(axis=0),
+    }
+
+# =====================================================================
+#                        3. MONTE CARLO DRIVER
+# =====================================================================
+class SeasonStats:
+    def __init__(self, teams):
+        self.teams = teams
+        self.seasons = 0
+        self.matches = 0
+        n = len(teams)
+        self.points = np.zeros(n)
+        self.titles = np.zeros(n)
+        self.top4 = np.zeros(n)
+        self.relegated = np.zeros(n)
+
+    def add(self, chunk):
+        self.seasons += chunk["seasons"]
+        self.matches += chunk["matches"]
+        self.points += chunk["points"]
+        self.titles += chunk["titles"]
+        self.top4 += chunk["top4"]
+        self.relegated += chunk["relegated"]
+
+    def table(self):
+        n = max(self.seasons, 1)
+        rows = []
+        for i, name in enumerate(self.teams):
+            rows.append((name, self.points[i] / n, self.titles[i] / n, self.top4[i] / n, self.relegated[i] / n))
+        rows.sort(key=lambda r: (-r[1], -r[2]))
+        return rows
+
+    def format(self):
+        lines = [f"{'TEAM':<18}{'xPTS':>7}{'TITLE':>8}{'TOP4':>8}{'RELEG':>8}"]
+        for name, pts, title, top4, releg in self.table():
+            lines.append(f"{name:<18}{pts:>7.1f}{title:>8.1%}{top4:>8.1%}{releg:>8.1%}")
+        return "\n".join(lines)
+
+def run_monte_carlo(league, seasons, workers=None, chunk=4, seed=0, engine="batch", progress=None):
+    workers = workers or os.cpu_count() or 1
+    stats = SeasonStats(LEAGUES[league])
+    sizes = [min(chunk, seasons - i) for i in range(0, seasons, chunk)]
+    seeds = np.random.SeedSequence(seed).generate_state(len(sizes))
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(simulate_seasons, league, size, int(s), engine) for size, s in zip(sizes, seeds)]
+        for fut in as_completed(futures):
+            stats.add(fut.result())
+            if progress: progress(stats)
+    return stats
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Monte Carlo season simulator")
+    parser.add_argument("--league", default="TR", choices=sorted(LEAGUES))
+    parser.add_argument("--seasons", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk", type=int, default=4, help="seasons per worker task")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--engine", default="batch", choices=["batch", "scalar"])
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    last = [0.0]
+
+    def show(stats):
+        now = time.perf_counter()
+        if stats.seasons < args.seasons and now - last[0] < 2.0: return
+        last[0] = now
+        rate = stats.matches / (now - t0)
+        print(f"\n[{stats.seasons}/{args.seasons} seasons, {rate:,.0f} matches/s]")
+        print(stats.format())
+
+    run_monte_carlo(args.league, args.seasons, args.workers, args.chunk, args.seed, args.engine, show)
@@ -0,0 +1,155 @@
+import argparse
+import csv
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+import futbol_engine
+import futbol_batch
+from futbol_teams import TEAM_NAMES
+
+# =====================================================================
+#                        1. TUNABLE CONSTANTS
+# =====================================================================
+# name -> (engine global, default range for random designs)
+PARAMS = {
+    "GRAVITY": ("GRAVITY", (0.0, 0.05)),
+    "BOUNCE_DAMPING": ("BOUNCE_DAMPING", (0.85, 1.0)),
+    "FRICTION": ("FRICTION", (0.995, 1.0)),
+    "ELASTICITY": ("ELASTICITY", (0.95, 1.1)),
+    "POST_ELASTICITY": ("POST_ELASTICITY", (0.95, 1.15)),
+    "GOAL_WIDTH_RADIANS": ("GOAL_WIDTH_RADIANS", (0.3, 0.6)),
+    "goal_rot_speed": ("GOAL_ROT_SPEED", (0.005, 0.03)),
+    "SPEED": ("SPEED", (4.0, 7.0)),
+    "MIN_SPEED": ("MIN_SPEED", (3.0, 5.0)),
+}
+DEFAULTS = {name: getattr(futbol_engine, attr) for name, (attr, _) in PARAMS.items()}
+
+# Target statistic -> scale used to normalise its error in the fit
+STAT_SCALES = {"goals": 0.5, "draw_rate": 0.05, "post_hits": 0.5}
+
+def apply_constants(params):
+    # Workers are reused between points, so every constant is reset first
+    for name, (attr, _) in PARAMS.items():
+        value = params.get(name, DEFAULTS[name])
+        setattr(futbol_engine, attr, value)
+        setattr(futbol_batch, attr, value)
+
+# =====================================================================
+#                        2. DESIGNS
+# =====================================================================
+def grid_design(grid):
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*(grid[n] for n in names))]
+
+def random_design(ranges, n, seed=0):
+    # Latin hypercube: every range is cut into n strata, each used once
+    rng = np.random.default_rng(seed)
+    points = [{} for _ in range(n)]
+    for name, (low, high) in ranges.items():
+        u = (rng.permutation(n) + rng.random(n)) / n
+        for point, v in zip(points, low + u * (high - low)):
+            point[name] = float(v)
+    return points
+
+# =====================================================================
+#                        3. EVALUATION
+# =====================================================================
+def evaluate_point(params, matches, seed):
+    apply_constants(params)
+    # Random fixtures from the whole team list; the same seed at every point
+    # (common random numbers) keeps differences between points low-noise
+    rng = np.random.default_rng(seed)
+    pairs = [rng.choice(len(TEAM_NAMES), 2, replace=False) for _ in range(matches)]
+    sim = futbol_batch.BatchSimulator([TEAM_NAMES[a] for a, _ in pairs], [TEAM_NAMES[b] for _, b in pairs], seed=seed)
+    sim.run()
+    return params, {
+        "goals": float(sim.score.sum(axis=1).mean()),
+        "draw_rate": float((sim.score[:, 0] == sim.score[:, 1]).mean()),
+        "post_hits": float(sim.post_hits.mean()),
+    }
+
+def fit_loss(stats, targets):
+    return sum(((stats[k] - v) / STAT_SCALES[k]) ** 2 for k, v in targets.items())
+
+def run_sweep(points, matches, targets, workers=None, seed=0, progress=None):
+    workers = workers or os.cpu_count() or 1
+    rows = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(evaluate_point, p, matches, seed) for p in points]
+        for fut in as_completed(futures):
+            params, stats = fut.result()
+            rows.append((params, stats, fit_loss(stats, targets)))
+            if progress: progress(len(rows), len(points))
+    rows.sort(key=lambda r: r[2])
+    return rows
+
+def refine_ranges(ranges, best, shrink=0.5):
+    # Narrow every range around the best point, clipped to the previous range
+    out = {}
+    for name, (low, high) in ranges.items():
+        half = (high - low) * shrink / 2
+        centre = min(max(best[name], low + half), high - half)
+        out[name] = (centre - half, centre + half)
+    return out
+
+def write_table(path, rows, targets):
+    names = [n for n in PARAMS if any(n in p for p, _, _ in rows)]
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(names + list(STAT_SCALES) + ["loss"])
+        for params, stats, loss in rows:
+            writer.writerow([f"{params.get(n, DEFAULTS[n]):.6g}" for n in names] +
+                            [f"{stats[k]:.4f}" for k in STAT_SCALES] + [f"{loss:.4f}" if targets else ""])
+
+# =====================================================================
+#                        4. COMMAND LINE
+# =====================================================================
+def parse_assignments(items, cast):
+    out = {}
+    for item in items:
+        name, _, value = item.partition("=")
+        out[name] = cast(value)
+    return out
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Physics constant sweep and calibration")
+    parser.add_argument("--grid", action="append", default=[], help="NAME=v1,v2,... (cartesian product)")
+    parser.add_argument("--range", action="append", default=[], help="NAME=low:high for random designs")
+    parser.add_argument("--random", type=int, default=0, help="random (Latin hypercube) points per round")
+    parser.add_argument("--rounds", type=int, default=1, help="random rounds, each narrowed around the best point")
+    parser.add_argument("--target", action="append", default=[], help="goals=, draw_rate= or post_hits=")
+    parser.add_argument("--matches", type=int, default=1000, help="matches per point")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="sweep.csv")
+    args = parser.parse_args()
+
+    targets = parse_assignments(args.target, float)
+    grid = parse_assignments(args.grid, lambda v: [float(x) for x in v.split(",")])
+    ranges = parse_assignments(args.range, lambda v: tuple(float(x) for x in v.split(":")))
+    if args.random and not ranges:
+        ranges = {name: r for name, (_, r) in PARAMS.items()}
+
+    t0 = time.perf_counter()
+    def show(done, total):
+        print(f"  {done}/{total} points, {time.perf_counter() - t0:.0f} s", end="\r")
+
+    rows = []
+    if grid or not args.random:
+        rows += run_sweep(grid_design(grid), args.matches, targets, args.workers, args.seed, show)
+    for rnd in range(args.rounds if args.random else 0):
+        if rnd and targets:
+            ranges = refine_ranges(ranges, {**DEFAULTS, **rows[0][0]})
+        points = random_design(ranges, args.random, args.seed + rnd)
+        rows += run_sweep(points, args.matches, targets, args.workers, args.seed, show)
+        rows.sort(key=lambda r: r[2])
+
+    write_table(args.out, rows, targets)
+    print(f"\n{len(rows)} points written to {args.out}")
+    params, stats, loss = rows[0]
+    print("best:", ", ".join(f"{k}={v:.6g}" for k, v in params.items()) or "defaults")
+    print("     ", ", ".join(f"{k}={v:.3f}" for k, v in stats.items()), f"loss={loss:.3f}")
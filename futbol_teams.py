@@ -0,0 +1,347 @@
+import os
+import random
+
+# =====================================================================
+#                        1. TEAM DATABASE
+# =====================================================================
+# Team database is excluded from color overrides to maintain real team colors
+TEAMS = {
+    "GALATASARAY":    {"colors": [(169, 4, 50), (253, 185, 18)], "short": "GS"},
+    "FENERBAHÇE":     {"colors": [(255, 255, 0), (0, 0, 128)],   "short": "FB"},
+    "BEŞİKTAŞ":       {"colors": [(255, 255, 255), (10, 10, 10)],"short": "BJK"},
+    "TRABZONSPOR":    {"colors": [(128, 0, 0), (0, 191, 255)],   "short": "TS"},
+    "BAŞAKŞEHİR":     {"colors": [(255, 102, 0), (0, 0, 102)],   "short": "BFK"},
+    "KASIMPAŞA":      {"colors": [(255, 255, 255), (0, 0, 128)], "short": "KAS"},
+    "SİVASSPOR":      {"colors": [(255, 0, 0), (255, 255, 255)], "short": "SVS"},
+    "ALANYASPOR":     {"colors": [(255, 165, 0), (0, 128, 0)],   "short": "ALN"},
+    "RİZESPOR":       {"colors": [(0, 128, 0), (0, 0, 255)],     "short": "RİZ"},
+    "NOTTM FOREST":   {"colors": [(229, 30, 42), (255, 255, 255)],"short": "NFO"},
+    "ANTALYASPOR":    {"colors": [(255, 0, 0), (255, 255, 255)], "short": "ANT"},
+    "GAZİANTEP FK":   {"colors": [(200, 16, 46), (10, 10, 10)],  "short": "GFK"},
+    "KONYASPOR":      {"colors": [(0, 128, 0), (255, 255, 255)], "short": "KON"},
+    "KAYSERİSPOR":    {"colors": [(255, 204, 0), (255, 0, 0)],   "short": "KAY"},
+    "BODRUM FK":      {"colors": [(0, 128, 0), (255, 255, 255)], "short": "BOD"},
+    "EYÜPSPOR":       {"colors": [(230, 230, 250), (255, 215, 0)],"short": "EYP"},
+    "GÖZTEPE":        {"colors": [(255, 215, 0), (255, 0, 0)],   "short": "GÖZ"},
+    "SAMSUNSPOR":     {"colors": [(255, 0, 0), (255, 255, 255)], "short": "SAM"},
+    "KOCAELİSPOR":    {"colors": [(0, 128, 0), (10, 10, 10)],   "short": "KOC"},
+    "KARAGÜMRÜK":     {"colors": [(255, 0, 0), (10, 10, 10)],    "short": "FKG"},
+    "GENÇLERBİRLİĞİ": {"colors": [(200, 16, 46), (10, 10, 10)],  "short": "GEN"},
+    "HATAYSPOR":      {"colors": [(128, 0, 0), (255, 255, 255)], "short": "HAT"},
+    "ADANA DEMİR":    {"colors": [(0, 0, 255), (173, 216, 230)], "short": "ADS"},
+    "MAN CITY":       {"colors": [(108, 171, 221), (255, 255, 255)],"short": "MC"},
+    "LIVERPOOL":      {"colors": [(200, 16, 46), (255, 255, 255)],  "short": "LIV"},
+    "ARSENAL":        {"colors": [(239, 1, 7), (255, 255, 255)],    "short": "ARS"},
+    "ASTON VILLA":    {"colors": [(103, 14, 54), (149, 191, 229)],  "short": "AVL"},
+    "TOTTENHAM":      {"colors": [(255, 255, 255), (19, 34, 87)],   "short": "TOT"},
+    "MAN UTD":        {"colors": [(218, 41, 28), (255, 255, 255)],  "short": "MUN"},
+    "CHELSEA":        {"colors": [(3, 70, 148), (255, 255, 255)],   "short": "CHE"},
+    "REAL MADRID":    {"colors": [(255, 255, 255), (255, 215, 0)],"short": "RMA"},
+    "BARCELONA":      {"colors": [(0, 77, 152), (165, 0, 68)],    "short": "BAR"},
+    "ATLETICO":       {"colors": [(203, 53, 36), (255, 255, 255)],"short": "ATM"},
+    "GIRONA":         {"colors": [(200, 16, 46), (255, 255, 255)],"short": "GIR"},
+    "B. MUNIH":       {"colors": [(220, 5, 45), (255, 255, 255)], "short": "BAY"},
+    "DORTMUND":       {"colors": [(253, 225, 0), (10, 10, 10)],   "short": "BVB"},
+    "LEVERKUSEN":     {"colors": [(10, 10, 10), (227, 34, 25)],   "short": "B04"},
+    "RB LEIPZIG":     {"colors": [(255, 255, 255), (221, 5, 43)], "short": "RBL"},
+    "CLUB BRUGGE":    {"colors": [(0, 0, 0), (0, 116, 217)],      "short": "CLB"},
+    "NEWCASTLE":      {"colors": [(0, 0, 0), (255, 255, 255)],    "short": "NEW"},
+    "QARABAG":        {"colors": [(0, 0, 128), (227, 141, 26)],   "short": "QFK"},
+    "OLYMPIACOS":     {"colors": [(255, 255, 255), (221, 0, 0)],  "short": "OLY"},
+    "BODO/GLIMT":     {"colors": [(255, 220, 0), (0, 0, 0)],      "short": "BOD"},
+    "INTER":          {"colors": [(0, 102, 187), (10, 10, 10)],   "short": "INT"},
+    "MILAN":          {"colors": [(251, 9, 11), (10, 10, 10)],    "short": "MIL"},
+    "JUVENTUS":       {"colors": [(255, 255, 255), (10, 10, 10)], "short": "JUV"},
+    "ATALANTA":       {"colors": [(30, 113, 184), (10, 10, 10)],  "short": "ATA"},
+    "ROMA":           {"colors": [(134, 38, 51), (240, 188, 66)], "short": "ROM"},
+    "LAZIO":          {"colors": [(135, 206, 235), (255, 255, 255)],"short": "LAZ"},
+    "PSG":            {"colors": [(0, 65, 112), (218, 41, 28)],   "short": "PSG"},
+    "LILLE":          {"colors": [(238, 36, 54), (0, 51, 102)],   "short": "LIL"},
+    "MONACO":         {"colors": [(255, 0, 0), (255, 255, 255)],  "short": "ASM"},
+    "BENFICA":        {"colors": [(232, 48, 48), (255, 255, 255)],"short": "SLB"},
+    "SPORTING":       {"colors": [(0, 128, 0), (255, 255, 255)],  "short": "SCP"},
+    "PORTO":          {"colors": [(0, 0, 255), (255, 255, 255)],  "short": "POR"},
+    "AJAX":           {"colors": [(255, 255, 255), (210, 18, 46)],"short": "AJX"},
+    "PSV":            {"colors": [(255, 0, 0), (255, 255, 255)],  "short": "PSV"},
+    "FEYENOORD":      {"colors": [(255, 255, 255), (255, 0, 0)],  "short": "FEY"},
+    "PANATHINAIKOS":  {"colors": [(0, 123, 58), (255, 255, 255)], "short": "PAO"},
+    "VIKTORIA PLZEN": {"colors": [(237, 27, 36), (0, 77, 152)],   "short": "PLZ"},
+    "DINAMO ZAGREB":  {"colors": [(0, 51, 153), (255, 255, 255)], "short": "DZG"},
+    "GENK":           {"colors": [(0, 71, 156), (255, 255, 255)], "short": "GNK"},
+    "BRANN":          {"colors": [(226, 0, 26), (255, 255, 255)], "short": "BRA"},
+    "BOLOGNA":        {"colors": [(158, 27, 50), (26, 35, 66)],   "short": "BOL"},
+    "PAOK":           {"colors": [(0, 0, 0), (255, 255, 255)],    "short": "PAOK"},
+    "CELTA VIGO":     {"colors": [(138, 195, 238), (255, 255, 255)],"short": "CEL"},
+    "LUDOGORETS":     {"colors": [(13, 104, 56), (255, 255, 255)],"short": "LUD"},
+    "FERENCVAROS":    {"colors": [(28, 127, 55), (255, 255, 255)],"short": "FER"},
+    "CRVENA ZVEZDA":  {"colors": [(208, 16, 35), (255, 255, 255)],"short": "CZV"},
+    "CELTIC":         {"colors": [(0, 128, 0), (255, 255, 255)],  "short": "CLT"},
+    "STUTTGART":      {"colors": [(255, 255, 255), (227, 34, 25)],"short": "VFB"},
+    "AUGSBURG":       {"colors": [(255, 255, 255), (186, 32, 38)], "short": "AUG"},
+    "FRANKFURT":      {"colors": [(0, 0, 0), (227, 34, 25)],       "short": "FRA"},
+    "FREIBURG":       {"colors": [(218, 41, 28), (255, 255, 255)], "short": "FRE"},
+    "HAMBURG":        {"colors": [(0, 85, 164), (255, 255, 255)],  "short": "HSV"},
+    "HEIDENHEIM":     {"colors": [(227, 34, 25), (0, 51, 160)],    "short": "HEI"},
+    "HOFFENHEIM":     {"colors": [(0, 92, 169), (255, 255, 255)],  "short": "HOF"},
+    "KÖLN":           {"colors": [(227, 34, 25), (255, 255, 255)], "short": "KÖL"},
+    "MAINZ 05":       {"colors": [(237, 28, 36), (255, 255, 255)], "short": "MAI"},
+    "M. GLADBACH":    {"colors": [(0, 0, 0), (255, 255, 255)],     "short": "BMG"},
+    "ST. PAULI":      {"colors": [(105, 57, 4), (255, 255, 255)],  "short": "STP"},
+    "UNION BERLIN":   {"colors": [(218, 41, 28), (255, 255, 255)], "short": "UNB"},
+    "WERDER BREMEN":  {"colors": [(29, 162, 83), (255, 255, 255)], "short": "WER"},
+    "WOLFSBURG":      {"colors": [(98, 179, 48), (255, 255, 255)], "short": "WOB"},
+    "BOURNEMOUTH":    {"colors": [(200, 16, 46), (0, 0, 0)],        "short": "BOU"},
+    "BRENTFORD":      {"colors": [(227, 6, 19), (255, 255, 255)],   "short": "BRE"},
+    "BRIGHTON":       {"colors": [(0, 87, 184), (255, 255, 255)],   "short": "BHA"},
+    "BURNLEY":        {"colors": [(108, 29, 69), (153, 214, 234)],  "short": "BUR"},
+    "EVERTON":        {"colors": [(0, 51, 153), (255, 255, 255)],   "short": "EVE"},
+    "FULHAM":         {"colors": [(255, 255, 255), (0, 0, 0)],      "short": "FUL"},
+    "LEEDS UTD":      {"colors": [(255, 255, 255), (29, 66, 138)],  "short": "LEE"},
+    "CRYSTAL PALACE": {"colors": [(27, 69, 143), (196, 18, 46)],    "short": "CRY"},
+    "SUNDERLAND":     {"colors": [(255, 0, 0), (255, 255, 255)],    "short": "SUN"},
+    "WEST HAM":       {"colors": [(122, 38, 58), (27, 177, 231)],   "short": "WHU"},
+    "WOLVES":         {"colors": [(253, 185, 19), (0, 0, 0)],       "short": "WOL"},
+    "CAGLIARI":       {"colors": [(163, 19, 51), (0, 35, 80)],     "short": "CAG"},
+    "COMO":           {"colors": [(0, 71, 169), (255, 255, 255)],  "short": "COM"},
+    "CREMONESE":      {"colors": [(130, 130, 130), (227, 34, 25)], "short": "CRE"},
+    "FIORENTINA":     {"colors": [(72, 46, 146), (255, 255, 255)], "short": "FIO"},
+    "GENOA":          {"colors": [(166, 28, 49), (0, 36, 81)],     "short": "GNO"},
+    "LECCE":          {"colors": [(255, 217, 0), (227, 34, 25)],   "short": "LEC"},
+    "NAPOLI":         {"colors": [(18, 160, 215), (255, 255, 255)],"short": "NAP"},
+    "PARMA":          {"colors": [(255, 204, 0), (0, 51, 153)],    "short": "PAR"},
+    "PISA":           {"colors": [(0, 0, 0), (0, 84, 166)],        "short": "PIS"},
+    "SASSUOLO":       {"colors": [(0, 160, 90), (0, 0, 0)],        "short": "SAS"},
+    "TORINO":         {"colors": [(138, 30, 50), (255, 255, 255)], "short": "TOR"},
+    "UDINESE":        {"colors": [(0, 0, 0), (255, 255, 255)],     "short": "UDI"},
+    "VERONA":         {"colors": [(0, 51, 102), (255, 204, 0)],    "short": "VER"},
+    # --- LA LIGA (NEW) ---
+    "ATHLETIC CLUB":  {"colors": [(237, 28, 36), (255, 255, 255)], "short": "ATH"},
+    "REAL SOCIEDAD":  {"colors": [(0, 103, 177), (255, 255, 255)], "short": "RSO"},
+    "VILLARREAL":     {"colors": [(255, 230, 0), (0, 0, 102)],     "short": "VIL"},
+    "VALENCIA":       {"colors": [(255, 255, 255), (0, 0, 0)],     "short": "VAL"},
+    "SEVILLA":        {"colors": [(255, 255, 255), (218, 41, 28)], "short": "SEV"},
+    "REAL BETIS":     {"colors": [(0, 148, 72), (255, 255, 255)],  "short": "BET"},
+    "OSASUNA":        {"colors": [(193, 29, 39), (0, 27, 73)],     "short": "OSA"},
+    "MALLORCA":       {"colors": [(226, 0, 26), (0, 0, 0)],        "short": "MLL"},
+    "ALAVES":         {"colors": [(0, 68, 148), (255, 255, 255)],  "short": "ALA"},
+    "RAYO VALLECANO": {"colors": [(255, 255, 255), (227, 6, 19)],  "short": "RAY"},
+    "GETAFE":         {"colors": [(0, 75, 151), (255, 255, 255)],  "short": "GET"},
+    "ESPANYOL":       {"colors": [(0, 122, 195), (255, 255, 255)], "short": "ESP"},
+    "ELCHE":          {"colors": [(0, 100, 0), (255, 255, 255)],   "short": "ELC"},
+    "OVIEDO":         {"colors": [(0, 51, 160), (255, 255, 255)],  "short": "OVI"},
+    "LEVANTE":        {"colors": [(0, 51, 102), (153, 0, 51)],     "short": "LEV"},
+
+    # --- LIGUE 1 (NEW) ---
+    "MARSEILLE":      {"colors": [(255, 255, 255), (0, 150, 214)], "short": "OM"},
+    "LYON":           {"colors": [(255, 255, 255), (218, 41, 28)], "short": "OL"},
+    "LENS":           {"colors": [(237, 28, 36), (255, 215, 0)],   "short": "RCL"},
+    "NICE":           {"colors": [(218, 41, 28), (0, 0, 0)],       "short": "NIC"},
+    "RENNES":         {"colors": [(227, 34, 25), (0, 0, 0)],       "short": "REN"},
+    "STRASBOURG":     {"colors": [(0, 82, 159), (255, 255, 255)],  "short": "STR"},
+    "REIMS":          {"colors": [(226, 0, 26), (255, 255, 255)],  "short": "SDR"},
+    "TOULOUSE":       {"colors": [(92, 45, 145), (255, 255, 255)], "short": "TFC"},
+    "NANTES":         {"colors": [(253, 233, 34), (0, 100, 50)],   "short": "FCN"},
+    "MONTPELLIER":    {"colors": [(0, 35, 96), (243, 108, 33)],    "short": "MHS"},
+    "ANGERS":         {"colors": [(0, 0, 0), (255, 255, 255)],     "short": "SCO"},
+    "BREST":          {"colors": [(226, 0, 26), (255, 255, 255)],  "short": "SB2"},
+    "LE HAVRE":       {"colors": [(111, 172, 222), (0, 31, 73)],   "short": "HAC"},
+    "AUXERRE":        {"colors": [(255, 255, 255), (0, 68, 148)],  "short": "AJA"},
+    "SAINT-ETIENNE":  {"colors": [(0, 102, 51), (255, 255, 255)],  "short": "ASE"},
+
+    # --- MLS (NEW) ---
+    "INTER MIAMI":    {"colors": [(244, 181, 205), (0, 0, 0)],     "short": "MIA"},
+    "LAFC":           {"colors": [(0, 0, 0), (195, 158, 109)],     "short": "LAF"},
+    "LA GALAXY":      {"colors": [(0, 36, 93), (255, 210, 0)],     "short": "LAG"},
+    "COLUMBUS CREW":  {"colors": [(255, 223, 0), (0, 0, 0)],       "short": "CCW"},
+    "FC CINCINNATI":  {"colors": [(240, 83, 35), (38, 59, 128)],   "short": "CIN"},
+    "SEATTLE SOUNDERS":{"colors": [(93, 151, 50), (0, 85, 149)],   "short": "SEA"},
+    "NEW YORK CITY FC":{"colors": [(108, 172, 228), (4, 30, 66)],  "short": "NYC"},
+    "NY RED BULLS":   {"colors": [(226, 24, 54), (255, 255, 255)], "short": "NYR"},
+    "ATLANTA UTD":    {"colors": [(128, 0, 0), (0, 0, 0)],         "short": "ATL"},
+    "PORTLAND TIMBERS":{"colors": [(0, 72, 39), (234, 170, 0)],    "short": "PTL"},
+    "ORLANDO CITY":   {"colors": [(99, 52, 146), (255, 255, 255)], "short": "ORL"},
+    "HOUSTON DYNAMO": {"colors": [(255, 107, 0), (0, 0, 0)],       "short": "HOU"},
+    "REAL SALT LAKE": {"colors": [(179, 11, 34), (1, 31, 91)],     "short": "RSL"},
+    "PHILADELPHIA U.":{"colors": [(0, 45, 85), (179, 163, 105)],   "short": "PHI"},
+    "SPORTING KC":    {"colors": [(145, 176, 213), (0, 42, 92)],   "short": "SKC"},
+    "NEW ENGLAND REV":{"colors": [(226, 24, 54), (0, 43, 92)],     "short": "NER"},
+    "NASHVILLE SC":   {"colors": [(236, 232, 58), (31, 22, 70)],   "short": "NSC"},
+    "FC DALLAS":      {"colors": [(226, 24, 54), (0, 62, 126)],    "short": "DAL"},
+    "VANCOUVER WC":   {"colors": [(0, 36, 94), (255, 255, 255)],   "short": "VAN"},
+    "MINNESOTA UTD":  {"colors": [(135, 142, 144), (122, 184, 237)],"short": "MIN"},
+    "COLORADO RAPIDS":{"colors": [(134, 38, 51), (139, 171, 204)], "short": "COL"},
+    "CHARLOTTE FC":   {"colors": [(0, 133, 202), (0, 0, 0)],       "short": "CHR"},
+    "SAN JOSE EQ":    {"colors": [(0, 0, 0), (0, 81, 186)],        "short": "SJE"},
+    "AUSTIN FC":      {"colors": [(0, 180, 81), (0, 0, 0)],        "short": "AUS"},
+    "CHICAGO FIRE":   {"colors": [(255, 0, 0), (0, 42, 92)],       "short": "CHI"},
+    "D.C. UNITED":    {"colors": [(0, 0, 0), (239, 62, 66)],       "short": "DCU"},
+    "CF MONTREAL":    {"colors": [(0, 51, 160), (0, 0, 0)],        "short": "MTL"},
+    "ST. LOUIS CITY": {"colors": [(226, 24, 54), (0, 43, 92)],     "short": "STL"},
+    "TORONTO FC":     {"colors": [(227, 38, 54), (32, 42, 68)],    "short": "TFC"},
+    "SAN DIEGO FC":   {"colors": [(0, 193, 213), (0, 0, 0)],       "short": "SDF"},
+
+    # --- SAUDI PRO LEAGUE (NEW) ---
+    "AL HILAL":       {"colors": [(0, 94, 184), (255, 255, 255)],  "short": "HIL"},
+    "AL NASSR":       {"colors": [(254, 209, 65), (0, 52, 120)],   "short": "NAS"},
+    "AL AHLI":        {"colors": [(0, 166, 81), (255, 255, 255)],  "short": "AHL"},
+    "AL ITTIHAD":     {"colors": [(255, 215, 0), (0, 0, 0)],       "short": "ITT"},
+    "AL SHABAB":      {"colors": [(255, 255, 255), (0, 0, 0)],     "short": "SHA"},
+    "AL TAAWOUN":     {"colors": [(255, 215, 0), (0, 51, 153)],    "short": "TAA"},
+    "AL ETTIFAQ":     {"colors": [(0, 128, 64), (255, 255, 255)],  "short": "ETT"},
+    "DAMAC":          {"colors": [(255, 0, 0), (255, 215, 0)],     "short": "DAM"},
+    "AL FAYHA":       {"colors": [(255, 165, 0), (0, 0, 255)],     "short": "FAY"},
+    "AL FATEH":       {"colors": [(0, 100, 0), (255, 255, 255)],   "short": "FAT"},
+    "AL RIYADH":      {"colors": [(255, 0, 0), (0, 0, 0)],         "short": "RIY"},
+    "AL WEHDA":       {"colors": [(255, 0, 0), (255, 255, 255)],   "short": "WEH"},
+    "AL KHALEEJ":     {"colors": [(255, 255, 0), (0, 128, 0)],     "short": "KHA"},
+    "AL RAED":        {"colors": [(255, 0, 0), (0, 0, 0)],         "short": "RAE"},
+    "AL QADSIAH":     {"colors": [(255, 0, 0), (255, 255, 0)],     "short": "QAD"},
+    "AL OKHDOOD":     {"colors": [(0, 191, 255), (255, 255, 255)], "short": "OKH"},
+    "NEOM SC":        {"colors": [(0, 0, 139), (255, 215, 0)],     "short": "NEO"},
+    "AL KHOLOOD":     {"colors": [(255, 0, 0), (255, 255, 255)],   "short": "KHO"},
+}
+
+TEAM_NAMES = sorted(list(TEAMS.keys()))
+
+# =====================================================================
+#                        2. PLAYER DATABASE
+# =====================================================================
+PLAYER_DATABASE = {}
+
+def load_player_database():
+    db = {}
+    base_path = os.path.dirname(os.path.abspath(__file__))
+    file_path = os.path.join(base_path, "players.txt")
+
+    if os.path.exists(file_path):
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if ":" in line:
+                        parts = line.split(":")
+                        t_name = parts[0].strip().upper()
+                        p_names = [p.strip() for p in parts[1].split(",")]
+                        p_names = [p for p in p_names if p]
+                        if p_names:
+                            db[t_name] = p_names
+        except Exception as e:
+            pass
+    return db
+
+PLAYER_DATABASE = load_player_database()
+
+def get_random_player_name(team_key, label="Player", rng=random):
+    if team_key in PLAYER_DATABASE:
+        players = PLAYER_DATABASE[team_key]
+        if players:
+            return rng.choice(players)
+    return f"{label} {rng.randint(1, 3)}"
+
+# =====================================================================
+#                        3. LOGO TABLES (per league folder)
+# =====================================================================
+LOGO_FILES = {
+    "GS": "gs.png", "FB": "fb.png", "BJK": "bjk.png", "TS": "ts.png",
+    "ALN": "alanya.png", "ANT": "antalyaspor.png", "BFK": "basaksehir.png",
+    "EYP": "eyup.png", "GFK": "gaziantep.png", "GEN": "genclerbirligi.png",
+    "GÖZ": "goztepe.png", "FKG": "karagumruk.png", "KAS": "kasımpasa.png",
+    "KAY": "kayseri.png", "KOC": "kocaeli.png", "KON": "konya.png",
+    "RİZ": "rize.png", "SAM": "samsun.png"
+}
+
+LOGO_FILES_PL = {
+    "ARS": "arsenal.png", "AVL": "aston.png", "BOU": "bournemouth.png",
+    "BRE": "brentford.png", "BHA": "brighton.png", "BUR": "burnley.png",
+    "CHE": "chelsea.png", "EVE": "everton.png", "FUL": "fulham.png",
+    "LEE": "leeds.png", "LIV": "liverpool.png", "MC":  "mancity.png",
+    "MUN": "manunited.png", "NEW": "newcastle.png", "NFO": "nottinghamforest.png",
+    "CRY": "palace.png", "SUN": "sunderland.png", "TOT": "tottenham.png",
+    "WHU": "west ham.png", "WOL": "wolves.png"
+}
+
+LOGO_FILES_DE = {
+    "AUG": "augsburg.png",
+    "BAY": "bayern.png",
+    "BVB": "dortmund.png",
+    "FRA": "frankfurt.png",
+    "FRE": "freiburg.png",
+    "HSV": "hamburg.png",
+    "HEI": "heidenheim.png",
+    "HOF": "hoffenheim.png",
+    "KÖL": "koln.png",
+    "RBL": "leipzig.png",
+    "B04": "leverkusen.png",
+    "MAI": "mainz.png",
+    "BMG": "monchengladbach.png",
+    "STP": "stpauli.png",
+    "VFB": "stuttgart.png",
+    "UNB": "unionberlin.png",
+    "WER": "werderbremen.png",
+    "WOB": "wolfsburg.png"
+}
+
+LOGO_FILES_IT = {
+    "ATA": "atalanta.png",
+    "BOL": "bologna.png",
+    "CAG": "cagliari.png",
+    "COM": "como.png",
+    "CRE": "cremonese.png",
+    "FIO": "fiorentina.png",
+    "GNO": "genoa.png",
+    "INT": "inter.png",
+    "JUV": "juventus.png",
+    "LAZ": "lazio.png",
+    "LEC": "lecce.png",
+    "MIL": "milan.png",
+    "NAP": "napoli.png",
+    "PAR": "parma.png",
+    "PIS": "pisa.png",
+    "ROM": "roma.png",
+    "SAS": "sassuolo.png",
+    "TOR": "torino.png",
+    "UDI": "udinese.png",
+    "VER": "verona.png"
+}
+# İSPANYOL TAKIMLARI (imagesSP klasörü)
+LOGO_FILES_SP = {
+    "ALA": "alaves.png",
+    "ATH": "athleticbilbao.png",
+    "ATM": "atleticomadrid.png",
+    "BAR": "barcelona.png",
+    "CEL": "celtavigo.png",
+    "ELC": "elche.png",
+    "ESP": "espanyol.png",
+    "GET": "getafe.png",
+    "GIR": "girona.png",
+    "LEV": "levante.png",
+    "MLL": "mallorca.png",
+    "OSA": "osasuna.png",
+    "RAY": "rayovallecano.png",
+    "BET": "realbetis.png",
+    "RMA": "realmadrid.png",
+    "OVI": "realoviedo.png",
+    "RSO": "realsociedad.png",
+    "SEV": "sevilla.png",
+    "VAL": "valencia.png",
+    "VIL": "villereal.png"
+}
+
+# =====================================================================
+#                        4. LEAGUES
+# =====================================================================
+# A league is every team that has a logo in that league's image folder.
+LEAGUE_LOGO_TABLES = {
+    "TR": LOGO_FILES,
+    "PL": LOGO_FILES_PL,
+    "DE": LOGO_FILES_DE,
+    "IT": LOGO_FILES_IT,
+    "SP": LOGO_FILES_SP,
+}
+
+def build_leagues():
+    leagues = {}
+    for league, table in LEAGUE_LOGO_TABLES.items():
+        leagues[league] = [name for name in TEAM_NAMES if TEAMS[name]["short"] in table]
+    return leagues
+
+LEAGUES = build_leagues()
@@ -0,0 +1,28 @@
+import math
+
+import numpy as np
+import pytest
+
+from futbol_engine import ARENAS, SDF_CELL, make_arena
+
+SHAPES = sorted(name for name in ARENAS if name != "circle")
+
+def test_unknown_arena_is_a_value_error():
+    with pytest.raises(ValueError, match="unknown arena 'moon'"):
+        make_arena("moon")
+
+@pytest.mark.parametrize("name", SHAPES)
+def test_grid_matches_exact_distance(name):
+    arena = make_arena(name)
+    rng = np.random.default_rng(0)
+    for k in rng.integers(0, arena.cols * arena.rows, 200).tolist():
+        j, i = divmod(k, arena.cols)
+        exact = arena.exact_distance(arena.x0 + i * SDF_CELL, arena.y0 + j * SDF_CELL)
+        assert arena.d[k] == pytest.approx(exact, abs=1e-9)
+
+@pytest.mark.parametrize("name", SHAPES)
+def test_rim_sits_on_the_wall(name):
+    arena = make_arena(name)
+    for x, y, nx, ny in arena.rim_table:
+        assert abs(arena.shape_distance(x - arena.cx, y - arena.cy)) < 1e-6
+        assert math.hypot(nx, ny) == pytest.approx(1.0)
@@ -0,0 +1,31 @@
+import math
+
+import numpy as np
+
+from futbol_batch import simulate_batch
+from futbol_engine import MatchSimulator
+
+def test_batch_is_deterministic_per_seed():
+    home, away = ["NAPOLI"] * 50, ["LILLE"] * 50
+    assert simulate_batch(home, away, seed=2) == simulate_batch(home, away, seed=2)
+
+def test_scorelines_close_to_scalar_engine():
+    batch = simulate_batch(["NAPOLI"] * 2000, ["LILLE"] * 2000, seed=1)
+    scalar = [MatchSimulator("NAPOLI", "LILLE", seed=s).run() for s in range(200)]
+
+    def summary(results):
+        goals = np.array([r.score1 + r.score2 for r in results])
+        draws = np.array([r.score1 == r.score2 for r in results])
+        return goals.mean(), goals.var() / len(goals), draws.mean()
+
+    goals_b, var_b, draws_b = summary(batch)
+    goals_s, var_s, draws_s = summary(scalar)
+    # Within four standard errors of the difference
+    assert abs(goals_b - goals_s) < 4 * math.sqrt(var_b + var_s)
+    p = (draws_b + draws_s) / 2
+    assert abs(draws_b - draws_s) < 4 * math.sqrt(p * (1 - p) * (1 / len(batch) + 1 / len(scalar)))
+
+def test_knockout_ties_are_decided():
+    for r in simulate_batch(["NAPOLI"] * 200, ["LILLE"] * 200, seed=5, knockout=True):
+        if r.score1 == r.score2:
+            assert r.penalties is not None and r.penalties[0] != r.penalties[1]
@@ -0,0 +1,29 @@
+import pytest
+
+import futbol_engine
+from futbol_cache import CONSTANT_NAMES, ResultCache, result_key
+
+def nudged(value):
+    if isinstance(value, dict): return dict(value, EXTRA=(0, 1))
+    if isinstance(value, tuple): return tuple(v * 2 for v in value)
+    return value + 1
+
+@pytest.mark.parametrize("name", CONSTANT_NAMES)
+def test_key_changes_with_every_constant(monkeypatch, name):
+    before = result_key("NAPOLI", "LILLE", 1)
+    monkeypatch.setattr(futbol_engine, name, nudged(getattr(futbol_engine, name)))
+    assert result_key("NAPOLI", "LILLE", 1) != before
+
+def test_key_depends_on_fixture():
+    keys = {result_key("NAPOLI", "LILLE", 1), result_key("LILLE", "NAPOLI", 1),
+            result_key("NAPOLI", "LILLE", 2), result_key("NAPOLI", "LILLE", 1, knockout=True)}
+    assert len(keys) == 4
+
+def test_disk_cache_round_trip(tmp_path):
+    first = ResultCache(tmp_path)
+    res = first.match("NAPOLI", "LILLE", 3, knockout=True)
+    assert first.stats()["misses"] == 1
+
+    second = ResultCache(tmp_path)
+    assert second.match("NAPOLI", "LILLE", 3, knockout=True) == res
+    assert second.stats()["disk_hits"] == 1
@@ -0,0 +1,62 @@
+import pytest
+
+from futbol_engine import MatchSimulator, RewindBuffer, simulate_match
+
+PHYSICS_MODES = ["substep", "event", "adaptive"]
+
+# Goal frames (home, away) and total frames for NAPOLI - LILLE. Pins every
+# physics mode bit for bit: a change here means the simulation changed.
+GOLDEN = {
+    ("substep", 0): ([521], [1180, 1207, 941], 2814),
+    ("substep", 1): ([1042, 675], [], 2814),
+    ("substep", 2): ([1090], [], 2710),
+    ("event", 0): ([], [578], 2814),
+    ("event", 1): ([], [610], 2814),
+    ("event", 2): ([862], [1083], 2710),
+    ("adaptive", 0): ([463, 515], [], 2814),
+    ("adaptive", 1): ([624, 477], [163, 229, 252, 299, 1100], 2814),
+    ("adaptive", 2): ([537], [], 2710),
+}
+
+@pytest.mark.parametrize("physics", PHYSICS_MODES)
+def test_same_seed_same_match(physics):
+    first = MatchSimulator("GALATASARAY", "FENERBAHÇE", seed=7, physics=physics).run()
+    again = MatchSimulator("GALATASARAY", "FENERBAHÇE", seed=7, physics=physics).run()
+    assert first == again
+    assert first.seed == 7
+
+def test_seed_changes_match():
+    results = {repr(simulate_match("NAPOLI", "LILLE", seed)) for seed in range(5)}
+    assert len(results) > 1
+
+@pytest.mark.parametrize("physics, seed", sorted(GOLDEN))
+def test_golden_results(physics, seed):
+    res = simulate_match("NAPOLI", "LILLE", seed, physics)
+    goals_1, goals_2, frames = GOLDEN[physics, seed]
+    assert [ev[3] for ev in res.goal_events_1] == goals_1
+    assert [ev[3] for ev in res.goal_events_2] == goals_2
+    assert res.frames == frames
+
+def test_snapshot_restore_replays_the_rest():
+    match = MatchSimulator("NAPOLI", "LILLE", seed=3)
+    for _ in range(1500):
+        match.step()
+    snap = match.snapshot()
+    first = match.run()
+    match.restore(snap)
+    assert match.total_frames == 1500
+    assert match.run() == first
+
+def test_rewind_then_play_on_matches_uninterrupted_run():
+    expected = MatchSimulator("NAPOLI", "LILLE", seed=4, knockout=True).run()
+    match = MatchSimulator("NAPOLI", "LILLE", seed=4, knockout=True)
+    rewind = RewindBuffer()
+    while match.total_frames < 2000:
+        rewind.record(match)
+        match.step()
+    assert rewind.seek(match, 733)
+    assert match.total_frames == 733
+    while match.state != "FULLTIME":
+        rewind.record(match)
+        match.step()
+    assert match.result() == expected
@@ -0,0 +1,22 @@
+import os
+
+from futbol_jobs import chunk_path, create_job, load_results, run_job
+
+FIXTURES = [("NAPOLI", "LILLE", 1), ("AJAX", "EVERTON", 2), ("LILLE", "AJAX", 3),
+            ("EVERTON", "NAPOLI", 4), ("NAPOLI", "AJAX", 5)]
+
+def test_resume_only_runs_missing_chunks(tmp_path):
+    workdir = str(tmp_path)
+    create_job(workdir, FIXTURES, chunk=2)
+    run_job(workdir, workers=1)
+    first = load_results(workdir)
+    assert [(r.home, r.away, r.seed) for r in first] == FIXTURES
+
+    os.remove(chunk_path(workdir, 1))
+    kept = {i: os.stat(chunk_path(workdir, i)).st_mtime_ns for i in (0, 2)}
+    stats = run_job(workdir, workers=1)
+
+    assert stats.start_done == 3
+    assert stats.done == len(FIXTURES)
+    assert {i: os.stat(chunk_path(workdir, i)).st_mtime_ns for i in (0, 2)} == kept
+    assert load_results(workdir) == first
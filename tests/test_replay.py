@@ -0,0 +1,52 @@
+import numpy as np
+
+from futbol_engine import MatchSimulator
+from futbol_replay import EVENT_DTYPE, EVENT_KINDS, ReplayPlayer, ReplayRecorder, frame_dtype, read_replay
+
+def record(path, seed=6, knockout=False):
+    match = MatchSimulator("NAPOLI", "LILLE", seed=seed, knockout=knockout, record_fx=True)
+    rec = ReplayRecorder(match)
+    while match.state != "FULLTIME" or match.cinematic_timer > 0:
+        rec.capture(match.step())
+    rec.save(path)
+    return match, rec
+
+def test_replay_reads_back_what_was_written(tmp_path):
+    path = tmp_path / "match.fbr"
+    match, rec = record(path)
+    header, frames, events = read_replay(path)
+
+    assert header["teams"] == ["NAPOLI", "LILLE"]
+    assert header["seed"] == match.seed
+    assert len(frames) == match.total_frames + 1
+    assert np.array_equal(frames, np.array(rec.frames, dtype=frame_dtype(2)))
+    assert np.array_equal(events, np.array(rec.events, dtype=EVENT_DTYPE))
+
+    logged = [[side, mark, scorer, frame, period]
+              for side, log in enumerate((match.goal_events_1, match.goal_events_2))
+              for mark, _, scorer, frame, period in log]
+    assert sorted(header["goals"]) == sorted(logged)
+    assert sum(events["kind"] == EVENT_KINDS.index("GOAL")) == match.score1 + match.score2
+
+def test_playback_ends_on_the_recorded_result(tmp_path):
+    path = tmp_path / "match.fbr"
+    match, _ = record(path)
+    player = ReplayPlayer(path)
+    while player.total_frames < player.last_frame:
+        player.step()
+    assert (player.score1, player.score2) == (match.score1, match.score2)
+    assert (player.red_cards_1, player.red_cards_2) == (match.red_cards_1, match.red_cards_2)
+    assert [b.x for b in player.balls] == [np.float32(b.x) for b in match.balls]
+
+def test_shootout_is_kept_and_shown_at_full_time(tmp_path):
+    path = tmp_path / "match.fbr"
+    match, _ = record(path, seed=4, knockout=True)     # level after extra time
+    assert match.penalties
+    header, _, _ = read_replay(path)
+    assert tuple(header["penalties"]) == match.penalties
+
+    player = ReplayPlayer(path)
+    assert player.penalties is None
+    player.seek(player.last_frame)
+    assert player.state == "FULLTIME"
+    assert player.penalties == match.penalties
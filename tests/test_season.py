@@ -0,0 +1,41 @@
+import numpy as np
+
+import futbol_season
+from futbol_season import double_round_robin, season_seeds, season_tables, simulate_seasons
+from futbol_teams import LEAGUES
+
+def test_double_round_robin_plays_every_pair_home_and_away():
+    teams = LEAGUES["TR"]
+    fixtures = [pair for rnd in double_round_robin(teams) for pair in rnd]
+    assert len(fixtures) == len(set(fixtures)) == len(teams) * (len(teams) - 1)
+
+def test_tiebreak_does_not_reuse_the_simulation_stream(monkeypatch):
+    seen = {}
+    def all_draws(home_keys, away_keys, seed, engine):
+        seen["seed"] = seed
+        return np.zeros((len(home_keys), 2), dtype=np.int32)
+    # Every match 0-0: points, goal difference and goals are level, so the
+    # table is the coin toss alone
+    monkeypatch.setattr(futbol_season, "play_fixtures", all_draws)
+    seasons = 30
+    out = simulate_seasons("TR", seasons, seed=11)
+
+    teams = LEAGUES["TR"]
+    fixtures = [pair for rnd in double_round_robin(teams) for pair in rnd]
+    level = np.zeros((seasons, len(fixtures), 2), dtype=np.int32)
+    def titles(rng):
+        _, positions = season_tables(teams, fixtures, level, rng)
+        return (positions == 0).sum(axis=0)
+
+    sim_ss, tie_ss = season_seeds(11)
+    assert np.array_equal(seen["seed"].generate_state(4), sim_ss.generate_state(4))
+    assert np.array_equal(out["titles"], titles(np.random.default_rng(tie_ss)))
+    # The simulation's stream (and the raw seed) would give other coin tosses
+    assert not np.array_equal(out["titles"], titles(np.random.default_rng(seen["seed"])))
+    assert not np.array_equal(out["titles"], titles(np.random.default_rng(11)))
+
+def test_season_results_are_reproducible():
+    first = simulate_seasons("TR", 1, seed=3)
+    again = simulate_seasons("TR", 1, seed=3)
+    for key in first:
+        assert np.array_equal(first[key], again[key])